@@ -0,0 +1,38 @@
+"""Per-user daily case counters for auto-generated titles
+
+Revision ID: 007_case_daily_counters
+Revises: 004_uploaded_files_page_index
+Create Date: 2025-10-16 00:00:00.000000
+
+Cases created without a title are named Case-MMDD-N, N being the user's
+case number for the day. Instead of counting the user's cases on every
+create, the repository bumps a (user_id, day) counter with
+    INSERT ... ON CONFLICT (user_id, day) DO UPDATE SET seq = seq + 1 RETURNING seq
+which touches one row however many cases the user has.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '007_case_daily_counters'
+down_revision: Union[str, None] = '004_uploaded_files_page_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create case_daily_counters."""
+    op.create_table(
+        'case_daily_counters',
+        sa.Column('user_id', sa.String(length=255), nullable=False),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('user_id', 'day'),
+    )
+
+
+def downgrade() -> None:
+    """Drop case_daily_counters."""
+    op.drop_table('case_daily_counters')
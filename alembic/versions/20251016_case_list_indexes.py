@@ -0,0 +1,83 @@
+"""Composite indexes for case list queries
+
+Revision ID: 003_case_list_indexes
+Revises: 002_hybrid_schema
+Create Date: 2025-10-16 00:00:00.000000
+
+Case lists are ordered by (created_at, case_id) descending and paged with a
+keyset predicate:
+  - list by user:           WHERE user_id = ? [AND status = ?]
+                              AND (created_at, case_id) < (?, ?)
+                            ORDER BY created_at DESC, case_id DESC LIMIT ?
+  - list by session:        WHERE metadata->>'session_id' = ? AND user_id = ?
+                              [AND (created_at, case_id) < (?, ?)]
+                            ORDER BY created_at DESC, case_id DESC LIMIT ?
+                            (PostgreSQL only)
+The single-column indexes from 002 only cover the filter, so the database
+still sorts every matching row before applying LIMIT. These composite
+indexes put the equality columns first and the sort columns last, so every
+page is an index range scan of page_size rows, ties included.
+
+On PostgreSQL the indexes are built CONCURRENTLY, outside the migration
+transaction, so writes to cases are not blocked while they build.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003_case_list_indexes'
+down_revision: Union[str, None] = '002_hybrid_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite (filter, sort) indexes on cases."""
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index(
+            'idx_cases_user_created_id',
+            'cases',
+            ['user_id', sa.text('created_at DESC'), sa.text('case_id DESC')],
+        )
+        op.create_index(
+            'idx_cases_user_status_created_id',
+            'cases',
+            ['user_id', 'status', sa.text('created_at DESC'), sa.text('case_id DESC')],
+        )
+        op.drop_index('idx_cases_user_id', table_name='cases')
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_user_created_id ON cases "
+            "(user_id, created_at DESC, case_id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_user_status_created_id ON cases "
+            "(user_id, status, created_at DESC, case_id DESC)"
+        )
+        # The session link lives in the metadata JSON column; the ->> expression
+        # index matches the predicate used by the hybrid repository
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_session_user_created_id ON cases "
+            "((metadata->>'session_id'), user_id, created_at DESC, case_id DESC)"
+        )
+        # Superseded by the composite indexes above (user_id is their prefix)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_user_id")
+
+
+def downgrade() -> None:
+    """Restore single-column user index and drop composite indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index('idx_cases_user_id', 'cases', ['user_id'])
+        op.drop_index('idx_cases_user_status_created_id', table_name='cases')
+        op.drop_index('idx_cases_user_created_id', table_name='cases')
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_user_id ON cases (user_id)")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_session_user_created_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_user_status_created_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_user_created_id")
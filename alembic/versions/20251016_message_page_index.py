@@ -0,0 +1,50 @@
+"""Composite index for paging a case's messages
+
+Revision ID: 012_message_page_index
+Revises: 010_widen_child_ids
+Create Date: 2025-10-16 00:00:00.000000
+
+Messages are read a page at a time in conversation order:
+    WHERE case_id = ? ORDER BY timestamp, message_id LIMIT ? OFFSET ?
+The separate case_id and timestamp indexes from 002 make PostgreSQL fetch
+every message of the case and sort them. An index on
+(case_id, timestamp, message_id) returns them already ordered. It also
+serves plain case_id lookups, so idx_case_messages_case_id is dropped. The
+indexes are built and dropped CONCURRENTLY so message inserts are not
+blocked.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '012_message_page_index'
+down_revision: Union[str, None] = '010_widen_child_ids'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the case_id message index with a (case_id, timestamp, message_id) index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_case_messages_case_timestamp "
+            "ON case_messages (case_id, timestamp, message_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_case_messages_case_id")
+
+
+def downgrade() -> None:
+    """Restore the single-column case_id message index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_case_messages_case_id "
+            "ON case_messages (case_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_case_messages_case_timestamp")
@@ -0,0 +1,57 @@
+"""jsonb_path_ops GIN indexes on case and message metadata
+
+Revision ID: 008_metadata_path_ops_indexes
+Revises: 007_case_daily_counters
+Create Date: 2025-10-16 00:00:00.000000
+
+Metadata lookups are containment queries:
+    WHERE metadata @> '{"environment": "prod"}'
+A GIN index with the jsonb_path_ops operator class indexes a hash per path
+instead of every key and value separately, so it is markedly smaller than
+the default jsonb_ops index from 002 and faster for @>. It does not serve
+the key-existence operators (?, ?|, ?&), which nothing here uses.
+
+case_messages.metadata had no index; it gets the same kind. The indexes are
+built CONCURRENTLY, outside the migration transaction, so writes to cases
+and case_messages are not blocked while they build.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '008_metadata_path_ops_indexes'
+down_revision: Union[str, None] = '007_case_daily_counters'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the cases.metadata GIN index and index case_messages.metadata."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_metadata_path_ops ON cases "
+            "USING gin (metadata jsonb_path_ops)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_metadata_gin")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_case_messages_metadata_path_ops "
+            "ON case_messages USING gin (metadata jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Restore the default-operator-class GIN index on cases.metadata."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_case_messages_metadata_path_ops")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_metadata_gin ON cases "
+            "USING gin (metadata)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_metadata_path_ops")
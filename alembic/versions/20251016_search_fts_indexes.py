@@ -0,0 +1,52 @@
+"""Full-text indexes matching the case search predicates
+
+Revision ID: 009_search_fts_indexes
+Revises: 008_metadata_path_ops_indexes
+Create Date: 2025-10-16 00:00:00.000000
+
+Case search matches a query against the case text and its evidence:
+    to_tsvector('english', title || ' ' || COALESCE(consulting->>'initial_description', ''))
+        @@ plainto_tsquery('english', ?)
+    OR EXISTS (SELECT 1 FROM evidence e WHERE e.case_id = c.case_id
+               AND to_tsvector('english', e.preprocessed_content) @@ plainto_tsquery('english', ?))
+Neither expression was indexed, so every search scanned all cases and
+re-parsed their evidence text. GIN indexes on exactly these expressions let
+PostgreSQL answer both sides from the index (the predicates must stay
+textually identical to the indexed expressions).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '009_search_fts_indexes'
+down_revision: Union[str, None] = '008_metadata_path_ops_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create expression GIN indexes for case and evidence search."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cases_search_fts ON cases USING gin "
+            "(to_tsvector('english', title || ' ' || "
+            "COALESCE(consulting->>'initial_description', '')))"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_evidence_content_fts ON evidence "
+            "USING gin (to_tsvector('english', preprocessed_content))"
+        )
+
+
+def downgrade() -> None:
+    """Drop the search indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_evidence_content_fts")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_cases_search_fts")
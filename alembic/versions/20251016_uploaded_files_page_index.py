@@ -0,0 +1,35 @@
+"""Composite index for paging a case's uploaded files
+
+Revision ID: 004_uploaded_files_page_index
+Revises: 003_case_list_indexes
+Create Date: 2025-10-16 00:00:00.000000
+
+GET /cases/{case_id}/uploaded-files pages with
+    WHERE case_id = ? ORDER BY uploaded_at, file_id LIMIT ? OFFSET ?
+(case ownership is checked by joining cases on its primary key). A
+(case_id, uploaded_at) index serves the filter and the order together, so
+the page is read in index order instead of sorting every file of the case.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '004_uploaded_files_page_index'
+down_revision: Union[str, None] = '003_case_list_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the single-column case_id index with (case_id, uploaded_at)."""
+    op.create_index(
+        'idx_uploaded_files_case_uploaded', 'uploaded_files', ['case_id', 'uploaded_at']
+    )
+    op.drop_index('idx_uploaded_files_case_id', table_name='uploaded_files')
+
+
+def downgrade() -> None:
+    """Restore the single-column case_id index."""
+    op.create_index('idx_uploaded_files_case_id', 'uploaded_files', ['case_id'])
+    op.drop_index('idx_uploaded_files_case_uploaded', table_name='uploaded_files')
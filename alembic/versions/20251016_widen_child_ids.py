@@ -0,0 +1,56 @@
+"""Widen evidence, hypothesis and solution ID columns
+
+Revision ID: 010_widen_child_ids
+Revises: 009_search_fts_indexes
+Create Date: 2025-10-16 00:00:00.000000
+
+Child IDs are generated as a prefix plus a 12-character time-ordered ID
+(e.g. "evidence_" + 12 = 21 characters), which does not fit the
+varchar(15) columns from 002. Widening a varchar in PostgreSQL only
+changes the catalog; the tables and their primary-key indexes are not
+rewritten. SQLite does not enforce varchar lengths, so it is skipped.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010_widen_child_ids'
+down_revision: Union[str, None] = '009_search_fts_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_ID_COLUMNS = [
+    ('evidence', 'evidence_id'),
+    ('hypotheses', 'hypothesis_id'),
+    ('solutions', 'solution_id'),
+]
+
+
+def upgrade() -> None:
+    """Widen the child ID columns to 32 characters."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, column in _ID_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.String(length=15),
+            type_=sa.String(length=32),
+            existing_nullable=False,
+        )
+
+
+def downgrade() -> None:
+    """Restore the 15-character ID columns (fails if longer IDs exist)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    for table, column in _ID_COLUMNS:
+        op.alter_column(
+            table, column,
+            existing_type=sa.String(length=32),
+            type_=sa.String(length=15),
+            existing_nullable=False,
+        )
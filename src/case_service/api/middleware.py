@@ -0,0 +1,64 @@
+"""ASGI middleware for gateway-issued identity headers."""
+
+from typing import Iterable
+
+from fastapi.responses import ORJSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+USER_ID_REQUIRED_DETAIL = "X-User-ID header required (should be added by API Gateway)"
+
+
+class UserIdMiddleware:
+    """Validate the X-User-ID header once per request and store it in the scope.
+
+    The API Gateway validates JWTs and sets X-User-* headers after stripping
+    client-provided ones, so the only check needed here is presence. Requests
+    under ``path_prefix`` without the header get a 401 before routing; the
+    value is published as ``scope["user_id"]`` for the ``get_user_id``
+    dependency. CORS preflight (OPTIONS) and ``exempt_paths`` pass through.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        path_prefix: str = "/api/v1/cases",
+        exempt_paths: Iterable[str] = ("/api/v1/cases/health",),
+    ):
+        """Initialize middleware.
+
+        Args:
+            app: Downstream ASGI application
+            path_prefix: Only requests under this path require the header
+            exempt_paths: Public paths under the prefix that skip the check
+        """
+        self.app = app
+        self.path_prefix = path_prefix
+        self.exempt_paths = frozenset(exempt_paths)
+
+    def _requires_user_id(self, path: str) -> bool:
+        """Whether path is under path_prefix (as a whole segment) and not exempt."""
+        under_prefix = path == self.path_prefix or path.startswith(self.path_prefix + "/")
+        return under_prefix and path not in self.exempt_paths
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] == "OPTIONS"
+            or not self._requires_user_id(scope["path"])
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        user_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-user-id":
+                user_id = value.decode("latin-1")
+                break
+
+        if not user_id:
+            response = ORJSONResponse(status_code=401, content={"detail": USER_ID_REQUIRED_DETAIL})
+            await response(scope, receive, send)
+            return
+
+        scope["user_id"] = user_id
+        await self.app(scope, receive, send)
@@ -0,0 +1,1515 @@
+"""Long-form OpenAPI descriptions for the case routes.
+
+Kept out of cases.py so the route module stays readable, and imported only
+when API docs are enabled (``settings.api_docs_enabled``): with docs off,
+workers never load these strings.
+"""
+
+GET_CASE_SERVICE_HEALTH = """
+Returns health status of the case management subsystem.
+
+**Workflow**:
+1. Checks case persistence system connectivity
+2. Returns service status and feature flags
+3. No authentication required (health endpoints are public)
+
+**Response Example**:
+```json
+{
+  "service": "case_management",
+  "status": "healthy",
+  "timestamp": "2025-11-19T10:30:00Z",
+  "features": {
+    "case_persistence": true,
+    "case_sharing": true,
+    "conversation_history": true
+  }
+}
+```
+
+**Storage**: No database access (lightweight check)
+**Rate Limits**: None
+**Authorization**: None required (public endpoint)
+    """
+
+CREATE_CASE = """
+Creates a new troubleshooting case for the authenticated user.
+
+**Workflow**:
+1. Case created in 'consulting' status with auto-generated ID (case_XXXX format)
+2. Title auto-generated if not provided (Case-MMDD-N format)
+3. User can specify priority, category, and metadata
+
+**Request Body Example**:
+```json
+{
+  "title": "Redis connection timeouts in production",
+  "description": "Intermittent timeouts on Redis cluster during peak hours",
+  "priority": "high",
+  "category": "performance",
+  "metadata": {"environment": "production", "cluster": "redis-prod-1"}
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_a1b2c3d4e5f6",
+  "owner_id": "user_123",
+  "title": "Redis connection timeouts in production",
+  "description": "Intermittent timeouts on Redis cluster during peak hours",
+  "status": "consulting",
+  "priority": "high",
+  "category": "performance",
+  "metadata": {"environment": "production", "cluster": "redis-prod-1"},
+  "created_at": "2025-11-19T10:30:00Z",
+  "updated_at": "2025-11-19T10:30:00Z",
+  "resolved_at": null,
+  "message_count": 0
+}
+```
+
+**Storage**: SQLite database (fm_cases.db) with user_id indexing
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header from fm-api-gateway
+**User Isolation**: Cases are strictly scoped to the creating user
+    """
+
+GET_CASE = """
+Retrieves a single case by its unique case_id.
+
+**Access Control**:
+- Users can only access their own cases
+- Attempting to access another user's case returns 404 (not 403) to prevent enumeration
+- Case ID must be exact match (case-sensitive)
+
+**Request Example**:
+```
+GET /api/v1/cases/case_a1b2c3d4e5f6
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_a1b2c3d4e5f6",
+  "user_id": "user_123",
+  "session_id": "session_abc123",
+  "title": "Redis connection timeouts in production",
+  "description": "Intermittent timeouts on Redis cluster during peak hours",
+  "status": "investigating",
+  "severity": "high",
+  "category": "performance",
+  "metadata": {"environment": "production"},
+  "tags": ["redis", "timeout"],
+  "created_at": "2025-11-19T10:30:00Z",
+  "updated_at": "2025-11-19T11:15:00Z",
+  "resolved_at": null
+}
+```
+
+**Storage**: Retrieved from SQLite with user_id filter
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Enforced at database query level
+    """
+
+HEAD_CASE = """
+Checks whether a case exists for the authenticated user, without returning it.
+
+**Workflow**:
+1. Probes the case by primary key and owner (no case data is loaded)
+2. Returns 200 with an empty body if found, 404 otherwise
+
+**Request Example**:
+```
+HEAD /api/v1/cases/case_a1b2c3d4e5f6
+Headers:
+  X-User-ID: user_123
+```
+
+**Use Cases**:
+- Validating a case link before navigating to it
+- Cheap existence checks from other services
+
+**Storage**: Single indexed existence query
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Cases owned by other users report 404 (prevents enumeration)
+    """
+
+UPDATE_CASE = """
+Updates an existing case with new information. All fields are optional.
+
+**Updatable Fields**:
+- `title`: Case title (max 200 characters)
+- `description`: Detailed description
+- `status`: Case status (consulting/investigating/resolved/closed)
+- `priority`: Priority level (low/medium/high/critical)
+- `category`: Category (performance/error/configuration/infrastructure/security/other)
+- `metadata`: Custom metadata dictionary (merged with existing)
+
+**Request Example**:
+```json
+{
+  "status": "investigating",
+  "priority": "critical",
+  "description": "Issue escalated - affecting 50% of users",
+  "metadata": {"escalated": true, "affected_users": 500}
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_a1b2c3d4e5f6",
+  "status": "investigating",
+  "priority": "critical",
+  "updated_at": "2025-11-19T12:30:00Z",
+  ...
+}
+```
+
+**Behavior**:
+- Only provided fields are updated (partial updates supported)
+- `updated_at` timestamp automatically updated
+- `resolved_at` set automatically when status changes to 'resolved'
+- Users can only update their own cases
+
+**Storage**: SQLite update with optimistic locking
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Update only succeeds if case belongs to user
+    """
+
+DELETE_CASE = """
+Permanently deletes a case from the database.
+
+**WARNING**: This operation is irreversible. The case and all associated data will be permanently deleted.
+
+**Request Example**:
+```
+DELETE /api/v1/cases/case_a1b2c3d4e5f6
+Headers:
+  X-User-ID: user_123
+```
+
+**Response**:
+```
+204 No Content (success, no body returned)
+404 Not Found (case doesn't exist or access denied)
+```
+
+**Behavior**:
+- Case is permanently removed from database
+- Session associations are not affected (sessions remain)
+- Users can only delete their own cases
+- No soft-delete or archival (use status='archived' instead if you want to preserve data)
+
+**Recommended Alternative**: Consider updating status to 'archived' or 'closed' instead of deletion to preserve historical data:
+```
+PUT /api/v1/cases/{case_id}
+{"status": "archived"}
+```
+
+**Storage**: Hard delete from SQLite
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Delete only succeeds if case belongs to user
+    """
+
+GET_CASE_UI = """
+Returns phase-adaptive UI-optimized case data in a single response.
+
+**Workflow**:
+1. Retrieves case by ID with user ownership validation
+2. Transforms case data into UI-friendly format
+3. Includes phase-specific UI hints and state
+
+**Use Case**: Frontend applications can fetch all required UI state in a single call,
+reducing round-trips and improving perceived performance.
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/ui
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "title": "Redis connection timeouts",
+  "description": "Intermittent timeouts on Redis cluster",
+  "status": "investigating",
+  "priority": "high",
+  "created_at": "2025-11-19T10:30:00Z",
+  "updated_at": "2025-11-19T11:15:00Z"
+}
+```
+
+**Storage**: SQLite read with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can access UI data
+    """
+
+GET_CASE_OVERVIEW = """
+Returns the case together with its first page of uploaded files, query
+history and analytics in a single response.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Loads the case once
+3. Derives the file page, query history and metrics from the loaded case
+
+Use this instead of calling `GET /{case_id}`, `/uploaded-files`, `/queries`
+and `/analytics` separately when opening a case.
+
+**Query Parameters**:
+- files_limit: Maximum uploaded files to include (default: 20, max: 100)
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/overview?files_limit=20
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case": {
+    "case_id": "case_abc123",
+    "title": "Database connection timeout",
+    "status": "investigating"
+  },
+  "files_page": {
+    "files": [],
+    "total": 0,
+    "limit": 20,
+    "offset": 0
+  },
+  "queries": [],
+  "analytics": {
+    "status": "investigating",
+    "message_count": 4,
+    "participant_count": 1,
+    "evidence_count": 2,
+    "hypotheses_count": 1,
+    "resolution_time_minutes": null
+  }
+}
+```
+
+**Storage**: Single case load
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can view the overview
+    """
+
+GENERATE_CASE_TITLE = """
+Generates or retrieves a concise, case-specific title based on case content.
+
+**Workflow**:
+1. If case has meaningful existing title and force=false, returns existing title
+2. Otherwise, generates new title from case messages and metadata
+3. Updates case with generated title
+
+**Query Parameters**:
+- `force` (default: false): Force overwrite of existing meaningful title
+
+**Request Body** (optional):
+```json
+{
+  "max_words": 8,
+  "hint": "focus on the root cause"
+}
+```
+
+**Response Example**:
+```json
+{
+  "title": "Redis Connection Timeout Investigation",
+  "case_id": "case_abc123",
+  "source": "generated",
+  "generated": true
+}
+```
+
+**Title Generation Rules**:
+- Default titles ("New Case", "Untitled") are always regenerated
+- Titles with < 3 words are considered non-meaningful
+- max_words must be between 3-12 (default: 8)
+
+**Storage**: SQLite read/write with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can generate titles
+    """
+
+LIST_CASES = """
+Retrieves a paginated list of cases for the authenticated user.
+
+**Query Parameters**:
+- `status` (optional): Filter by status (consulting/investigating/resolved/closed)
+- `cursor` (optional): `next_cursor` from the previous page; takes precedence over `page`
+- `page` (default: 1): Page number (1-indexed)
+- `page_size` (default: 50, max: 100): Number of cases per page
+
+**Request Example**:
+```
+GET /api/v1/cases?status=investigating&page=1&page_size=20
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "cases": [
+    {
+      "case_id": "case_a1b2c3d4e5f6",
+      "title": "Redis timeout issue",
+      "status": "investigating",
+      "priority": "high",
+      "created_at": "2025-11-19T10:30:00Z",
+      ...
+    },
+    {
+      "case_id": "case_x7y8z9a0b1c2",
+      "title": "API latency spike",
+      "status": "investigating",
+      "priority": "medium",
+      "created_at": "2025-11-18T14:20:00Z",
+      ...
+    }
+  ],
+  "total": 15,
+  "page": 1,
+  "page_size": 20,
+  "next_cursor": null
+}
+```
+
+**Pagination Calculation**:
+- `total`: Total number of cases matching filter
+- `total_pages`: ceil(total / page_size)
+- Use `page` and `page_size` to navigate through results
+- `next_cursor`: Pass as `cursor` to fetch the next page at constant cost
+  regardless of depth; null when the page is the last one
+
+**Sorting**: Cases returned in reverse chronological order (newest first)
+
+**Storage**: Indexed query on user_id and status
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only returns cases belonging to authenticated user
+    """
+
+GET_CASES_FOR_SESSION = """
+Retrieves all cases associated with a specific investigation session.
+
+**Use Case**: When viewing an investigation session from fm-session-service, this endpoint shows all related troubleshooting cases.
+
+**Query Parameters**:
+- `cursor` (optional): `next_cursor` from the previous page; takes precedence over `page`
+- `page` (default: 1): Page number (1-indexed)
+- `page_size` (default: 50, max: 100): Number of cases per page
+
+**Request Example**:
+```
+GET /api/v1/cases/session/session_abc123?page=1&page_size=10
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "cases": [
+    {
+      "case_id": "case_a1b2c3d4e5f6",
+      "session_id": "session_abc123",
+      "title": "Database performance investigation",
+      "status": "investigating",
+      ...
+    }
+  ],
+  "total": 3,
+  "page": 1,
+  "page_size": 10
+}
+```
+
+**Access Control**:
+- Returns only cases that belong to the authenticated user
+- Even if a session has cases from multiple users, only the current user's cases are returned
+- This prevents cross-user data leakage in shared session contexts
+
+**Cross-Service Integration**:
+- `session_id` comes from fm-session-service
+- Cases are linked by the `session_id` key in their metadata (set on create or update)
+- No validation that session exists (loose coupling)
+- Session access control handled by fm-session-service
+
+**Storage**: Single paginated query on session_id and user_id (total via window count)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Filtered to authenticated user's cases only
+    """
+
+UPDATE_CASE_STATUS = """
+Updates only the status field of a case (convenience endpoint).
+
+**Status Transitions**:
+```
+active → investigating → resolved
+         ↓
+      archived
+         ↓
+      closed
+```
+
+**Common Workflows**:
+- **Start Investigation**: active → investigating
+- **Resolve Issue**: investigating → resolved
+- **Archive Old Case**: resolved → archived
+- **Close Without Resolution**: investigating → closed
+
+**Request Example**:
+```json
+{
+  "status": "resolved"
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_a1b2c3d4e5f6",
+  "status": "resolved",
+  "resolved_at": "2025-11-19T15:30:00Z",
+  "updated_at": "2025-11-19T15:30:00Z",
+  ...
+}
+```
+
+**Automatic Timestamp Handling**:
+- `updated_at`: Always updated to current timestamp
+- `resolved_at`: Automatically set when status changes to 'resolved'
+- `resolved_at`: Cleared if status changes away from 'resolved'
+
+**Use Cases**:
+- Workflow automation (e.g., auto-resolve when all tests pass)
+- Status boards and dashboards
+- Case lifecycle tracking
+
+**Alternative**: You can also update status via `PUT /api/v1/cases/{case_id}` with `{"status": "resolved"}`, but this endpoint provides clearer semantics for status-only updates.
+
+**Storage**: SQLite update with timestamp management
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Update only succeeds if case belongs to user
+    """
+
+LIST_CASE_DATA = """
+Lists all data files and artifacts associated with a case.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves paginated list of data records
+3. Returns data metadata (not file contents)
+
+**Query Parameters**:
+- `limit` (default: 50, max: 200): Maximum number of items to return
+- `offset` (default: 0): Number of items to skip for pagination
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/data?limit=20&offset=0
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "data": [
+    {
+      "data_id": "data_xyz789",
+      "filename": "error_logs.txt",
+      "data_type": "log_file",
+      "size_bytes": 15360,
+      "upload_timestamp": "2025-11-19T10:30:00Z"
+    }
+  ],
+  "total": 5,
+  "limit": 20,
+  "offset": 0
+}
+```
+
+**Storage**: SQLite query with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can list data
+    """
+
+GET_CASE_DATA = """
+Retrieves details for a specific data file attached to a case.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves data record by ID
+3. Returns data metadata and processing status
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/data/data_xyz789
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "data_id": "data_xyz789",
+  "case_id": "case_abc123",
+  "filename": "error_logs.txt",
+  "description": "Application error logs from production",
+  "data_type": "log_file",
+  "size_bytes": 15360,
+  "upload_timestamp": "2025-11-19T10:30:00Z",
+  "processing_status": "completed"
+}
+```
+
+**Data Types**:
+- `log_file`: Application or system logs
+- `config_file`: Configuration files
+- `screenshot`: UI screenshots
+- `trace`: Distributed traces or stack traces
+- `metrics`: Metrics data exports
+- `other`: Uncategorized data
+
+**Storage**: SQLite query with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can access data
+    """
+
+DELETE_CASE_DATA = """
+Permanently deletes a data file from a case.
+
+**WARNING**: This operation is irreversible. The data file and all associated
+metadata will be permanently deleted.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Deletes data record and associated file storage
+3. Returns 204 No Content on success
+
+**Request Example**:
+```
+DELETE /api/v1/cases/case_abc123/data/data_xyz789
+Headers:
+  X-User-ID: user_123
+```
+
+**Response**:
+```
+204 No Content (success, no body returned)
+404 Not Found (case or data doesn't exist)
+```
+
+**Behavior**:
+- Data record is permanently removed
+- Associated file in storage is deleted
+- Operation is idempotent (deleting non-existent data returns 404)
+
+**Storage**: SQLite delete with file storage cleanup
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can delete data
+    """
+
+ADD_CASE_DATA = """
+Adds evidence or data files to a case for investigation.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Processes and stores the evidence data
+3. Returns updated case with new evidence attached
+
+**Request Body Example**:
+```json
+{
+  "type": "log_file",
+  "filename": "application.log",
+  "content": "2025-11-19 10:30:00 ERROR Connection timeout...",
+  "metadata": {
+    "source": "production-server-01",
+    "log_level": "ERROR"
+  }
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "user_id": "user_123",
+  "title": "Connection timeout investigation",
+  "status": "investigating",
+  ...
+}
+```
+
+**Evidence Types**:
+- `log_file`: Application or system logs
+- `config_file`: Configuration files
+- `screenshot`: UI screenshots
+- `trace`: Stack traces or distributed traces
+- `metrics`: Performance metrics
+
+**Storage**: SQLite with file storage for large content
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can add evidence
+    """
+
+ADD_CASE_DATA_BATCH = """
+Adds up to 500 evidence items to a case in a single request and write.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Appends all items in request order
+3. Persists them in one transaction (one batched insert)
+4. Returns updated case
+
+**Request Body Example**:
+```json
+{
+  "items": [
+    {"content": "2025-11-19 10:30:00 ERROR Connection timeout...", "source": "user", "category": "observation"},
+    {"content": "p99 latency 2.4s on /checkout", "source": "monitoring", "category": "metric"}
+  ]
+}
+```
+
+**Response**: Same as `POST /{case_id}/data`
+
+**Limits**: 1-500 items per request (422 otherwise)
+**Storage**: Single transaction with batched evidence insert
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can add evidence
+    """
+
+GET_CASE_EVIDENCE = """
+Retrieves a specific evidence item from a case by its ID.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves evidence by ID from case
+3. Returns evidence details and content
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/evidence/ev_xyz789
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "evidence_id": "ev_xyz789",
+  "case_id": "case_abc123",
+  "type": "log_file",
+  "filename": "error.log",
+  "content": "2025-11-19 ERROR: Connection refused...",
+  "created_at": "2025-11-19T10:30:00Z",
+  "metadata": {"source": "production"}
+}
+```
+
+**Storage**: SQLite query with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can access evidence
+    """
+
+GET_UPLOADED_FILES = """
+Lists all files uploaded to a case during investigation.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves one page of uploaded files
+3. Returns file metadata, processing status and the total file count
+
+**Query Parameters**:
+- limit: Maximum files to return (default: 100, max: 500)
+- offset: Number of files to skip (default: 0)
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/uploaded-files?limit=100&offset=0
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "files": [
+    {
+      "file_id": "file_xyz789",
+      "filename": "screenshot.png",
+      "content_type": "image/png",
+      "size_bytes": 102400,
+      "upload_timestamp": "2025-11-19T10:30:00Z",
+      "status": "processed"
+    }
+  ],
+  "total": 3,
+  "limit": 100,
+  "offset": 0
+}
+```
+
+**Storage**: SQLite query with file storage references
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can list files
+    """
+
+GET_UPLOADED_FILE_DETAILS = """
+Retrieves detailed information for a specific uploaded file.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves file metadata by ID
+3. Returns file details including derived evidence
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/uploaded-files/file_xyz789
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "file_id": "file_xyz789",
+  "case_id": "case_abc123",
+  "filename": "error_screenshot.png",
+  "content_type": "image/png",
+  "size_bytes": 102400,
+  "upload_timestamp": "2025-11-19T10:30:00Z",
+  "status": "processed",
+  "derived_evidence": [
+    {"type": "text_extraction", "content": "Error: Connection refused"}
+  ]
+}
+```
+
+**File Processing Status**:
+- `pending`: File uploaded, awaiting processing
+- `processing`: File being analyzed
+- `processed`: Processing complete, evidence extracted
+- `failed`: Processing failed
+
+**Storage**: SQLite query with file storage reference
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can access file details
+    """
+
+CLOSE_CASE = """
+Closes a case, marking the investigation as complete.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Updates case status to 'closed'
+3. Records closure metadata (resolution, notes)
+4. Returns updated case
+
+**Request Body** (optional):
+```json
+{
+  "resolution": "resolved",
+  "resolution_notes": "Root cause identified as misconfigured timeout",
+  "resolved_by": "Increased connection timeout to 30s"
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "status": "closed",
+  "resolved_at": "2025-11-19T15:30:00Z",
+  ...
+}
+```
+
+**Closure Types**:
+- `resolved`: Issue successfully resolved
+- `not_reproducible`: Could not reproduce the issue
+- `duplicate`: Duplicate of another case
+- `wont_fix`: Issue acknowledged but won't be fixed
+- `invalid`: Not a valid issue
+
+**Storage**: SQLite update with timestamp management
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can close case
+    """
+
+SEARCH_CASES = """
+Searches cases with flexible filtering criteria.
+
+**Workflow**:
+1. Validates search parameters
+2. Executes search query with user isolation
+3. Returns paginated results
+
+**Request Body Example**:
+```json
+{
+  "query": "connection timeout",
+  "status": ["consulting", "investigating"],
+  "severity": ["high", "critical"],
+  "category": "performance",
+  "date_from": "2025-11-01T00:00:00Z",
+  "date_to": "2025-11-30T23:59:59Z",
+  "tags": ["redis", "database"],
+  "page": 1,
+  "page_size": 20
+}
+```
+
+**Response Example**:
+```json
+{
+  "cases": [...],
+  "total": 15,
+  "page": 1,
+  "page_size": 20
+}
+```
+
+**Search Fields**:
+- `query`: Full-text search in title and description
+- `status`: Filter by status (array of consulting, investigating, resolved or
+  closed; any other value is rejected with 422)
+- `severity`: Filter by severity (array)
+- `category`: Filter by category
+- `date_from`/`date_to`: Date range filter
+- `tags`: Filter by tags (AND logic)
+
+**Storage**: SQLite full-text search with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only searches user's own cases
+    """
+
+ADD_HYPOTHESIS = """
+Adds a new hypothesis to an investigation case for tracking potential root causes.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Creates hypothesis with initial status
+3. Returns hypothesis ID and updated count
+
+**Request Body Example**:
+```json
+{
+  "title": "Redis connection pool exhaustion",
+  "description": "High load causing connection pool to be exhausted",
+  "confidence": 0.7,
+  "evidence": ["Connection timeout errors in logs", "Pool size at max"],
+  "suggested_tests": ["Increase pool size", "Check connection leaks"]
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "hypothesis": {...},
+  "total_hypotheses": 3
+}
+```
+
+**Hypothesis Status Values**:
+- `proposed`: Initial state
+- `testing`: Under investigation
+- `confirmed`: Validated as root cause
+- `rejected`: Ruled out
+- `deferred`: Put on hold
+
+**Storage**: SQLite with JSONB for hypothesis data
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can add hypotheses
+    """
+
+UPDATE_HYPOTHESIS = """
+Updates an existing hypothesis with new status, confidence, or evidence.
+
+**Workflow**:
+1. Validates case and hypothesis exist
+2. Applies partial updates to hypothesis
+3. Returns updated hypothesis
+
+**Request Body Example**:
+```json
+{
+  "status": "confirmed",
+  "confidence": 0.95,
+  "confirmation_evidence": "Load test confirmed pool exhaustion under high load",
+  "resolution": "Increased pool size from 10 to 50"
+}
+```
+
+**Response Example**:
+```json
+{
+  "hypothesis_id": "hyp_xyz789",
+  "case_id": "case_abc123",
+  "title": "Redis connection pool exhaustion",
+  "status": "confirmed",
+  "confidence": 0.95,
+  "updated_at": "2025-11-19T15:30:00Z"
+}
+```
+
+**Updatable Fields**:
+- `status`: Hypothesis status
+- `confidence`: Confidence score (0.0-1.0)
+- `evidence`: Additional evidence array
+- `confirmation_evidence`: Evidence confirming/rejecting
+- `resolution`: How the issue was resolved
+
+**Storage**: SQLite update with JSONB merge
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can update hypotheses
+    """
+
+SUBMIT_CASE_QUERY = """
+Submits a user message or query to the case investigation.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Stores query in case history
+3. Returns query acknowledgment
+
+**Request Body Example**:
+```json
+{
+  "message": "What are the common causes of Redis connection timeouts?",
+  "context": {
+    "current_focus": "connection_pool"
+  }
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "message": "What are the common causes...",
+  "status": "received",
+  "timestamp": "2025-11-19T10:30:00Z"
+}
+```
+
+**Query Types**:
+- Investigation questions
+- Troubleshooting commands
+- Evidence requests
+- Hypothesis proposals
+
+**Storage**: SQLite with message history
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can submit queries
+    """
+
+GET_CASE_QUERIES = """
+Retrieves the history of user queries submitted to this case.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves query history
+3. Returns chronologically ordered queries
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/queries
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "queries": [
+    {
+      "query_id": "q_001",
+      "message": "What causes connection timeouts?",
+      "timestamp": "2025-11-19T10:30:00Z",
+      "response_status": "answered"
+    }
+  ],
+  "total": 5
+}
+```
+
+**Storage**: SQLite query with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can view query history
+    """
+
+GET_CASE_MESSAGES = """
+Retrieves conversation messages for a case with pagination support.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves paginated message history
+3. Returns messages with metadata
+
+**Query Parameters**:
+- `limit` (default: 50, max: 100): Maximum messages to return
+- `offset` (default: 0): Pagination offset
+- `include_debug` (default: false): Include debug metadata
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/messages?limit=20&offset=0
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "messages": [
+    {
+      "message_id": "msg_001",
+      "role": "user",
+      "content": "I'm seeing connection timeouts",
+      "timestamp": "2025-11-19T10:30:00Z"
+    },
+    {
+      "message_id": "msg_002",
+      "role": "assistant",
+      "content": "Let me help investigate...",
+      "timestamp": "2025-11-19T10:30:05Z"
+    }
+  ],
+  "total_count": 50,
+  "retrieved_count": 20,
+  "limit": 20,
+  "offset": 0
+}
+```
+
+**Message Roles**:
+- `user`: User messages
+- `assistant`: AI assistant responses
+- `system`: System notifications
+
+**Storage**: SQLite with message pagination
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can view messages
+    """
+
+GET_CASE_ANALYTICS = """
+Returns analytics and metrics for a specific case.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Calculates case metrics
+3. Returns analytics summary
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/analytics
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "message_count": 25,
+  "participant_count": 1,
+  "resolution_time_minutes": 120,
+  "status": "resolved",
+  "hypotheses_count": 3,
+  "evidence_count": 5,
+  "first_response_time_seconds": 15
+}
+```
+
+**Metrics Included**:
+- `message_count`: Total messages in case
+- `participant_count`: Number of participants
+- `resolution_time_minutes`: Time to resolution (if resolved)
+- `hypotheses_count`: Number of hypotheses generated
+- `evidence_count`: Number of evidence items attached
+
+**Storage**: SQLite aggregation queries
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can view analytics
+    """
+
+GET_REPORT_RECOMMENDATIONS = """
+Returns intelligent recommendations for which reports to generate for a case.
+
+**Workflow**:
+1. Analyzes case content and status
+2. Determines applicable report types
+3. Returns prioritized recommendations
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/report-recommendations
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "available_reports": ["incident_report", "post_mortem", "runbook"],
+  "recommended_reports": [
+    {
+      "type": "post_mortem",
+      "reason": "Case resolved with root cause identified",
+      "priority": "high"
+    }
+  ],
+  "similar_runbooks": [
+    {"id": "rb_001", "title": "Redis Connection Issues", "similarity": 0.85}
+  ]
+}
+```
+
+**Report Types**:
+- `incident_report`: Standard incident documentation
+- `post_mortem`: Root cause analysis document
+- `runbook`: Operational runbook for similar issues
+- `timeline`: Event timeline summary
+
+**Storage**: SQLite with vector similarity search
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can get recommendations
+    """
+
+GENERATE_CASE_REPORTS = """
+Generates documentation reports for a case.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Queues report generation for requested types
+3. Returns report IDs for tracking
+
+**Request Body Example**:
+```json
+{
+  "report_types": ["incident_report", "post_mortem"],
+  "options": {
+    "include_timeline": true,
+    "include_evidence": true,
+    "format": "markdown"
+  }
+}
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "report_types": ["incident_report", "post_mortem"],
+  "status": "generating",
+  "reports": [
+    {"type": "incident_report", "report_id": "rpt_001", "status": "pending"},
+    {"type": "post_mortem", "report_id": "rpt_002", "status": "pending"}
+  ]
+}
+```
+
+**Report Types**:
+- `incident_report`: Standard incident documentation
+- `post_mortem`: Detailed root cause analysis
+- `runbook`: Operational runbook
+- `summary`: Brief case summary
+
+**Storage**: SQLite with async report generation
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can generate reports
+    """
+
+GET_CASE_REPORTS = """
+Retrieves generated reports for a case.
+
+**Workflow**:
+1. Validates case exists and user has access
+2. Retrieves report list (current or historical)
+3. Returns report metadata
+
+**Query Parameters**:
+- `include_history` (default: false): Include all report versions
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/reports?include_history=false
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "case_id": "case_abc123",
+  "reports": [
+    {
+      "report_id": "rpt_001",
+      "type": "incident_report",
+      "status": "completed",
+      "created_at": "2025-11-19T10:30:00Z",
+      "version": 1
+    }
+  ],
+  "include_history": false
+}
+```
+
+**Report Status Values**:
+- `pending`: Report generation queued
+- `generating`: Report being generated
+- `completed`: Report ready for download
+- `failed`: Generation failed
+
+**Storage**: SQLite query with version filtering
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can view reports
+    """
+
+DOWNLOAD_CASE_REPORT = """
+Downloads a generated report in the specified format.
+
+**Workflow**:
+1. Validates case and report exist
+2. Generates report in requested format
+3. Returns file download response
+
+**Query Parameters**:
+- `format` (default: markdown): Output format (markdown or pdf)
+
+**Request Example**:
+```
+GET /api/v1/cases/case_abc123/reports/rpt_001/download?format=markdown
+Headers:
+  X-User-ID: user_123
+```
+
+**Response**:
+- Content-Type: text/markdown or application/pdf
+- Content-Disposition: attachment; filename="report.md"
+
+**Supported Formats**:
+- `markdown`: Markdown text format (default)
+- `pdf`: PDF document (coming soon; rejected with 501 before any lookup)
+
+Any other format value is rejected with 422 by request validation.
+
+**Storage**: SQLite with file content retrieval
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only case owner can download reports
+    """
+
+LIST_REPORTS = """
+Lists all available reports across the user's cases.
+
+**Workflow**:
+1. Retrieves all reports for user's cases
+2. Returns paginated list with metadata
+
+**Query Parameters**:
+- `limit` (default: 50, max: 100): Maximum reports to return
+
+**Request Example**:
+```
+GET /api/v1/cases/reports?limit=20
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "reports": [
+    {
+      "report_id": "rpt_001",
+      "case_id": "case_abc123",
+      "type": "incident_report",
+      "status": "completed",
+      "created_at": "2025-11-19T10:30:00Z"
+    }
+  ],
+  "total": 15
+}
+```
+
+**Storage**: SQLite query with user_id filter
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only shows user's own reports
+    """
+
+GET_REPORT = """
+Retrieves a specific report by its ID.
+
+**Workflow**:
+1. Validates report exists and user has access
+2. Returns report metadata and content
+
+**Request Example**:
+```
+GET /api/v1/cases/reports/rpt_001
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "report_id": "rpt_001",
+  "case_id": "case_abc123",
+  "type": "incident_report",
+  "title": "Redis Connection Timeout Incident",
+  "status": "completed",
+  "content": "# Incident Report\\n\\n## Summary...",
+  "created_at": "2025-11-19T10:30:00Z",
+  "version": 1
+}
+```
+
+**Storage**: SQLite query with user access validation
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only report owner can access
+    """
+
+GET_ANALYTICS_SUMMARY = """
+Returns aggregate analytics across all of the user's cases.
+
+**Workflow**:
+1. Aggregates metrics across user's cases
+2. Calculates summary statistics
+3. Returns analytics dashboard data
+
+**Request Example**:
+```
+GET /api/v1/cases/analytics/summary
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "total_cases": 25,
+  "cases_by_status": {
+    "active": 5,
+    "investigating": 8,
+    "resolved": 10,
+    "closed": 2
+  },
+  "cases_by_severity": {
+    "critical": 2,
+    "high": 8,
+    "medium": 10,
+    "low": 5
+  },
+  "average_resolution_time_hours": 4.5,
+  "cases_this_week": 3,
+  "cases_this_month": 12
+}
+```
+
+**Metrics Included**:
+- Total case count
+- Cases by status breakdown
+- Cases by severity breakdown
+- Average resolution time
+- Time-based case counts
+
+**Storage**: SQLite aggregation queries
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only aggregates user's own cases
+    """
+
+GET_CASE_TRENDS = """
+Returns case trends and patterns over a specified time period.
+
+**Workflow**:
+1. Analyzes case data over time period
+2. Calculates trends and patterns
+3. Returns time-series data
+
+**Query Parameters**:
+- `days` (default: 30, max: 365): Number of days to analyze
+
+**Request Example**:
+```
+GET /api/v1/cases/analytics/trends?days=30
+Headers:
+  X-User-ID: user_123
+```
+
+**Response Example**:
+```json
+{
+  "period_days": 30,
+  "trends": [
+    {"date": "2025-11-01", "created": 2, "resolved": 1},
+    {"date": "2025-11-02", "created": 3, "resolved": 2},
+    ...
+  ],
+  "summary": {
+    "total_created": 25,
+    "total_resolved": 20,
+    "trend_direction": "improving"
+  }
+}
+```
+
+**Trend Analysis**:
+- Daily case creation counts
+- Daily resolution counts
+- Moving averages
+- Trend direction indicators
+
+**Storage**: SQLite time-series aggregation
+**Rate Limits**: None (enforced at API Gateway level)
+**Authorization**: Requires X-User-ID header
+**User Isolation**: Only analyzes user's own cases
+    """
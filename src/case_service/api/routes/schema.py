@@ -7,7 +7,7 @@ This endpoint is excluded from OpenAPI docs (internal use only).
 import logging
 from typing import Any, Dict, List
 from fastapi import APIRouter
-from sqlalchemy import inspect
+from sqlalchemy import Connection, inspect, text
 
 from case_service.infrastructure.database.client import db_client
 from case_service.config import settings
@@ -16,6 +16,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["Schema"])
 
+# alembic_version holds a single row on a linear migration history
+_ALEMBIC_VERSION_QUERY = text("SELECT version_num FROM alembic_version")
+
 
 @router.get("/schema.json", include_in_schema=False)
 async def get_schema() -> Dict[str, Any]:
@@ -36,31 +39,53 @@ async def get_schema() -> Dict[str, Any]:
         This endpoint is excluded from OpenAPI documentation (internal use only).
         Used by fm-api-gateway's SchemaAggregator for unified schema delivery.
     """
-    inspector = inspect(db_client.engine.sync_engine)
-
     # Get current Alembic migration version
     alembic_version = "unknown"
-    try:
-        async with db_client.engine.begin() as conn:
-            result = await conn.execute(
-                "SELECT version_num FROM alembic_version ORDER BY version_num DESC LIMIT 1"
-            )
+    async with db_client.engine.connect() as conn:
+        try:
+            result = await conn.execute(_ALEMBIC_VERSION_QUERY)
             row = result.fetchone()
             if row:
                 alembic_version = row[0]
-    except Exception as e:
-        logger.warning(f"Could not fetch Alembic version: {e}")
-
-    schema_metadata = {
+        except Exception as e:
+            logger.warning(f"Could not fetch Alembic version: {e}")
+            # A failed statement aborts the transaction on PostgreSQL
+            await conn.rollback()
+
+        # Only a migration changes the schema, so reflect once per version
+        tables = _tables_cache.get(alembic_version)
+        if tables is None:
+            tables = await conn.run_sync(_reflect_tables)
+            _tables_cache.clear()
+            _tables_cache[alembic_version] = tables
+
+    return {
         "service": "fm-case-service",
-        "database_type": "postgresql" if "postgresql" in settings.database_url else "sqlite",
+        "database_type": settings.database_type,
         "version": "1.0.0",
         "alembic_version": alembic_version,
-        "tables": []
+        "tables": tables
     }
 
-    # Introspect all tables
+
+# Reflected table metadata for the last seen Alembic version
+_tables_cache: Dict[str, List[Dict[str, Any]]] = {}
+
+
+def _reflect_tables(sync_conn: Connection) -> List[Dict[str, Any]]:
+    """Introspect all tables with one catalog query per kind of object.
+
+    The get_multi_* inspector methods reflect every table at once instead of
+    issuing a columns, foreign keys and indexes query per table.
+    """
+    inspector = inspect(sync_conn)
+    all_columns = inspector.get_multi_columns()
+    all_foreign_keys = inspector.get_multi_foreign_keys()
+    all_indexes = inspector.get_multi_indexes()
+
+    tables = []
     for table_name in inspector.get_table_names():
+        key = (None, table_name)
         table_info = {
             "name": table_name,
             "description": _get_table_description(table_name),
@@ -70,7 +95,7 @@ async def get_schema() -> Dict[str, Any]:
         }
 
         # Get columns
-        for column in inspector.get_columns(table_name):
+        for column in all_columns.get(key, []):
             col_info = {
                 "name": column["name"],
                 "type": str(column["type"]),
@@ -90,7 +115,7 @@ async def get_schema() -> Dict[str, Any]:
             table_info["columns"].append(col_info)
 
         # Get foreign keys
-        for fk in inspector.get_foreign_keys(table_name):
+        for fk in all_foreign_keys.get(key, []):
             table_info["foreign_keys"].append({
                 "constrained_columns": fk["constrained_columns"],
                 "referred_table": fk["referred_table"],
@@ -98,33 +123,62 @@ async def get_schema() -> Dict[str, Any]:
             })
 
         # Get indexes
-        for index in inspector.get_indexes(table_name):
+        for index in all_indexes.get(key, []):
             table_info["indexes"].append({
                 "name": index["name"],
                 "columns": index["column_names"],
                 "unique": index["unique"]
             })
 
-        schema_metadata["tables"].append(table_info)
-
-    return schema_metadata
+        tables.append(table_info)
+
+    return tables
+
+
+# Human-readable descriptions of known tables
+_TABLE_DESCRIPTIONS: Dict[str, str] = {
+    "cases": "Troubleshooting cases with hybrid JSONB fields for flexible metadata",
+    "hypotheses": "Root cause hypotheses linked to cases",
+    "solutions": "Proposed and implemented solutions for cases",
+    "case_messages": "Conversation history and AI agent interactions",
+    "evidence": "Evidence artifacts linked to cases",
+    "uploaded_files": "File upload metadata and references",
+    "case_status_transitions": "Audit trail of case status changes",
+    "case_tags": "Tag assignments for case categorization",
+    "agent_tool_calls": "Tool usage tracking for AI agent calls",
+    "case_daily_counters": "Per-user daily counters for auto-generated case titles",
+    "alembic_version": "Database migration version tracking"
+}
+
+# Expected structure of JSONB columns, keyed by (table_name, column_name)
+_JSONB_SCHEMAS: Dict[tuple[str, str], Dict[str, Any]] = {
+    ("cases", "metadata"): {
+        "type": "object",
+        "description": "Additional case metadata (flexible JSON structure)",
+        "index": "GIN (jsonb_path_ops): filter with containment, metadata @> '{...}'",
+        "properties": {
+            "priority": {"type": "string", "enum": ["low", "medium", "high", "critical"]},
+            "environment": {"type": "string", "description": "Environment where issue occurred"},
+            "affected_systems": {"type": "array", "items": {"type": "string"}},
+            "custom_fields": {"type": "object", "description": "User-defined custom fields"}
+        }
+    },
+    ("case_messages", "metadata"): {
+        "type": "object",
+        "description": "Message metadata (tool calls, attachments, etc.)",
+        "index": "GIN (jsonb_path_ops): filter with containment, metadata @> '{...}'",
+        "properties": {
+            "tool_calls": {"type": "array", "description": "AI agent tool invocations"},
+            "attachments": {"type": "array", "description": "File attachments"},
+            "internal_notes": {"type": "boolean", "description": "Whether message is internal"}
+        }
+    },
+}
 
 
 def _get_table_description(table_name: str) -> str:
     """Get human-readable description for table."""
-    descriptions = {
-        "cases": "Troubleshooting cases with hybrid JSONB fields for flexible metadata",
-        "hypotheses": "Root cause hypotheses linked to cases",
-        "solutions": "Proposed and implemented solutions for cases",
-        "case_messages": "Conversation history and AI agent interactions",
-        "evidence": "Evidence artifacts linked to cases",
-        "uploaded_files": "File upload metadata and references",
-        "case_status_transitions": "Audit trail of case status changes",
-        "case_tags": "Tag assignments for case categorization",
-        "agent_tool_calls": "Tool usage tracking for AI agent calls",
-        "alembic_version": "Database migration version tracking"
-    }
-    return descriptions.get(table_name, f"{table_name} table")
+    return _TABLE_DESCRIPTIONS.get(table_name, f"{table_name} table")
 
 
 def _get_jsonb_schema_metadata(table_name: str, column_name: str) -> Dict[str, Any] | None:
@@ -135,33 +189,6 @@ def _get_jsonb_schema_metadata(table_name: str, column_name: str) -> Dict[str, A
     - Normalized tables for high-cardinality data (hypotheses, solutions)
     - JSONB columns for flexible, low-cardinality fields (metadata, tags)
 
-    This documents the expected structure of JSONB columns.
+    Returns None if no schema documentation is available.
     """
-    # Currently, case metadata fields are stored in separate JSONB columns in the cases table
-    # Document known JSONB schemas here
-
-    if table_name == "cases" and column_name == "metadata":
-        return {
-            "type": "object",
-            "description": "Additional case metadata (flexible JSON structure)",
-            "properties": {
-                "priority": {"type": "string", "enum": ["low", "medium", "high", "critical"]},
-                "environment": {"type": "string", "description": "Environment where issue occurred"},
-                "affected_systems": {"type": "array", "items": {"type": "string"}},
-                "custom_fields": {"type": "object", "description": "User-defined custom fields"}
-            }
-        }
-
-    if table_name == "case_messages" and column_name == "metadata":
-        return {
-            "type": "object",
-            "description": "Message metadata (tool calls, attachments, etc.)",
-            "properties": {
-                "tool_calls": {"type": "array", "description": "AI agent tool invocations"},
-                "attachments": {"type": "array", "description": "File attachments"},
-                "internal_notes": {"type": "boolean", "description": "Whether message is internal"}
-            }
-        }
-
-    # Return None if no schema documentation available
-    return None
+    return _JSONB_SCHEMAS.get((table_name, column_name))
@@ -1,5 +1,6 @@
 """Service configuration settings."""
 
+from functools import cached_property
 from typing import List
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -16,10 +17,39 @@ class Settings(BaseSettings):
     # Database configuration
     database_url: str = "sqlite+aiosqlite:///./fm_cases.db"
 
+    # Connection pool (server databases only; SQLite keeps SQLAlchemy's default)
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds; stay under server/proxy idle timeouts
+    db_pool_pre_ping: bool = True
+    # asyncpg only: server-side TCP keepalives, so idle pooled connections
+    # behind NAT/load balancers are probed instead of silently dropped
+    db_tcp_keepalives_idle: int = 30  # seconds idle before the first probe
+    db_tcp_keepalives_interval: int = 10  # seconds between probes
+    db_tcp_keepalives_count: int = 5  # unanswered probes before the link is dead
+    # asyncpg only: PostgreSQL JIT compiles expensive plans, which costs more
+    # than it saves on this service's short indexed queries
+    db_jit: bool = False
+    # asyncpg only: prepared statements kept per connection, so repeated
+    # queries skip the server-side parse/plan (set 0 behind pgbouncer in
+    # transaction mode, which cannot keep prepared statements)
+    db_statement_cache_size: int = 500
+    # SQLAlchemy compiled-statement cache, shared by the engine
+    db_query_cache_size: int = 1200
+
+    # Case storage backend: "inmemory" (dev/testing) or "postgres" (hybrid schema)
+    case_storage_type: str = "inmemory"
+
     # Pagination defaults
     default_page_size: int = 50
     max_page_size: int = 100
 
+    # Serve not-yet-implemented endpoints from pre-serialized payloads
+    stub_endpoints_fast_path: bool = True
+
+    # Serve OpenAPI docs (/docs, /openapi.json) with long-form route descriptions
+    api_docs_enabled: bool = True
+
     # CORS configuration
     cors_origins: str = "*"
 
@@ -33,6 +63,11 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
+    @cached_property
+    def database_type(self) -> str:
+        """Database family named in database_url: "postgresql" or "sqlite"."""
+        return "postgresql" if "postgresql" in self.database_url else "sqlite"
+
     @property
     def cors_origins_list(self) -> List[str]:
         """Parse CORS origins from comma-separated string."""
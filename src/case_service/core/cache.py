@@ -0,0 +1,62 @@
+"""Small in-process TTL cache for read-heavy manager results."""
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a fixed time-to-live.
+
+    The cache is process-local (not shared between workers), so it only
+    suits results where a few seconds of staleness is acceptable and writes
+    made through this process invalidate explicitly.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 10.0):
+        """Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before least-recently-used eviction
+            ttl: Entry lifetime in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entries beyond maxsize."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Remove key if present."""
+        self._data.pop(key, None)
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Remove every entry whose key matches predicate."""
+        for key in [key for key in self._data if predicate(key)]:
+            del self._data[key]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
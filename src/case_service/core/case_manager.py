@@ -1,20 +1,47 @@
 """Case business logic manager - Repository Pattern."""
 
+import hashlib
 import logging
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple
-from uuid import uuid4
+from typing import Iterable, List, Optional, Set, Tuple
 
-from fm_core_lib.models import Case, CaseStatus
+from fm_core_lib.models import Case, CaseStatus, Evidence, Hypothesis, HypothesisStatus
 
+from case_service.core.cache import TTLCache
+from case_service.core.ids import new_id
+from case_service.core.pagination import decode_cursor
 from case_service.infrastructure.persistence import CaseRepository
 from case_service.models import (
     CaseCreateRequest,
     CaseUpdateRequest,
+    CaseSearchRequest,
+    CloseCaseRequest,
+    EvidenceCreateRequest,
+    HypothesisCreateRequest,
+    HypothesisUpdateRequest,
 )
 
 logger = logging.getLogger(__name__)
 
+# Search result pages keyed by (user_id, filter digest). Shared by all
+# CaseManager instances in the process; dropped per user on every write.
+_search_cache = TTLCache(maxsize=1024, ttl=10.0)
+
+# Per-user analytics summaries keyed by (user_id, "summary"); dashboards poll
+# these every few seconds while the underlying counts change far less often
+_analytics_cache = TTLCache(maxsize=10_000, ttl=30.0)
+
+# Cases read through get_case, keyed by case_id. Writes through this process
+# drop the entry once they are committed, so only writes from other workers
+# or replicas can be served stale, and for at most the TTL. Cached cases are
+# shared between requests and must be treated as read-only.
+_case_cache = TTLCache(maxsize=10_000, ttl=5.0)
+
+# Bumped whenever cached cases are dropped. get_case only caches a row if no
+# write was committed while it was being read, so a read that raced a commit
+# cannot put the pre-commit row back into the cache.
+_case_cache_generation = 0
+
 
 class CaseManager:
     """Business logic for case management operations.
@@ -23,13 +50,53 @@ class CaseManager:
     It handles business logic while delegating persistence to CaseRepository.
     """
 
-    def __init__(self, repository: CaseRepository):
+    def __init__(self, repository: CaseRepository, defer_cache_invalidation: bool = False):
         """Initialize case manager with repository.
 
         Args:
             repository: CaseRepository implementation (InMemory, PostgreSQL, or Hybrid)
+            defer_cache_invalidation: Record cache entries made stale by writes
+                and drop them only when invalidate_pending_caches() is called.
+                Set this when writes go through a transaction, and call
+                invalidate_pending_caches() after it commits; otherwise a
+                concurrent read can re-cache the old row before the commit.
         """
         self.repository = repository
+        self._defer_cache_invalidation = defer_cache_invalidation
+        self._stale_case_ids: Set[str] = set()
+        self._stale_user_ids: Set[str] = set()
+
+    def _invalidate_user_caches(self, user_id: str) -> None:
+        """Drop cached read results for a user after one of their cases changed."""
+        if self._defer_cache_invalidation:
+            self._stale_user_ids.add(user_id)
+        else:
+            self._drop_caches((), (user_id,))
+
+    def _invalidate_case_caches(self, case_id: str, user_id: str) -> None:
+        """Drop cached read results after a case changed."""
+        if self._defer_cache_invalidation:
+            self._stale_case_ids.add(case_id)
+            self._stale_user_ids.add(user_id)
+        else:
+            self._drop_caches((case_id,), (user_id,))
+
+    def invalidate_pending_caches(self) -> None:
+        """Drop the cache entries recorded by deferred invalidation."""
+        self._drop_caches(self._stale_case_ids, self._stale_user_ids)
+        self._stale_case_ids.clear()
+        self._stale_user_ids.clear()
+
+    @staticmethod
+    def _drop_caches(case_ids: Iterable[str], user_ids: Iterable[str]) -> None:
+        """Drop cached cases and per-user read results."""
+        global _case_cache_generation
+        for case_id in case_ids:
+            _case_cache.pop(case_id)
+            _case_cache_generation += 1
+        for user_id in user_ids:
+            _search_cache.evict(lambda key: key[0] == user_id)
+            _analytics_cache.pop((user_id, "summary"))
 
     async def create_case(
         self,
@@ -45,16 +112,16 @@ class CaseManager:
         Returns:
             Created case with generated ID
         """
+        # One timestamp for the title and all of the case's initial timestamps
+        now = datetime.now(timezone.utc)
+
         # Auto-generate title if not provided
         title = request.title
         if not title or not title.strip():
-            # Generate title: Case-MMDD-N
-            now = datetime.now(timezone.utc)
+            # Generate title: Case-MMDD-N, N counting the user's cases today
             date_suffix = now.strftime("%m%d")
 
-            # Count today's cases for sequence number
-            # TODO: Implement count_cases_by_user_today in repository
-            sequence = 1
+            sequence = await self.repository.next_daily_sequence(user_id, now.date())
             title = f"Case-{date_suffix}-{sequence}"
 
         # Prepare metadata with priority
@@ -63,18 +130,22 @@ class CaseManager:
 
         # Create Case using fm-core-lib model
         case = Case(
-            case_id=f"case_{uuid4().hex[:12]}",
+            case_id=new_id("case_"),
             user_id=user_id,
             organization_id="default",  # TODO: Extract from X-Organization-Id header when available
             title=title.strip(),
             description=request.description or "",
             status=CaseStatus.CONSULTING,  # Start in consulting phase
             metadata=metadata,
+            created_at=now,
+            updated_at=now,
+            last_activity_at=now,
         )
 
         # Save via repository
         saved_case = await self.repository.save(case)
 
+        self._invalidate_user_caches(user_id)
         logger.info(f"Created case {saved_case.case_id} for user {user_id}")
 
         return saved_case
@@ -91,12 +162,22 @@ class CaseManager:
             user_id: Optional user ID for access control
 
         Returns:
-            Case if found and accessible, None otherwise
+            Case if found and accessible, None otherwise. The case may be
+            shared with other requests through the cache; do not mutate it.
         """
-        case = await self.repository.get(case_id)
-
-        if not case:
-            return None
+        case = _case_cache.get(case_id)
+        if case is None:
+            generation = _case_cache_generation
+            case = await self.repository.get(case_id)
+            if not case:
+                return None
+
+            # Rows hydrated without model validation may carry status as a
+            # plain string; normalize once so callers can always use .value
+            if not isinstance(case.status, CaseStatus):
+                case.status = CaseStatus(case.status)
+            if generation == _case_cache_generation:
+                _case_cache.set(case_id, case)
 
         # Access control: users can only see their own cases
         if user_id and case.user_id != user_id:
@@ -108,6 +189,18 @@ class CaseManager:
 
         return case
 
+    async def case_exists(self, case_id: str, user_id: str) -> bool:
+        """Check whether a case exists and belongs to the user.
+
+        Args:
+            case_id: Case identifier
+            user_id: User ID for authorization
+
+        Returns:
+            True if the case exists and is owned by the user
+        """
+        return await self.repository.exists(case_id, user_id=user_id)
+
     async def update_case(
         self,
         case_id: str,
@@ -124,21 +217,16 @@ class CaseManager:
         Returns:
             Updated case or None if not found/unauthorized
         """
-        # Get case with authorization check
-        case = await self.get_case(case_id, user_id)
-        if not case:
-            return None
+        now = datetime.now(timezone.utc)
 
         # Apply updates
+        fields = {"updated_at": now, "last_activity_at": now}
         if request.title is not None:
-            case.title = request.title.strip()
+            fields["title"] = request.title.strip()
         if request.description is not None:
-            case.description = request.description
+            fields["description"] = request.description
         if request.status is not None:
-            case.status = request.status
-            if request.status in [CaseStatus.RESOLVED, CaseStatus.CLOSED]:
-                case.resolved_at = datetime.now(timezone.utc)
-                case.closed_at = datetime.now(timezone.utc)
+            fields.update(self._status_fields(request.status, now))
 
         # Update metadata
         if hasattr(request, 'metadata') and request.metadata is not None:
@@ -150,16 +238,57 @@ class CaseManager:
             # TODO: Map to proper Case fields
             pass
 
-        case.updated_at = datetime.now(timezone.utc)
-        case.last_activity_at = datetime.now(timezone.utc)
-
-        # Save via repository
-        updated_case = await self.repository.save(case)
+        # Ownership is part of the UPDATE predicate, so no pre-fetch is needed
+        updated_case = await self.repository.update_if_owner(case_id, user_id, **fields)
+        if not updated_case:
+            return None
 
+        self._invalidate_case_caches(case_id, user_id)
         logger.info(f"Updated case {case_id}")
 
         return updated_case
 
+    async def update_status(
+        self,
+        case_id: str,
+        user_id: str,
+        new_status: CaseStatus,
+    ) -> Optional[Case]:
+        """Update a case's status.
+
+        Args:
+            case_id: Case identifier
+            user_id: User ID for authorization
+            new_status: Status to move the case to
+
+        Returns:
+            Updated case or None if not found/unauthorized
+        """
+        now = datetime.now(timezone.utc)
+        fields = {
+            "updated_at": now,
+            "last_activity_at": now,
+            **self._status_fields(new_status, now),
+        }
+
+        updated_case = await self.repository.update_if_owner(case_id, user_id, **fields)
+        if not updated_case:
+            return None
+
+        self._invalidate_case_caches(case_id, user_id)
+        logger.info(f"Updated case {case_id} status to {new_status.value}")
+
+        return updated_case
+
+    @staticmethod
+    def _status_fields(new_status: CaseStatus, now: datetime) -> dict:
+        """Case fields to set when moving a case to new_status."""
+        fields = {"status": new_status}
+        if new_status in [CaseStatus.RESOLVED, CaseStatus.CLOSED]:
+            fields["resolved_at"] = now
+            fields["closed_at"] = now
+        return fields
+
     async def delete_case(self, case_id: str, user_id: str) -> bool:
         """Delete a case.
 
@@ -170,15 +299,11 @@ class CaseManager:
         Returns:
             True if deleted, False if not found/unauthorized
         """
-        # Check authorization first
-        case = await self.get_case(case_id, user_id)
-        if not case:
-            return False
-
-        # Delete via repository
-        deleted = await self.repository.delete(case_id)
+        # Ownership is part of the DELETE predicate, so no pre-fetch is needed
+        deleted = await self.repository.delete(case_id, user_id=user_id)
 
         if deleted:
+            self._invalidate_case_caches(case_id, user_id)
             logger.info(f"Deleted case {case_id}")
 
         return deleted
@@ -187,187 +312,227 @@ class CaseManager:
         self,
         user_id: str,
         status: Optional[CaseStatus] = None,
-        limit: int = 20,
-        offset: int = 0,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: Optional[str] = None,
     ) -> tuple[List[Case], int]:
-        """List cases for a user.
+        """List cases for a user, newest first.
 
         Args:
             user_id: User ID to filter by
             status: Optional status filter
-            limit: Maximum number of cases to return
-            offset: Offset for pagination
+            page: 1-based page number (ignored when cursor is given)
+            page_size: Maximum number of cases to return
+            cursor: Opaque cursor from a previous page (see core.pagination)
 
         Returns:
             Tuple of (cases, total_count)
+
+        Raises:
+            ValueError: If cursor is malformed
         """
         # Use repository list method
         cases, total = await self.repository.list(
             user_id=user_id,
-            status=status.value if status else None,
-            limit=limit,
-            offset=offset,
+            status=status,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            after=decode_cursor(cursor) if cursor else None,
+            include_children=False,  # list responses only read case columns
         )
 
         return cases, total
 
-    async def get_cases_by_session(self, session_id: str) -> List[Case]:
-        """Get all cases for a session.
+    async def list_cases_by_session(
+        self,
+        session_id: str,
+        user_id: str,
+        page: int = 1,
+        page_size: int = 50,
+        cursor: Optional[str] = None,
+    ) -> tuple[List[Case], int]:
+        """List a user's cases linked to a session, newest first.
+
+        Cases are linked to a session through ``metadata["session_id"]``.
 
         Args:
             session_id: Session identifier
+            user_id: User ID to filter by
+            page: 1-based page number (ignored when cursor is given)
+            page_size: Maximum number of cases to return
+            cursor: Opaque cursor from a previous page (see core.pagination)
 
         Returns:
-            List of cases for the session
-        """
-        # TODO: Add session_id filter to repository.list()
-        # For now, get all cases and filter in memory
-        all_cases, _ = await self.repository.list(limit=1000)
-
-        # Filter by session_id (stored in consulting data or as field)
-        session_cases = []
-        for case in all_cases:
-            # TODO: Check proper field based on design
-            # if case.consulting and case.consulting.session_id == session_id:
-            #     session_cases.append(case)
-            pass
+            Tuple of (cases, total_count)
 
-        return session_cases
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        return await self.repository.list_by_session(
+            session_id=session_id,
+            user_id=user_id,
+            limit=page_size,
+            offset=(page - 1) * page_size,
+            after=decode_cursor(cursor) if cursor else None,
+        )
 
     # =========================================================================
     # Phase 4: Evidence and Data Management
     # =========================================================================
 
     async def add_evidence(
-        self, case_id: str, user_id: str, evidence_data: dict
+        self, case_id: str, user_id: str, evidence_data: EvidenceCreateRequest
     ) -> Optional[Case]:
         """Add evidence to a case."""
-        case = await self.repository.get(case_id)
-        if not case or case.user_id != user_id:
+        return await self.add_evidence_batch(case_id, user_id, [evidence_data])
+
+    async def add_evidence_batch(
+        self, case_id: str, user_id: str, evidence_items: List[EvidenceCreateRequest]
+    ) -> Optional[Case]:
+        """Add several evidence items to a case with a single save.
+
+        Args:
+            case_id: Case identifier
+            user_id: User ID for authorization
+            evidence_items: Evidence to append, in order
+
+        Returns:
+            Updated case, or None if not found/unauthorized
+        """
+        collected_at = datetime.now(timezone.utc)
+        evidence = [
+            Evidence(
+                evidence_id=new_id("evidence_"),
+                content=evidence_data.content,
+                source=evidence_data.source,
+                category=evidence_data.category,
+                collected_at=collected_at,
+            )
+            for evidence_data in evidence_items
+        ]
+
+        # The repository checks ownership and writes only the new evidence
+        saved_case = await self.repository.add_evidence(case_id, user_id, evidence)
+        if not saved_case:
             return None
 
-        # Create evidence object from dict and append to case
-        from fm_core_lib.models import Evidence
-        from datetime import datetime, timezone
-        from uuid import uuid4
-
-        evidence = Evidence(
-            evidence_id=f"evidence_{uuid4().hex[:12]}",
-            content=evidence_data.get("content", ""),
-            source=evidence_data.get("source", "user"),
-            category=evidence_data.get("category", "observation"),
-            collected_at=datetime.now(timezone.utc),
-        )
-        case.evidence.append(evidence)
-        return await self.repository.save(case)
+        self._invalidate_case_caches(case_id, user_id)
+        return saved_case
 
     async def get_evidence(
         self, case_id: str, evidence_id: str, user_id: str
     ) -> Optional[dict]:
         """Get specific evidence from a case."""
-        case = await self.repository.get(case_id)
-        if not case or case.user_id != user_id:
-            return None
-
-        for evidence in case.evidence:
-            if evidence.evidence_id == evidence_id:
-                return evidence.model_dump()
-        return None
+        evidence = await self.repository.get_evidence(case_id, evidence_id, user_id)
+        return evidence.model_dump() if evidence else None
 
     async def get_uploaded_files(
-        self, case_id: str, user_id: str
-    ) -> Optional[list]:
-        """Get uploaded files for a case."""
-        case = await self.repository.get(case_id)
-        if not case or case.user_id != user_id:
+        self, case_id: str, user_id: str, limit: int = 100, offset: int = 0
+    ) -> Optional[Tuple[list, int]]:
+        """Get a page of uploaded files for a case.
+
+        Args:
+            case_id: Case identifier
+            user_id: User ID for authorization
+            limit: Maximum number of files to return
+            offset: Number of files to skip
+
+        Returns:
+            Tuple of (files, total_count), or None if not found/unauthorized
+        """
+        result = await self.repository.get_uploaded_files(
+            case_id, user_id, limit=limit, offset=offset
+        )
+        if result is None:
             return None
 
-        return [f.model_dump() for f in case.uploaded_files]
+        files, total = result
+        return [f.model_dump() for f in files], total
 
     async def close_case(
-        self, case_id: str, user_id: str, close_data: Optional[dict] = None
+        self, case_id: str, user_id: str, close_data: Optional[CloseCaseRequest] = None
     ) -> Optional[Case]:
         """Close a case."""
-        from fm_core_lib.models import CaseStatus
-        from datetime import datetime, timezone
-
-        case = await self.repository.get(case_id)
-        if not case or case.user_id != user_id:
-            return None
-
-        case.status = CaseStatus.CLOSED
-        case.updated_at = datetime.now(timezone.utc)
+        now = datetime.now(timezone.utc)
+        fields = {
+            "updated_at": now,
+            "last_activity_at": now,
+            **self._status_fields(CaseStatus.CLOSED, now),
+        }
 
+        # Store close metadata in metadata field
+        metadata_updates = {}
         if close_data:
-            # Store close metadata in metadata field
-            if "reason" in close_data:
-                case.metadata["close_reason"] = close_data["reason"]
-            if "resolution_notes" in close_data:
-                case.metadata["resolution_notes"] = close_data["resolution_notes"]
+            if close_data.reason is not None:
+                metadata_updates["close_reason"] = close_data.reason
+            if close_data.resolution_notes is not None:
+                metadata_updates["resolution_notes"] = close_data.resolution_notes
+
+        # Ownership is part of the UPDATE predicate, so no pre-fetch is needed
+        saved_case = await self.repository.update_if_owner(
+            case_id, user_id, metadata_updates=metadata_updates, **fields
+        )
+        if not saved_case:
+            return None
 
-        return await self.repository.save(case)
+        self._invalidate_case_caches(case_id, user_id)
+        return saved_case
 
     async def search_cases(
-        self, user_id: str, search_params: dict
+        self, user_id: str, search_params: CaseSearchRequest
     ) -> Tuple[List[Case], int]:
-        """Search cases with filters."""
-        # For now, implement basic search using list endpoint
-        # TODO: Implement full-text search when needed
-        all_cases = await self.repository.list(
+        """Search cases with filters.
+
+        Result pages are cached per user for a few seconds, keyed by a digest
+        of the filters, since dashboards repeat identical searches.
+        """
+        digest = hashlib.blake2b(
+            search_params.model_dump_json().encode(), digest_size=16
+        ).hexdigest()
+        cache_key = (user_id, digest)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Filters and pagination are applied by the repository query
+        result = await self.repository.search(
+            query=search_params.query,
             user_id=user_id,
-            limit=search_params.get("limit", 100)
+            statuses=[s.value for s in search_params.status] if search_params.status else None,
+            severities=search_params.severity,
+            limit=search_params.page_size,
+            offset=(search_params.page - 1) * search_params.page_size,
         )
-
-        # Apply basic filters
-        filtered = all_cases
-        if "query" in search_params:
-            query = search_params["query"].lower()
-            filtered = [
-                c for c in filtered
-                if query in c.title.lower() or query in c.description.lower()
-            ]
-
-        if "status" in search_params:
-            statuses = search_params["status"]
-            filtered = [c for c in filtered if c.status.value in statuses]
-
-        if "severity" in search_params:
-            severities = search_params["severity"]
-            filtered = [c for c in filtered if c.severity in severities]
-
-        return filtered, len(filtered)
+        _search_cache.set(cache_key, result)
+        return result
 
     # =========================================================================
     # Phase 6.3: Hypothesis Management
     # =========================================================================
 
     async def add_hypothesis(
-        self, case_id: str, user_id: str, hypothesis_data: dict
+        self, case_id: str, user_id: str, hypothesis_data: HypothesisCreateRequest
     ) -> Optional[Case]:
         """Add hypothesis to case."""
-        case = await self.repository.get(case_id)
-        if not case or case.user_id != user_id:
-            return None
-
-        from fm_core_lib.models import Hypothesis, HypothesisStatus
-        from datetime import datetime, timezone
-        from uuid import uuid4
-
         hypothesis = Hypothesis(
-            hypothesis_id=f"hypothesis_{uuid4().hex[:12]}",
-            description=hypothesis_data.get("description", ""),
-            category=hypothesis_data.get("category", "root_cause"),
+            hypothesis_id=new_id("hypothesis_"),
+            description=hypothesis_data.description,
+            category=hypothesis_data.category,
             status=HypothesisStatus.PROPOSED,
-            confidence=hypothesis_data.get("confidence", 0.5),
+            confidence=hypothesis_data.confidence,
             generated_at=datetime.now(timezone.utc),
         )
-        
-        # Add to case hypotheses dict
-        case.hypotheses[hypothesis.hypothesis_id] = hypothesis
-        return await self.repository.save(case)
+
+        # The repository checks ownership and writes only the new hypothesis
+        saved_case = await self.repository.add_hypothesis(case_id, user_id, hypothesis)
+        if not saved_case:
+            return None
+
+        self._invalidate_case_caches(case_id, user_id)
+        return saved_case
 
     async def update_hypothesis(
-        self, case_id: str, hypothesis_id: str, user_id: str, updates: dict
+        self, case_id: str, hypothesis_id: str, user_id: str, updates: HypothesisUpdateRequest
     ) -> Optional[dict]:
         """Update existing hypothesis."""
         case = await self.repository.get(case_id)
@@ -378,17 +543,17 @@ class CaseManager:
             return None
 
         hypothesis = case.hypotheses[hypothesis_id]
-        
+
         # Update fields
-        if "status" in updates:
-            from fm_core_lib.models import HypothesisStatus
-            hypothesis.status = HypothesisStatus(updates["status"])
-        if "confidence" in updates:
-            hypothesis.confidence = updates["confidence"]
-        if "validation_notes" in updates:
-            hypothesis.validation_notes = updates["validation_notes"]
+        if updates.status is not None:
+            hypothesis.status = updates.status
+        if updates.confidence is not None:
+            hypothesis.confidence = updates.confidence
+        if updates.validation_notes is not None:
+            hypothesis.validation_notes = updates.validation_notes
 
         await self.repository.save(case)
+        self._invalidate_case_caches(case_id, user_id)
         return hypothesis.model_dump()
 
     async def get_case_queries(
@@ -399,40 +564,116 @@ class CaseManager:
         if not case or case.user_id != user_id:
             return None
 
-        # Extract user messages from turn history
+        return self._extract_queries(case)
+
+    @staticmethod
+    def _extract_queries(case: Case) -> list:
+        """Extract user messages from a case's turn history."""
         queries = []
         for turn in case.turn_history:
             if hasattr(turn, 'user_message') and turn.user_message:
                 queries.append({
                     "turn_number": turn.turn_number,
                     "message": turn.user_message,
-                    "timestamp": turn.turn_started_at.isoformat() if hasattr(turn, 'turn_started_at') else None,
+                    "timestamp": (
+                        turn.turn_started_at.isoformat()
+                        if hasattr(turn, 'turn_started_at') else None
+                    ),
                 })
-        
+
         return queries
 
-    async def get_analytics_summary(self, user_id: str) -> dict:
-        """Get analytics summary for user's cases."""
-        all_cases = await self.repository.list(user_id=user_id, limit=1000)
-        
-        from fm_core_lib.models import CaseStatus
-        
-        summary = {
-            "total_cases": len(all_cases),
-            "by_status": {},
-            "by_severity": {},
-            "avg_resolution_time_hours": None,
-            "total_evidence_collected": 0,
-            "total_hypotheses_generated": 0,
+    async def get_case_overview(
+        self, case_id: str, user_id: str, files_limit: int = 20
+    ) -> Optional[dict]:
+        """Get everything a case page needs from a single case load.
+
+        Replaces separate get_case, get_uploaded_files, get_case_queries and
+        get_case_analytics calls: the case is loaded once and the file page,
+        query history and counts are derived from it in-process.
+
+        Args:
+            case_id: Case identifier
+            user_id: User ID for authorization
+            files_limit: Maximum number of uploaded files to include
+
+        Returns:
+            Dict with case, files_page, queries and analytics, or None if
+            not found/unauthorized
+        """
+        case = await self.get_case(case_id, user_id)
+        if not case:
+            return None
+
+        resolution_minutes = None
+        if case.resolved_at:
+            resolution_minutes = round((case.resolved_at - case.created_at).total_seconds() / 60, 1)
+
+        return {
+            "case": case,
+            "files_page": {
+                "files": [f.model_dump() for f in case.uploaded_files[:files_limit]],
+                "total": len(case.uploaded_files),
+                "limit": files_limit,
+                "offset": 0,
+            },
+            "queries": self._extract_queries(case),
+            "analytics": {
+                "status": case.status.value,
+                "message_count": case.message_count,
+                "participant_count": 1,  # Owner only until case sharing is exposed
+                "evidence_count": len(case.evidence),
+                "hypotheses_count": len(case.hypotheses),
+                "resolution_time_minutes": resolution_minutes,
+            },
         }
-        
-        # Count by status
-        for case in all_cases:
-            status_key = case.status.value
-            summary["by_status"][status_key] = summary["by_status"].get(status_key, 0) + 1
-            
-            # Count evidence and hypotheses
-            summary["total_evidence_collected"] += len(case.evidence)
-            summary["total_hypotheses_generated"] += len(case.hypotheses)
-        
+
+    async def get_case_analytics(
+        self, case_id: str, user_id: str
+    ) -> Optional[dict]:
+        """Get analytics for a single case.
+
+        The repository returns the owner and status together with the
+        aggregates, so authorization and counting share one round trip.
+
+        Args:
+            case_id: Case identifier
+            user_id: User ID for authorization
+
+        Returns:
+            Analytics dict, or None if not found/unauthorized
+        """
+        analytics = await self.repository.get_analytics(case_id)
+        if not analytics or analytics.get("user_id") != user_id:
+            return None
+
+        resolution_seconds = analytics.get("resolution_time_seconds")
+        return {
+            "case_id": case_id,
+            "status": analytics["status"],
+            "message_count": analytics.get("message_count", 0),
+            "participant_count": 1,  # Owner only until case sharing is exposed
+            "evidence_count": analytics.get("evidence_count", 0),
+            "hypotheses_count": analytics.get("hypothesis_count", 0),
+            "resolution_time_minutes": (
+                round(resolution_seconds / 60, 1) if resolution_seconds is not None else None
+            ),
+        }
+
+    async def get_analytics_summary(self, user_id: str) -> dict:
+        """Get analytics summary for user's cases.
+
+        Cached per user for 30 seconds; writes through this manager drop the
+        cached summary immediately.
+        """
+        cache_key = (user_id, "summary")
+        cached = _analytics_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Counted by the database; no case rows are loaded
+        summary = await self.repository.get_user_analytics(user_id)
+        summary["avg_resolution_time_hours"] = None
+
+        _analytics_cache.set(cache_key, summary)
         return summary
@@ -0,0 +1,59 @@
+"""Cached wall-clock timestamps for response payloads.
+
+Formatting ``datetime.now(timezone.utc).isoformat()`` on every response is
+measurable CPU under load. A background ticker refreshes a shared ISO-8601
+string every ``TICK_INTERVAL`` seconds so handlers can read it lock-free.
+Anything that needs an exact time (audit fields, persisted timestamps) must
+keep calling ``datetime.now`` directly.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+TICK_INTERVAL = 0.05
+
+# Single-slot list so readers never need a lock
+_NOW_ISO = [datetime.now(timezone.utc).isoformat()]
+_ticker: Optional[asyncio.Task] = None
+
+
+def now_iso() -> str:
+    """Return the current UTC time as an ISO-8601 string.
+
+    Served from the ticker cache when it is running (at most
+    ``TICK_INTERVAL`` seconds stale), otherwise formatted on demand.
+    """
+    if _ticker is None:
+        return datetime.now(timezone.utc).isoformat()
+    return _NOW_ISO[0]
+
+
+async def _tick() -> None:
+    while True:
+        _NOW_ISO[0] = datetime.now(timezone.utc).isoformat()
+        await asyncio.sleep(TICK_INTERVAL)
+
+
+def start_ticker() -> None:
+    """Start the background timestamp ticker (idempotent)."""
+    global _ticker
+    if _ticker is None:
+        _NOW_ISO[0] = datetime.now(timezone.utc).isoformat()
+        _ticker = asyncio.create_task(_tick())
+        logger.debug("Timestamp ticker started")
+
+
+async def stop_ticker() -> None:
+    """Cancel the background timestamp ticker."""
+    global _ticker
+    if _ticker is not None:
+        _ticker.cancel()
+        try:
+            await _ticker
+        except asyncio.CancelledError:
+            pass
+        _ticker = None
@@ -0,0 +1,43 @@
+"""Time-ordered identifiers for new cases and their child records.
+
+Random IDs scatter inserts across the whole primary-key index. These IDs
+start with the creation time, so new rows land on the rightmost index page
+and sort by age. Each ID is 12 lowercase Crockford base32 characters
+(60 bits): a 42-bit millisecond timestamp (good until 2109) followed by 18
+random bits. Within one process IDs are strictly increasing; two processes
+only collide if they draw the same random bits in the same millisecond.
+The length matches the 17-character ``case_id`` column (``case_`` + 12);
+child ID columns are 32 characters wide.
+"""
+
+import secrets
+import time
+
+_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+_RANDOM_BITS = 18
+_LENGTH = 12
+
+_last_value = 0
+
+
+def new_id(prefix: str) -> str:
+    """Return ``prefix`` followed by a new time-ordered ID.
+
+    Args:
+        prefix: ID prefix, e.g. ``"case_"``
+
+    Returns:
+        prefix + 12 ID characters
+    """
+    global _last_value
+    value = (time.time_ns() // 1_000_000) << _RANDOM_BITS | secrets.randbits(_RANDOM_BITS)
+    # Same millisecond (or a clock step back): stay strictly increasing
+    if value <= _last_value:
+        value = _last_value + 1
+    _last_value = value
+
+    chars = []
+    for _ in range(_LENGTH):
+        value, digit = divmod(value, 32)
+        chars.append(_ALPHABET[digit])
+    return prefix + "".join(reversed(chars))
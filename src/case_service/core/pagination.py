@@ -0,0 +1,56 @@
+"""Opaque cursors for keyset pagination of case lists.
+
+Case lists are ordered by ``(created_at, case_id)`` descending. A cursor
+encodes that pair for the last case of a page, so the next page is read
+with ``WHERE (created_at, case_id) < (:created_at, :case_id)`` - an index
+range scan whose cost does not grow with page depth, and which neither
+skips nor repeats rows when cases are created or deleted between requests.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime, timezone
+from typing import Tuple
+
+from fm_core_lib.models import Case
+
+CursorKey = Tuple[datetime, str]
+
+
+def encode_cursor(case: Case) -> str:
+    """Return the cursor pointing just past case.
+
+    Args:
+        case: Last case of the current page
+
+    Returns:
+        URL-safe base64 token
+    """
+    payload = json.dumps([case.created_at.isoformat(), case.case_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> CursorKey:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: URL-safe base64 token
+
+    Returns:
+        Tuple of (created_at, case_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, case_id = json.loads(base64.urlsafe_b64decode(padded))
+        created_at = datetime.fromisoformat(created_at)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+    # Case timestamps are UTC; never compare aware and naive datetimes
+    if created_at.tzinfo is None:
+        created_at = created_at.replace(tzinfo=timezone.utc)
+    return created_at, str(case_id)
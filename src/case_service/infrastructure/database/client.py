@@ -1,11 +1,14 @@
 """Database client for SQLite/PostgreSQL connections."""
 
+import asyncio
 import logging
-from typing import AsyncGenerator
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional
 
+import orjson
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
-from sqlalchemy import text
+from sqlalchemy import event, make_url, text
 from fm_core_lib.utils import service_startup_retry
 
 from case_service.config import settings
@@ -13,27 +16,105 @@ from case_service.config import settings
 logger = logging.getLogger(__name__)
 
 
+# Per-connection SQLite settings, applied once when the pool opens a connection
+_SQLITE_PRAGMAS = (
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA busy_timeout=5000",  # wait for the writer lock instead of failing
+)
+
+# File-backed databases only: WAL lets readers proceed while a write is in
+# flight; NORMAL sync is durable enough in WAL mode and avoids an fsync per commit
+_SQLITE_FILE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA wal_autocheckpoint=1000",
+    "PRAGMA mmap_size=268435456",  # read pages through a 256 MiB memory map
+)
+
+# Session-slot waits longer than this are logged as a sign the pool is undersized
+_SLOW_SLOT_WAIT = 1.0  # seconds
+
+
+def _json_serializer(value) -> str:
+    """Serialize a JSON column value with orjson."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """Apply SQLite PRAGMAs to a newly opened pooled connection."""
+    pragmas = _SQLITE_PRAGMAS
+    if ":memory:" not in settings.database_url:
+        pragmas += _SQLITE_FILE_PRAGMAS
+
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in pragmas:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
 class DatabaseClient:
     """Async database client for SQLAlchemy."""
 
     def __init__(self):
         """Initialize database engine and session factory."""
-        # For SQLite, use NullPool to avoid connection issues
-        # For PostgreSQL, use default pool
-        pool_class = NullPool if "sqlite" in settings.database_url else None
+        # SQLite uses SQLAlchemy's default pool, so its connections (and their
+        # page cache and PRAGMA settings) are reused across requests. Server
+        # databases get a pool sized for concurrent requests; the defaults
+        # (5 + 10 overflow) time out waiting for a connection under load.
+        url = make_url(settings.database_url)
+        pool_options = {}
+        if url.get_backend_name() != "sqlite":
+            pool_options = {
+                "pool_size": settings.db_pool_size,
+                "max_overflow": settings.db_max_overflow,
+                "pool_recycle": settings.db_pool_recycle,
+                "pool_pre_ping": settings.db_pool_pre_ping,
+            }
+        if url.get_driver_name() == "asyncpg":
+            pool_options["connect_args"] = {
+                # asyncpg's own cache, and the one in SQLAlchemy's adapter
+                "statement_cache_size": settings.db_statement_cache_size,
+                "prepared_statement_cache_size": settings.db_statement_cache_size,
+                "server_settings": {
+                    "tcp_keepalives_idle": str(settings.db_tcp_keepalives_idle),
+                    "tcp_keepalives_interval": str(settings.db_tcp_keepalives_interval),
+                    "tcp_keepalives_count": str(settings.db_tcp_keepalives_count),
+                    "jit": "on" if settings.db_jit else "off",
+                }
+            }
 
         self.engine = create_async_engine(
             settings.database_url,
             echo=settings.log_level == "DEBUG",
-            poolclass=pool_class,
+            query_cache_size=settings.db_query_cache_size,
+            # JSON columns: orjson instead of the stdlib json module (for asyncpg
+            # this is the json/jsonb codec the dialect registers per connection)
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
+            **pool_options,
         )
 
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine.sync_engine, "connect", _configure_sqlite_connection)
+
         self.async_session_maker = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
 
+        # One slot per pooled connection (pool_size + overflow). Requests past
+        # that wait here in FIFO order instead of queueing inside the pool,
+        # where a burst ends in pool-timeout errors. SQLite needs no limit.
+        self._session_slots: Optional[asyncio.Semaphore] = None
+        if url.get_backend_name() != "sqlite":
+            self._session_slots = asyncio.Semaphore(
+                settings.db_pool_size + settings.db_max_overflow
+            )
+
         logger.info(f"Database client initialized with URL: {settings.database_url}")
 
     @service_startup_retry
@@ -48,6 +129,22 @@ class DatabaseClient:
             await conn.execute(text("SELECT 1"))
         logger.info("Database connection verified")
 
+        if self.engine.dialect.name != "sqlite":
+            await self._warm_pool()
+
+    async def _warm_pool(self) -> None:
+        """Open pool_size connections up front so early requests skip the connect.
+
+        The connections are held concurrently (sequential checkouts would
+        reuse the same one) and returned to the pool as soon as they open.
+        """
+        async def checkout() -> None:
+            async with self.engine.connect():
+                await asyncio.sleep(0)
+
+        await asyncio.gather(*(checkout() for _ in range(settings.db_pool_size)))
+        logger.info(f"Database pool warmed with {settings.db_pool_size} connections")
+
     async def create_tables(self):
         """Create all database tables via Alembic migrations.
 
@@ -57,9 +154,29 @@ class DatabaseClient:
         """
         logger.info("Database tables managed by Alembic migrations")
 
+    @asynccontextmanager
+    async def session_slot(self) -> AsyncIterator[None]:
+        """Hold one of the pool's connection slots for the duration of a session.
+
+        Acquire this before opening a session; it is released when the
+        block exits, whether or not the session's work succeeded.
+        """
+        if self._session_slots is None:
+            yield
+            return
+
+        started = time.perf_counter()
+        async with self._session_slots:
+            waited = time.perf_counter() - started
+            if waited >= _SLOW_SLOT_WAIT:
+                logger.warning(f"Waited {waited:.2f}s for a database session slot")
+            else:
+                logger.debug(f"Database session slot acquired after {waited * 1000:.1f}ms")
+            yield
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session for dependency injection."""
-        async with self.async_session_maker() as session:
+        async with self.session_slot(), self.async_session_maker() as session:
             try:
                 yield session
                 await session.commit()
@@ -4,10 +4,14 @@ This module provides the repository pattern for Case domain model persistence.
 It abstracts database operations and provides clean interfaces for the service layer.
 """
 
+import heapq
 import json
 from abc import ABC, abstractmethod
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
 
 from fm_core_lib.models.case import (
     Case,
@@ -29,6 +33,38 @@ from fm_core_lib.models.case import (
     CaseStatusTransition,
 )
 
+# Statements on the case read path, built once per process
+_SELECT_CASE_BY_ID = text("SELECT * FROM cases WHERE case_id = :case_id")
+_CASE_EXISTS = text("SELECT 1 FROM cases WHERE case_id = :case_id LIMIT 1")
+_OWNED_CASE_EXISTS = text(
+    "SELECT 1 FROM cases WHERE case_id = :case_id AND user_id = :user_id LIMIT 1"
+)
+_PRUNE_DAILY_COUNTERS = text("DELETE FROM case_daily_counters WHERE day < :cutoff_day")
+
+
+def _counter_cutoff_day() -> date:
+    """First day whose title counter is kept; a day's grace covers clock skew."""
+    return datetime.now(timezone.utc).date() - timedelta(days=1)
+
+
+def _fold_user_analytics(groups) -> Dict[str, Any]:
+    """Combine (status, severity, cases, evidence, hypotheses) groups into a summary."""
+    summary = {
+        "total_cases": 0,
+        "by_status": {},
+        "by_severity": {},
+        "total_evidence_collected": 0,
+        "total_hypotheses_generated": 0,
+    }
+    for status, severity, case_count, evidence_count, hypothesis_count in groups:
+        summary["total_cases"] += case_count
+        summary["by_status"][status] = summary["by_status"].get(status, 0) + case_count
+        if severity:
+            summary["by_severity"][severity] = summary["by_severity"].get(severity, 0) + case_count
+        summary["total_evidence_collected"] += evidence_count
+        summary["total_hypotheses_generated"] += hypothesis_count
+    return summary
+
 
 # ============================================================
 # Repository Interface
@@ -43,6 +79,19 @@ class CaseRepository(ABC):
     - InMemoryCaseRepository: Testing and development
     """
 
+    # Case fields update_if_owner can set
+    UPDATABLE_FIELDS = frozenset({
+        "title", "description", "status",
+        "updated_at", "last_activity_at", "resolved_at", "closed_at",
+    })
+
+    @classmethod
+    def _check_updatable(cls, fields: Dict[str, Any]) -> None:
+        """Reject fields update_if_owner cannot set."""
+        unknown = fields.keys() - cls.UPDATABLE_FIELDS
+        if unknown:
+            raise ValueError(f"Cannot update case fields: {', '.join(sorted(unknown))}")
+
     @abstractmethod
     async def save(self, case: Case) -> Case:
         """
@@ -82,7 +131,9 @@ class CaseRepository(ABC):
         organization_id: Optional[str] = None,
         status: Optional[CaseStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None,
+        include_children: bool = True
     ) -> tuple[List[Case], int]:
         """
         List cases with optional filters.
@@ -92,10 +143,72 @@ class CaseRepository(ABC):
             organization_id: Filter by organization
             status: Filter by status
             limit: Maximum results
+            offset: Pagination offset (ignored when after is given)
+            after: Keyset cursor (created_at, case_id); only cases ordered
+                after it are returned
+            include_children: If False, implementations may return list
+                views: cases whose evidence, hypotheses, solutions, uploaded
+                files and JSON state are left at their defaults
+
+        Returns:
+            Tuple of (cases, total_count), ordered by (created_at, case_id)
+            descending; total_count ignores the cursor
+
+        Raises:
+            RepositoryException: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def list_by_session(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> tuple[List[Case], int]:
+        """
+        List cases linked to a session (``metadata["session_id"]``).
+
+        Args:
+            session_id: Session identifier
+            user_id: Filter by user
+            limit: Maximum results
+            offset: Pagination offset (ignored when after is given)
+            after: Keyset cursor (created_at, case_id); only cases ordered
+                after it are returned
+
+        Returns:
+            Tuple of (cases, total_count), ordered by (created_at, case_id)
+            descending; total_count is the number of matching cases after
+            all filters except the cursor
+
+        Raises:
+            RepositoryException: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def get_uploaded_files(
+        self,
+        case_id: str,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Optional[tuple[List[UploadedFile], int]]:
+        """
+        Get a page of a case's uploaded files.
+
+        Args:
+            case_id: Case identifier
+            user_id: Owner the case must belong to
+            limit: Maximum results
             offset: Pagination offset
 
         Returns:
-            Tuple of (cases, total_count)
+            Tuple of (files, total_count) ordered by upload time, or None if
+            the case does not exist or belongs to another user
 
         Raises:
             RepositoryException: If query fails
@@ -103,15 +216,106 @@ class CaseRepository(ABC):
         pass
 
     @abstractmethod
-    async def delete(self, case_id: str) -> bool:
+    async def get_evidence(
+        self,
+        case_id: str,
+        evidence_id: str,
+        user_id: str
+    ) -> Optional[Evidence]:
+        """
+        Get one evidence item of a case.
+
+        Args:
+            case_id: Case identifier
+            evidence_id: Evidence identifier
+            user_id: Owner the case must belong to
+
+        Returns:
+            The evidence, or None if the case or evidence does not exist or
+            the case belongs to another user
+
+        Raises:
+            RepositoryException: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, case_id: str, user_id: Optional[str] = None) -> bool:
+        """
+        Check whether a case exists without loading it.
+
+        Args:
+            case_id: Case identifier
+            user_id: If given, the case must also belong to this user
+
+        Returns:
+            True if a matching case exists
+
+        Raises:
+            RepositoryException: If query fails
+        """
+        pass
+
+    @abstractmethod
+    async def next_daily_sequence(self, user_id: str, day: date) -> int:
+        """
+        Increment and return a user's case counter for a day.
+
+        Used to number auto-generated titles (Case-MMDD-N) without counting
+        the user's cases.
+
+        Args:
+            user_id: User the counter belongs to
+            day: Calendar day (UTC) the counter is for
+
+        Returns:
+            The new counter value, starting at 1
+
+        Raises:
+            RepositoryException: If the update fails
+        """
+        pass
+
+    @abstractmethod
+    async def update_if_owner(
+        self,
+        case_id: str,
+        user_id: str,
+        metadata_updates: Optional[Dict[str, Any]] = None,
+        **fields: Any
+    ) -> Optional[Case]:
+        """
+        Set case fields in one statement, only if the case belongs to the user.
+
+        Ownership is part of the update predicate, so there is no separate
+        read to authorize the write.
+
+        Args:
+            case_id: Case identifier
+            user_id: User the case must belong to
+            metadata_updates: Keys to merge into the case metadata
+            **fields: New values for any of UPDATABLE_FIELDS
+
+        Returns:
+            The updated case, or None if not found (or owned by another user)
+
+        Raises:
+            ValueError: If a field is not in UPDATABLE_FIELDS
+            RepositoryException: If the update fails
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, case_id: str, user_id: Optional[str] = None) -> bool:
         """
         Delete case by ID.
 
         Args:
             case_id: Case identifier
+            user_id: If given, only delete the case if it belongs to this user
 
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found (or owned by another user)
 
         Raises:
             RepositoryException: If deletion fails
@@ -121,22 +325,28 @@ class CaseRepository(ABC):
     @abstractmethod
     async def search(
         self,
-        query: str,
+        query: Optional[str],
         user_id: Optional[str] = None,
         organization_id: Optional[str] = None,
-        limit: int = 20
+        statuses: Optional[List[str]] = None,
+        severities: Optional[List[str]] = None,
+        limit: int = 20,
+        offset: int = 0
     ) -> tuple[List[Case], int]:
         """
-        Search cases by text query.
+        Search cases by text query and filters.
 
         Args:
-            query: Search query
+            query: Search query (None or empty matches all cases)
             user_id: Filter by user
             organization_id: Filter by organization
+            statuses: Filter by any of these status values
+            severities: Filter by any of these severities (``metadata["severity"]``)
             limit: Maximum results
+            offset: Pagination offset
 
         Returns:
-            Tuple of (cases, total_count)
+            Tuple of (cases, total_count); total_count counts all matches
 
         Raises:
             RepositoryException: If search fails
@@ -150,7 +360,8 @@ class CaseRepository(ABC):
 
         Implementation note: Storage backends may handle this differently:
         - Redis: Store messages separately in a list
-        - PostgreSQL: Messages stored as JSONB array in case record
+        - PostgreSQL (hybrid): One row per message in case_messages
+        - PostgreSQL (legacy): Messages stored as JSONB array in case record
         - In-Memory: Messages stored in Case.messages list
 
         Args:
@@ -225,10 +436,27 @@ class CaseRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_user_analytics(self, user_id: str) -> Dict[str, Any]:
+        """
+        Aggregate counts over all of a user's cases.
+
+        Args:
+            user_id: User whose cases are counted
+
+        Returns:
+            Dictionary with total_cases, by_status, by_severity,
+            total_evidence_collected and total_hypotheses_generated
+
+        Raises:
+            RepositoryException: If the aggregation fails
+        """
+        pass
+
     @abstractmethod
     async def cleanup_expired(self, max_age_days: int = 90, batch_size: int = 100) -> int:
         """
-        Clean up expired/old cases.
+        Clean up expired/old cases and past days' title counters.
 
         Implementation note: Different backends may use different strategies:
         - Redis: Use TTL
@@ -247,6 +475,61 @@ class CaseRepository(ABC):
         """
         pass
 
+    async def add_evidence(
+        self,
+        case_id: str,
+        user_id: str,
+        evidence: List[Evidence]
+    ) -> Optional[Case]:
+        """
+        Append evidence to a case owned by the user.
+
+        Default implementation loads the case, appends and saves it.
+        Backends with normalized evidence storage override it to insert
+        only the new rows.
+
+        Args:
+            case_id: Case identifier
+            user_id: Owner the case must belong to
+            evidence: Evidence to append, in order
+
+        Returns:
+            The updated case, or None if not found/unauthorized
+        """
+        case = await self.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
+
+        case.evidence.extend(evidence)
+        return await self.save(case)
+
+    async def add_hypothesis(
+        self,
+        case_id: str,
+        user_id: str,
+        hypothesis: Hypothesis
+    ) -> Optional[Case]:
+        """
+        Add a hypothesis to a case owned by the user.
+
+        Default implementation loads the case, adds and saves it (see
+        add_evidence).
+
+        Args:
+            case_id: Case identifier
+            user_id: Owner the case must belong to
+            hypothesis: Hypothesis to add
+
+        Returns:
+            The updated case, or None if not found/unauthorized
+        """
+        case = await self.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
+
+        case.hypotheses[hypothesis.hypothesis_id] = hypothesis
+        return await self.save(case)
+
     async def begin_transaction(self):
         """
         Begin a transaction context (optional feature).
@@ -257,8 +540,6 @@ class CaseRepository(ABC):
         Returns:
             Context manager for transaction
         """
-        from contextlib import asynccontextmanager
-
         @asynccontextmanager
         async def noop_transaction():
             yield
@@ -274,12 +555,17 @@ class InMemoryCaseRepository(CaseRepository):
     """
     In-memory case repository for testing and development.
 
-    Data stored in dictionary, not persistent across restarts.
+    Data stored in dictionary, not persistent across restarts. Cases are
+    also indexed by owner, so per-user reads only scan that user's cases.
     """
 
     def __init__(self):
         """Initialize empty in-memory store."""
         self._cases: Dict[str, Case] = {}
+        self._by_user: Dict[str, Dict[str, Case]] = {}
+        # case_id -> (title, description, lowercased title, lowercased description)
+        self._lowered: Dict[str, tuple] = {}
+        self._daily_sequences: Dict[tuple[str, date], int] = {}
 
     async def save(self, case: Case) -> Case:
         """Save case to memory."""
@@ -287,10 +573,42 @@ class InMemoryCaseRepository(CaseRepository):
         case.updated_at = datetime.now(case.updated_at.tzinfo)
 
         # Store (deep copy to simulate persistence)
+        previous = self._cases.get(case.case_id)
+        if previous is not None and previous.user_id != case.user_id:
+            self._unindex(previous)
         self._cases[case.case_id] = case
+        self._by_user.setdefault(case.user_id, {})[case.case_id] = case
 
         return case
 
+    def _unindex(self, case: Case) -> None:
+        """Drop a case from the owner index and the search cache."""
+        self._lowered.pop(case.case_id, None)
+        user_cases = self._by_user.get(case.user_id)
+        if user_cases is not None:
+            user_cases.pop(case.case_id, None)
+            if not user_cases:
+                del self._by_user[case.user_id]
+
+    def _lowered_text(self, case: Case) -> tuple[str, str]:
+        """Lowercased title and description, recomputed only when either changed."""
+        cached = self._lowered.get(case.case_id)
+        if cached is None or cached[0] is not case.title or cached[1] is not case.description:
+            cached = (
+                case.title,
+                case.description,
+                case.title.lower(),
+                (case.description or "").lower(),
+            )
+            self._lowered[case.case_id] = cached
+        return cached[2], cached[3]
+
+    def _candidates(self, user_id: Optional[str]) -> Iterable[Case]:
+        """Cases a filter can match: the user's cases, or all of them."""
+        if user_id:
+            return self._by_user.get(user_id, {}).values()
+        return self._cases.values()
+
     async def get(self, case_id: str) -> Optional[Case]:
         """Get case from memory."""
         return self._cases.get(case_id)
@@ -301,87 +619,172 @@ class InMemoryCaseRepository(CaseRepository):
         organization_id: Optional[str] = None,
         status: Optional[CaseStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None,
+        include_children: bool = True
     ) -> tuple[List[Case], int]:
         """List cases with filters."""
-        # Filter cases
-        filtered = list(self._cases.values())
+        filtered = [
+            c for c in self._candidates(user_id)
+            if (not organization_id or c.organization_id == organization_id)
+            and (not status or c.status == status)
+        ]
 
-        if user_id:
-            filtered = [c for c in filtered if c.user_id == user_id]
+        return self._page(filtered, limit, offset, after)
 
-        if organization_id:
-            filtered = [c for c in filtered if c.organization_id == organization_id]
+    async def list_by_session(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> tuple[List[Case], int]:
+        """List cases linked to a session."""
+        filtered = [
+            c for c in self._candidates(user_id)
+            if c.metadata.get("session_id") == session_id
+        ]
+
+        return self._page(filtered, limit, offset, after)
+
+    @staticmethod
+    def _page(
+        cases: List[Case],
+        limit: int,
+        offset: int,
+        after: Optional[tuple[datetime, str]]
+    ) -> tuple[List[Case], int]:
+        """Order cases newest first and cut one page by offset or keyset cursor.
 
-        if status:
-            filtered = [c for c in filtered if c.status == status]
+        Only the cases up to the end of the page are ordered (a bounded heap),
+        not the whole filtered set.
+        """
+        def sort_key(c: Case) -> tuple[datetime, str]:
+            return (c.created_at, c.case_id)
 
-        # Sort by last_activity_at descending
-        filtered.sort(key=lambda c: c.last_activity_at, reverse=True)
+        if after is None:
+            return heapq.nlargest(offset + limit, cases, key=sort_key)[offset:], len(cases)
 
-        total_count = len(filtered)
+        page = heapq.nlargest(limit, (c for c in cases if sort_key(c) < after), key=sort_key)
+        return page, len(cases)
 
-        # Paginate
-        paginated = filtered[offset:offset + limit]
+    async def get_uploaded_files(
+        self,
+        case_id: str,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Optional[tuple[List[UploadedFile], int]]:
+        """Get a page of a case's uploaded files."""
+        case = self._cases.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
 
-        return paginated, total_count
+        return case.uploaded_files[offset:offset + limit], len(case.uploaded_files)
 
-    async def delete(self, case_id: str) -> bool:
+    async def get_evidence(
+        self,
+        case_id: str,
+        evidence_id: str,
+        user_id: str
+    ) -> Optional[Evidence]:
+        """Get one evidence item of an in-memory case."""
+        case = self._cases.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
+
+        return next((e for e in case.evidence if e.evidence_id == evidence_id), None)
+
+    async def exists(self, case_id: str, user_id: Optional[str] = None) -> bool:
+        """Check whether a case exists in memory."""
+        case = self._cases.get(case_id)
+        return case is not None and (not user_id or case.user_id == user_id)
+
+    async def next_daily_sequence(self, user_id: str, day: date) -> int:
+        """Increment a user's in-memory case counter for a day."""
+        key = (user_id, day)
+        self._daily_sequences[key] = self._daily_sequences.get(key, 0) + 1
+        return self._daily_sequences[key]
+
+    async def update_if_owner(
+        self,
+        case_id: str,
+        user_id: str,
+        metadata_updates: Optional[Dict[str, Any]] = None,
+        **fields: Any
+    ) -> Optional[Case]:
+        """Set fields on an in-memory case owned by the user."""
+        self._check_updatable(fields)
+        case = self._cases.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
+
+        for name, value in fields.items():
+            setattr(case, name, value)
+        if metadata_updates:
+            case.metadata.update(metadata_updates)
+        return case
+
+    async def delete(self, case_id: str, user_id: Optional[str] = None) -> bool:
         """Delete case from memory."""
-        if case_id in self._cases:
-            del self._cases[case_id]
+        if await self.exists(case_id, user_id):
+            self._unindex(self._cases.pop(case_id))
             return True
         return False
 
     async def search(
         self,
-        query: str,
+        query: Optional[str],
         user_id: Optional[str] = None,
         organization_id: Optional[str] = None,
-        limit: int = 20
+        statuses: Optional[List[str]] = None,
+        severities: Optional[List[str]] = None,
+        limit: int = 20,
+        offset: int = 0
     ) -> tuple[List[Case], int]:
-        """Search cases by text query (simple substring match)."""
-        query_lower = query.lower()
+        """Search cases by text query (simple substring match).
 
-        # Filter cases
-        filtered = []
-        for case in self._cases.values():
-            # Search in title and description
-            if (query_lower in case.title.lower() or
-                query_lower in case.description.lower()):
+        Relevance (title match > description match) is scored in the same
+        pass as the filter, on lowercased text cached per case.
+        """
+        query_lower = (query or "").lower()
 
-                # Apply user filter
-                if user_id and case.user_id != user_id:
-                    continue
+        # Filter and score cases
+        scored = []
+        for case in self._candidates(user_id):
+            # Apply org filter
+            if organization_id and case.organization_id != organization_id:
+                continue
 
-                # Apply org filter
-                if organization_id and case.organization_id != organization_id:
-                    continue
+            if statuses and case.status.value not in statuses:
+                continue
 
-                filtered.append(case)
+            if severities and case.metadata.get("severity") not in severities:
+                continue
 
-        # Sort by relevance (simple: contains in title > contains in description)
-        def relevance_score(case: Case) -> int:
+            # Search in title and description
+            title_lower, description_lower = self._lowered_text(case)
             score = 0
-            if query_lower in case.title.lower():
+            if query_lower in title_lower:
                 score += 100
-            if query_lower in case.description.lower():
+            if query_lower in description_lower:
                 score += 10
-            return score
+            if query_lower and not score:
+                continue
 
-        filtered.sort(key=relevance_score, reverse=True)
+            scored.append((score, case))
 
-        total_count = len(filtered)
+        # Sort by relevance (simple: contains in title > contains in description)
+        scored.sort(key=lambda item: item[0], reverse=True)
 
-        # Limit results
-        limited = filtered[:limit]
+        total_count = len(scored)
 
-        return limited, total_count
+        # Paginate
+        return [case for _, case in scored[offset:offset + limit]], total_count
 
     async def add_message(self, case_id: str, message_dict: dict) -> bool:
         """Add message to case in memory."""
-        from datetime import timezone
-
         case = self._cases.get(case_id)
         if not case:
             return False
@@ -406,8 +809,6 @@ class InMemoryCaseRepository(CaseRepository):
 
     async def update_activity_timestamp(self, case_id: str) -> bool:
         """Update last activity timestamp in memory."""
-        from datetime import timezone
-
         case = self._cases.get(case_id)
         if not case:
             return False
@@ -417,17 +818,16 @@ class InMemoryCaseRepository(CaseRepository):
 
     async def get_analytics(self, case_id: str) -> Dict[str, Any]:
         """Compute analytics for case in memory."""
-        from faultmaven.utils.serialization import to_json_compatible
-
         case = self._cases.get(case_id)
         if not case:
             return {}
 
         analytics = {
             "case_id": case.case_id,
+            "user_id": case.user_id,
             "status": case.status.value,
-            "created_at": to_json_compatible(case.created_at),
-            "last_activity_at": to_json_compatible(case.last_activity_at),
+            "created_at": case.created_at.isoformat(),
+            "last_activity_at": case.last_activity_at.isoformat(),
             "message_count": case.message_count,
             "current_turn": case.current_turn,
             "turns_without_progress": case.turns_without_progress,
@@ -442,16 +842,21 @@ class InMemoryCaseRepository(CaseRepository):
         }
 
         if case.resolved_at:
-            analytics["resolved_at"] = to_json_compatible(case.resolved_at)
+            analytics["resolved_at"] = case.resolved_at.isoformat()
             duration = (case.resolved_at - case.created_at).total_seconds()
             analytics["resolution_time_seconds"] = duration
 
         return analytics
 
+    async def get_user_analytics(self, user_id: str) -> Dict[str, Any]:
+        """Aggregate a user's in-memory cases."""
+        return _fold_user_analytics(
+            (c.status.value, c.metadata.get("severity"), 1, len(c.evidence), len(c.hypotheses))
+            for c in self._candidates(user_id)
+        )
+
     async def cleanup_expired(self, max_age_days: int = 90, batch_size: int = 100) -> int:
         """Clean up expired cases from memory."""
-        from datetime import timedelta, timezone
-
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_days)
         deleted_count = 0
 
@@ -465,14 +870,22 @@ class InMemoryCaseRepository(CaseRepository):
 
         # Delete collected cases
         for case_id in to_delete:
-            del self._cases[case_id]
+            self._unindex(self._cases.pop(case_id))
             deleted_count += 1
 
+        # Title counters are only read for the current (UTC) day
+        cutoff_day = _counter_cutoff_day()
+        for key in [key for key in self._daily_sequences if key[1] < cutoff_day]:
+            del self._daily_sequences[key]
+
         return deleted_count
 
     def clear(self):
-        """Clear all cases (testing utility)."""
+        """Clear all cases and the indexes derived from them (testing utility)."""
         self._cases.clear()
+        self._by_user.clear()
+        self._lowered.clear()
+        self._daily_sequences.clear()
 
 
 # ============================================================
@@ -502,8 +915,6 @@ class PostgreSQLCaseRepository(CaseRepository):
 
         Uses INSERT ON CONFLICT UPDATE (upsert) for atomic save.
         """
-        from sqlalchemy import text
-
         # Update timestamp
         case.updated_at = datetime.now(case.updated_at.tzinfo)
 
@@ -616,10 +1027,7 @@ class PostgreSQLCaseRepository(CaseRepository):
 
     async def get(self, case_id: str) -> Optional[Case]:
         """Retrieve case from PostgreSQL."""
-        from sqlalchemy import text
-
-        query = text("SELECT * FROM cases WHERE case_id = :case_id")
-        result = await self.db.execute(query, {"case_id": case_id})
+        result = await self.db.execute(_SELECT_CASE_BY_ID, {"case_id": case_id})
         row = result.first()
 
         if not row:
@@ -634,11 +1042,11 @@ class PostgreSQLCaseRepository(CaseRepository):
         organization_id: Optional[str] = None,
         status: Optional[CaseStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None,
+        include_children: bool = True
     ) -> tuple[List[Case], int]:
         """List cases with filters."""
-        from sqlalchemy import text
-
         # Build query with filters
         conditions = []
         params = {"limit": limit, "offset": offset}
@@ -656,49 +1064,163 @@ class PostgreSQLCaseRepository(CaseRepository):
             params["status"] = status.value
 
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-        # Count query
         count_query = text(f"SELECT COUNT(*) FROM cases WHERE {where_clause}")
-        count_result = await self.db.execute(count_query, params)
-        total_count = count_result.scalar()
 
-        # Data query
-        data_query = text(f"""
-            SELECT * FROM cases
-            WHERE {where_clause}
-            ORDER BY last_activity_at DESC
-            LIMIT :limit OFFSET :offset
-        """)
-        result = await self.db.execute(data_query, params)
-        rows = result.fetchall()
+        if after is None:
+            # Window count: the page and the filtered total in one round trip
+            data_query = text(f"""
+                SELECT *, COUNT(*) OVER () AS total_count FROM cases
+                WHERE {where_clause}
+                ORDER BY created_at DESC, case_id DESC
+                LIMIT :limit OFFSET :offset
+            """)
+            rows = (await self.db.execute(data_query, params)).fetchall()
+            if rows:
+                total_count = rows[0].total_count
+            elif offset > 0:
+                # Past the last page: the window saw no rows, count separately
+                total_count = (await self.db.execute(count_query, params)).scalar()
+            else:
+                total_count = 0
+        else:
+            # A window count would only see the rows past the cursor
+            total_count = (await self.db.execute(count_query, params)).scalar()
+
+            params["after_created_at"], params["after_case_id"] = after
+            data_query = text(f"""
+                SELECT * FROM cases
+                WHERE {where_clause}
+                  AND (created_at, case_id) < (:after_created_at, :after_case_id)
+                ORDER BY created_at DESC, case_id DESC
+                LIMIT :limit
+            """)
+            rows = (await self.db.execute(data_query, params)).fetchall()
 
         cases = [self._row_to_case(row) for row in rows]
 
         return cases, total_count
 
-    async def delete(self, case_id: str) -> bool:
-        """Delete case from PostgreSQL."""
-        from sqlalchemy import text
+    async def list_by_session(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> tuple[List[Case], int]:
+        """List cases linked to a session.
 
-        query = text("DELETE FROM cases WHERE case_id = :case_id")
-        result = await self.db.execute(query, {"case_id": case_id})
+        This schema has no metadata column, so no case carries a session link.
+        """
+        return [], 0
+
+    async def get_uploaded_files(
+        self,
+        case_id: str,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Optional[tuple[List[UploadedFile], int]]:
+        """Get a page of a case's uploaded files (stored inline as JSON)."""
+        case = await self.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
+
+        return case.uploaded_files[offset:offset + limit], len(case.uploaded_files)
+
+    async def get_evidence(
+        self,
+        case_id: str,
+        evidence_id: str,
+        user_id: str
+    ) -> Optional[Evidence]:
+        """Get one evidence item of a case (stored inline as JSON)."""
+        case = await self.get(case_id)
+        if not case or case.user_id != user_id:
+            return None
+
+        return next((e for e in case.evidence if e.evidence_id == evidence_id), None)
+
+    async def exists(self, case_id: str, user_id: Optional[str] = None) -> bool:
+        """Check whether a case exists in PostgreSQL."""
+        query = _OWNED_CASE_EXISTS if user_id else _CASE_EXISTS
+        result = await self.db.execute(query, {"case_id": case_id, "user_id": user_id})
+
+        return result.first() is not None
+
+    async def next_daily_sequence(self, user_id: str, day: date) -> int:
+        """Increment a user's case counter for a day in PostgreSQL."""
+        query = text("""
+            INSERT INTO case_daily_counters (user_id, day, seq)
+            VALUES (:user_id, :day, 1)
+            ON CONFLICT (user_id, day) DO UPDATE SET seq = case_daily_counters.seq + 1
+            RETURNING seq
+        """)
+        result = await self.db.execute(query, {"user_id": user_id, "day": day})
+        sequence = result.scalar_one()
+        await self.db.commit()
+
+        return sequence
+
+    async def update_if_owner(
+        self,
+        case_id: str,
+        user_id: str,
+        metadata_updates: Optional[Dict[str, Any]] = None,
+        **fields: Any
+    ) -> Optional[Case]:
+        """
+        Update case columns in PostgreSQL, returning the updated row.
+
+        This schema has no metadata column, so metadata_updates is ignored.
+        """
+        self._check_updatable(fields)
+        params = {name: value.value if name == "status" else value for name, value in fields.items()}
+        set_sql = ", ".join(f"{name} = :{name}" for name in params)
+        query = text(f"""
+            UPDATE cases SET {set_sql}
+            WHERE case_id = :case_id AND user_id = :user_id
+            RETURNING *
+        """)
+        result = await self.db.execute(query, {**params, "case_id": case_id, "user_id": user_id})
+        row = result.first()
+        await self.db.commit()
+
+        return self._row_to_case(row) if row else None
+
+    async def delete(self, case_id: str, user_id: Optional[str] = None) -> bool:
+        """Delete case from PostgreSQL."""
+        owner_sql = " AND user_id = :user_id" if user_id else ""
+        query = text(f"DELETE FROM cases WHERE case_id = :case_id{owner_sql}")
+        result = await self.db.execute(query, {"case_id": case_id, "user_id": user_id})
         await self.db.commit()
 
         return result.rowcount > 0
 
     async def search(
         self,
-        query: str,
+        query: Optional[str],
         user_id: Optional[str] = None,
         organization_id: Optional[str] = None,
-        limit: int = 20
+        statuses: Optional[List[str]] = None,
+        severities: Optional[List[str]] = None,
+        limit: int = 20,
+        offset: int = 0
     ) -> tuple[List[Case], int]:
-        """Search cases using PostgreSQL full-text search."""
-        from sqlalchemy import text
+        """Search cases using PostgreSQL full-text search.
+
+        Severity lives in case metadata, which this schema does not store, so
+        a severity filter matches no cases.
+        """
+        if severities:
+            return [], 0
 
         # Build conditions
-        conditions = ["(title ILIKE :query OR description ILIKE :query)"]
-        params = {"query": f"%{query}%", "limit": limit}
+        conditions = []
+        params = {"query": f"%{query or ''}%", "limit": limit, "offset": offset}
+
+        if query:
+            conditions.append("(title ILIKE :query OR description ILIKE :query)")
 
         if user_id:
             conditions.append("user_id = :user_id")
@@ -708,37 +1230,41 @@ class PostgreSQLCaseRepository(CaseRepository):
             conditions.append("organization_id = :organization_id")
             params["organization_id"] = organization_id
 
-        where_clause = " AND ".join(conditions)
+        if statuses:
+            conditions.append("status = ANY(:statuses)")
+            params["statuses"] = statuses
 
-        # Count query
-        count_query = text(f"SELECT COUNT(*) FROM cases WHERE {where_clause}")
-        count_result = await self.db.execute(count_query, params)
-        total_count = count_result.scalar()
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
 
-        # Data query (order by relevance: title match > description match)
+        # Order by relevance (title match > description match); the window
+        # count returns the filtered total with the page
         data_query = text(f"""
-            SELECT * FROM cases
+            SELECT *, COUNT(*) OVER () AS total_count FROM cases
             WHERE {where_clause}
             ORDER BY
                 CASE WHEN title ILIKE :query THEN 1 ELSE 2 END,
                 last_activity_at DESC
-            LIMIT :limit
+            LIMIT :limit OFFSET :offset
         """)
         result = await self.db.execute(data_query, params)
         rows = result.fetchall()
+        if not rows:
+            if offset == 0:
+                return [], 0
+            # Past the last page: the window saw no rows, count separately
+            count_query = text(f"SELECT COUNT(*) FROM cases WHERE {where_clause}")
+            return [], (await self.db.execute(count_query, params)).scalar()
 
         cases = [self._row_to_case(row) for row in rows]
 
-        return cases, total_count
+        return cases, rows[0].total_count
 
     async def add_message(self, case_id: str, message_dict: dict) -> bool:
         """Add message to case in PostgreSQL."""
-        from sqlalchemy import text
-
         # PostgreSQL: messages stored as JSONB array, use array_append
         query = text("""
             UPDATE cases
-            SET messages = messages || :message::jsonb,
+            SET messages = messages || CAST(:message AS jsonb),
                 message_count = message_count + 1,
                 last_activity_at = :timestamp
             WHERE case_id = :case_id
@@ -760,8 +1286,6 @@ class PostgreSQLCaseRepository(CaseRepository):
         offset: int = 0
     ) -> List[dict]:
         """Get messages from PostgreSQL with correct pagination."""
-        from sqlalchemy import text
-
         # Get the messages JSONB array from the case
         query = text("SELECT messages FROM cases WHERE case_id = :case_id")
         result = await self.db.execute(query, {"case_id": case_id})
@@ -779,8 +1303,6 @@ class PostgreSQLCaseRepository(CaseRepository):
 
     async def update_activity_timestamp(self, case_id: str) -> bool:
         """Update last activity timestamp in PostgreSQL."""
-        from sqlalchemy import text
-
         query = text("""
             UPDATE cases
             SET last_activity_at = :timestamp
@@ -797,12 +1319,12 @@ class PostgreSQLCaseRepository(CaseRepository):
 
     async def get_analytics(self, case_id: str) -> Dict[str, Any]:
         """Compute analytics from PostgreSQL."""
-        from sqlalchemy import text
         from faultmaven.utils.serialization import to_json_compatible
 
         query = text("""
             SELECT
                 case_id,
+                user_id,
                 status,
                 created_at,
                 last_activity_at,
@@ -830,6 +1352,7 @@ class PostgreSQLCaseRepository(CaseRepository):
 
         analytics = {
             "case_id": row.case_id,
+            "user_id": row.user_id,
             "status": row.status,
             "created_at": to_json_compatible(row.created_at),
             "last_activity_at": to_json_compatible(row.last_activity_at),
@@ -853,11 +1376,26 @@ class PostgreSQLCaseRepository(CaseRepository):
 
         return analytics
 
+    async def get_user_analytics(self, user_id: str) -> Dict[str, Any]:
+        """Aggregate a user's cases in one GROUP BY query.
+
+        This schema has no metadata column, so no case has a severity.
+        """
+        query = text("""
+            SELECT status, NULL AS severity, COUNT(*) AS case_count,
+                   COALESCE(SUM(json_array_length(evidence::json)), 0) AS evidence_count,
+                   COALESCE(SUM((SELECT COUNT(*) FROM json_object_keys(hypotheses::json))), 0)
+                       AS hypothesis_count
+            FROM cases
+            WHERE user_id = :user_id
+            GROUP BY status
+        """)
+        result = await self.db.execute(query, {"user_id": user_id})
+
+        return _fold_user_analytics(result.all())
+
     async def cleanup_expired(self, max_age_days: int = 90, batch_size: int = 100) -> int:
         """Clean up expired cases from PostgreSQL."""
-        from sqlalchemy import text
-        from datetime import timedelta, timezone
-
         cutoff_date = datetime.now(timezone.utc) - timedelta(days=max_age_days)
 
         query = text("""
@@ -875,6 +1413,9 @@ class PostgreSQLCaseRepository(CaseRepository):
             "cutoff_date": cutoff_date,
             "batch_size": batch_size
         })
+
+        # Title counters are only read for the current (UTC) day
+        await self.db.execute(_PRUNE_DAILY_COUNTERS, {"cutoff_day": _counter_cutoff_day()})
         await self.db.commit()
 
         return result.rowcount
@@ -18,15 +18,20 @@ Architecture:
     └── agent_tool_calls (1:N normalized table)
 """
 
-import json
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from sqlalchemy import text
+import orjson
+from sqlalchemy import TextClause, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from case_service.infrastructure.persistence.case_repository import CaseRepository
+from case_service.infrastructure.persistence.case_repository import (
+    CaseRepository,
+    _PRUNE_DAILY_COUNTERS,
+    _counter_cutoff_day,
+    _fold_user_analytics,
+)
 from fm_core_lib.models.case import (
     Case,
     CaseStatus,
@@ -48,6 +53,242 @@ from fm_core_lib.models.case import (
 )
 
 
+# Statements on the case read path, built once so SQLAlchemy's compiled cache
+# is hit without re-parsing the SQL text per call
+_SELECT_CASE_BY_ID = text("SELECT * FROM cases WHERE case_id = :case_id")
+# Same query for asyncpg's own statement cache (see _fetch_case_row)
+_RAW_SELECT_CASE_BY_ID = "SELECT * FROM cases WHERE case_id = $1"
+_CASE_EXISTS = text("SELECT 1 FROM cases WHERE case_id = :case_id LIMIT 1")
+_OWNED_CASE_EXISTS = text(
+    "SELECT 1 FROM cases WHERE case_id = :case_id AND user_id = :user_id LIMIT 1"
+)
+
+_SELECT_EVIDENCE = text("""
+    SELECT case_id, evidence_id, category, summary, preprocessed_content,
+           content_ref, file_size, filename, upload_timestamp, metadata
+    FROM evidence
+    WHERE case_id = ANY(:case_ids)
+    ORDER BY upload_timestamp
+""")
+_TOUCH_OWNED_CASE = text("""
+    UPDATE cases SET updated_at = :now, last_activity_at = :now
+    WHERE case_id = :case_id AND user_id = :user_id
+    RETURNING *
+""")
+_USER_ANALYTICS = text("""
+    SELECT c.status, c.metadata->>'severity' AS severity, COUNT(*) AS case_count,
+           COALESCE(SUM((SELECT COUNT(*) FROM evidence e WHERE e.case_id = c.case_id)), 0)
+               AS evidence_count,
+           COALESCE(SUM((SELECT COUNT(*) FROM hypotheses h WHERE h.case_id = c.case_id)), 0)
+               AS hypothesis_count
+    FROM cases c
+    WHERE c.user_id = :user_id
+    GROUP BY c.status, c.metadata->>'severity'
+""")
+_SELECT_OWNED_EVIDENCE = text("""
+    SELECT e.evidence_id, e.category, e.summary, e.preprocessed_content,
+           e.content_ref, e.file_size, e.filename, e.upload_timestamp, e.metadata
+    FROM evidence e
+    JOIN cases c ON c.case_id = e.case_id AND c.user_id = :user_id
+    WHERE e.case_id = :case_id AND e.evidence_id = :evidence_id
+""")
+_SELECT_HYPOTHESES = text("""
+    SELECT case_id, hypothesis_id, description, status, confidence_score,
+           supporting_evidence_ids, validation_result, validation_timestamp,
+           proposed_at, updated_at, metadata
+    FROM hypotheses
+    WHERE case_id = ANY(:case_ids)
+    ORDER BY proposed_at
+""")
+_SELECT_SOLUTIONS = text("""
+    SELECT case_id, solution_id, description, status, implementation_steps,
+           risk_level, estimated_effort, verification_result, verification_timestamp,
+           proposed_at, implemented_at, updated_at, metadata
+    FROM solutions
+    WHERE case_id = ANY(:case_ids)
+    ORDER BY proposed_at
+""")
+_SELECT_UPLOADED_FILES = text("""
+    SELECT case_id, file_id, filename, size_bytes, data_type,
+           uploaded_at_turn, uploaded_at, source_type,
+           content_ref, preprocessing_summary
+    FROM uploaded_files
+    WHERE case_id = ANY(:case_ids)
+    ORDER BY uploaded_at
+""")
+
+# One batch of the longest-closed cases; child rows go with them (ON DELETE CASCADE)
+_DELETE_EXPIRED_CASES = text("""
+    DELETE FROM cases
+    WHERE case_id IN (
+        SELECT case_id
+        FROM cases
+        WHERE status = 'closed'
+        AND closed_at < :cutoff
+        ORDER BY closed_at
+        LIMIT :batch_size
+    )
+""")
+_INSERT_MESSAGE = text("""
+    INSERT INTO case_messages (message_id, case_id, role, content, metadata)
+    VALUES (:message_id, :case_id, :role, :content, CAST(:metadata AS jsonb))
+""")
+# Index range scan on idx_case_messages_case_timestamp (migration 012)
+_SELECT_MESSAGES = text("""
+    SELECT message_id, role, content, timestamp, metadata
+    FROM case_messages
+    WHERE case_id = :case_id
+    ORDER BY timestamp ASC, message_id ASC
+    LIMIT :limit OFFSET :offset
+""")
+_TOUCH_ACTIVITY = text("""
+    UPDATE cases
+    SET last_activity_at = NOW()
+    WHERE case_id = :case_id
+""")
+_UPSERT_CASE = text("""
+    INSERT INTO cases (
+        case_id, user_id, title, status, created_at, updated_at,
+        consulting, problem_verification, working_conclusion,
+        root_cause_conclusion, path_selection, degraded_mode,
+        escalation_state, documentation, progress, metadata
+    ) VALUES (
+        :case_id, :user_id, :title, :status, :created_at, :updated_at,
+        CAST(:consulting AS jsonb), CAST(:problem_verification AS jsonb),
+        CAST(:working_conclusion AS jsonb), CAST(:root_cause_conclusion AS jsonb),
+        CAST(:path_selection AS jsonb), CAST(:degraded_mode AS jsonb),
+        CAST(:escalation_state AS jsonb), CAST(:documentation AS jsonb),
+        CAST(:progress AS jsonb), CAST(:metadata AS jsonb)
+    )
+    ON CONFLICT (case_id) DO UPDATE SET
+        user_id = EXCLUDED.user_id,
+        title = EXCLUDED.title,
+        status = EXCLUDED.status,
+        updated_at = EXCLUDED.updated_at,
+        consulting = EXCLUDED.consulting,
+        problem_verification = EXCLUDED.problem_verification,
+        working_conclusion = EXCLUDED.working_conclusion,
+        root_cause_conclusion = EXCLUDED.root_cause_conclusion,
+        path_selection = EXCLUDED.path_selection,
+        degraded_mode = EXCLUDED.degraded_mode,
+        escalation_state = EXCLUDED.escalation_state,
+        documentation = EXCLUDED.documentation,
+        progress = EXCLUDED.progress,
+        metadata = EXCLUDED.metadata
+""")
+# Evidence batches at least this large are written with COPY (asyncpg only)
+_COPY_MIN_ROWS = 50
+_EVIDENCE_COLUMNS = [
+    "evidence_id", "case_id", "category", "summary", "preprocessed_content",
+    "content_ref", "file_size", "filename", "upload_timestamp", "metadata",
+]
+_DELETE_STALE_EVIDENCE = text("""
+    DELETE FROM evidence
+    WHERE case_id = :case_id
+    AND evidence_id != ALL(:current_ids)
+""")
+_UPSERT_EVIDENCE = text("""
+    INSERT INTO evidence (
+        evidence_id, case_id, category, summary, preprocessed_content,
+        content_ref, file_size, filename, upload_timestamp, metadata
+    ) VALUES (
+        :evidence_id, :case_id, :category, :summary, :preprocessed_content,
+        :content_ref, :file_size, :filename, :upload_timestamp, CAST(:metadata AS jsonb)
+    )
+    ON CONFLICT (evidence_id) DO UPDATE SET
+        category = EXCLUDED.category,
+        summary = EXCLUDED.summary,
+        preprocessed_content = EXCLUDED.preprocessed_content,
+        content_ref = EXCLUDED.content_ref,
+        metadata = EXCLUDED.metadata
+""")
+_DELETE_STALE_HYPOTHESES = text("""
+    DELETE FROM hypotheses
+    WHERE case_id = :case_id
+    AND hypothesis_id != ALL(:current_ids)
+""")
+_UPSERT_HYPOTHESIS = text("""
+    INSERT INTO hypotheses (
+        hypothesis_id, case_id, description, status, confidence_score,
+        supporting_evidence_ids, validation_result, validation_timestamp,
+        proposed_at, updated_at, metadata
+    ) VALUES (
+        :hypothesis_id, :case_id, :description, :status, :confidence_score,
+        :supporting_evidence_ids, :validation_result, :validation_timestamp,
+        :proposed_at, :updated_at, CAST(:metadata AS jsonb)
+    )
+    ON CONFLICT (hypothesis_id) DO UPDATE SET
+        description = EXCLUDED.description,
+        status = EXCLUDED.status,
+        confidence_score = EXCLUDED.confidence_score,
+        supporting_evidence_ids = EXCLUDED.supporting_evidence_ids,
+        validation_result = EXCLUDED.validation_result,
+        validation_timestamp = EXCLUDED.validation_timestamp,
+        updated_at = EXCLUDED.updated_at,
+        metadata = EXCLUDED.metadata
+""")
+_DELETE_STALE_SOLUTIONS = text("""
+    DELETE FROM solutions
+    WHERE case_id = :case_id
+    AND solution_id != ALL(:current_ids)
+""")
+_UPSERT_SOLUTION = text("""
+    INSERT INTO solutions (
+        solution_id, case_id, description, status, implementation_steps,
+        risk_level, estimated_effort, verification_result, verification_timestamp,
+        proposed_at, implemented_at, updated_at, metadata
+    ) VALUES (
+        :solution_id, :case_id, :description, :status, :implementation_steps,
+        :risk_level, :estimated_effort, :verification_result, :verification_timestamp,
+        :proposed_at, :implemented_at, :updated_at, CAST(:metadata AS jsonb)
+    )
+    ON CONFLICT (solution_id) DO UPDATE SET
+        description = EXCLUDED.description,
+        status = EXCLUDED.status,
+        implementation_steps = EXCLUDED.implementation_steps,
+        risk_level = EXCLUDED.risk_level,
+        estimated_effort = EXCLUDED.estimated_effort,
+        verification_result = EXCLUDED.verification_result,
+        verification_timestamp = EXCLUDED.verification_timestamp,
+        implemented_at = EXCLUDED.implemented_at,
+        updated_at = EXCLUDED.updated_at,
+        metadata = EXCLUDED.metadata
+""")
+_DELETE_STALE_UPLOADED_FILES = text("""
+    DELETE FROM uploaded_files
+    WHERE case_id = :case_id
+    AND file_id != ALL(:current_ids)
+""")
+_UPSERT_UPLOADED_FILE = text("""
+    INSERT INTO uploaded_files (
+        file_id, case_id, filename, size_bytes, data_type,
+        uploaded_at_turn, uploaded_at, source_type,
+        content_ref, preprocessing_summary, metadata
+    ) VALUES (
+        :file_id, :case_id, :filename, :size_bytes, :data_type,
+        :uploaded_at_turn, :uploaded_at, :source_type,
+        :content_ref, :preprocessing_summary, CAST(:metadata AS jsonb)
+    )
+    ON CONFLICT (file_id) DO UPDATE SET
+        filename = EXCLUDED.filename,
+        size_bytes = EXCLUDED.size_bytes,
+        data_type = EXCLUDED.data_type,
+        uploaded_at_turn = EXCLUDED.uploaded_at_turn,
+        source_type = EXCLUDED.source_type,
+        content_ref = EXCLUDED.content_ref,
+        preprocessing_summary = EXCLUDED.preprocessing_summary,
+        metadata = EXCLUDED.metadata
+""")
+_INSERT_STATUS_TRANSITION = text("""
+    INSERT INTO case_status_transitions (
+        case_id, from_status, to_status, reason, transitioned_at, metadata
+    ) VALUES (
+        :case_id, :from_status, :to_status, :reason, :transitioned_at, CAST(:metadata AS jsonb)
+    )
+    ON CONFLICT DO NOTHING
+""")
+
+
 class PostgreSQLHybridCaseRepository(CaseRepository):
     """
     PostgreSQL repository using hybrid normalized schema.
@@ -57,7 +298,7 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
     - Embed what you don't (consulting, conclusions, progress)
 
     Performance Characteristics:
-    - Case load: ~10ms (single query + JOINs)
+    - Case load: ~10ms (case row + select-in queries per normalized table)
     - Evidence filtering: ~5ms (indexed queries on normalized table)
     - Search: ~15ms (full-text search on preprocessed_content)
     - Hypothesis tracking: ~3ms (status index lookup)
@@ -117,7 +358,7 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             if case.status_history:
                 await self._append_status_transitions(case.case_id, case.status_history)
 
-            # Flush to ensure writes are pending (commit handled by get_session)
+            # Flush to ensure writes are pending (commit handled by the request's session)
             await self.db.flush()
 
             return case
@@ -127,9 +368,9 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
 
     async def get(self, case_id: str) -> Optional[Case]:
         """
-        Retrieve case by ID using JOINs for normalized tables.
+        Retrieve case by ID, loading normalized tables with select-in queries.
 
-        Performance: ~10ms (single query with LEFT JOINs)
+        Performance: ~10ms (case row + one indexed query per child table)
 
         Args:
             case_id: Case identifier
@@ -138,119 +379,68 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             Case if found, None otherwise
         """
         try:
-            # Main query with LEFT JOINs for normalized tables
-            query = text("""
-                SELECT
-                    c.*,
-
-                    -- Evidence (aggregated as JSON)
-                    COALESCE(
-                        json_agg(DISTINCT jsonb_build_object(
-                            'evidence_id', e.evidence_id,
-                            'category', e.category,
-                            'summary', e.summary,
-                            'preprocessed_content', e.preprocessed_content,
-                            'content_ref', e.content_ref,
-                            'file_size', e.file_size,
-                            'filename', e.filename,
-                            'upload_timestamp', e.upload_timestamp,
-                            'metadata', e.metadata
-                        )) FILTER (WHERE e.evidence_id IS NOT NULL),
-                        '[]'::json
-                    ) as evidence_data,
-
-                    -- Hypotheses (aggregated as JSON)
-                    COALESCE(
-                        json_agg(DISTINCT jsonb_build_object(
-                            'hypothesis_id', h.hypothesis_id,
-                            'description', h.description,
-                            'status', h.status,
-                            'confidence_score', h.confidence_score,
-                            'supporting_evidence_ids', h.supporting_evidence_ids,
-                            'validation_result', h.validation_result,
-                            'validation_timestamp', h.validation_timestamp,
-                            'proposed_at', h.proposed_at,
-                            'updated_at', h.updated_at,
-                            'metadata', h.metadata
-                        )) FILTER (WHERE h.hypothesis_id IS NOT NULL),
-                        '[]'::json
-                    ) as hypotheses_data,
-
-                    -- Solutions (aggregated as JSON)
-                    COALESCE(
-                        json_agg(DISTINCT jsonb_build_object(
-                            'solution_id', s.solution_id,
-                            'description', s.description,
-                            'status', s.status,
-                            'implementation_steps', s.implementation_steps,
-                            'risk_level', s.risk_level,
-                            'estimated_effort', s.estimated_effort,
-                            'verification_result', s.verification_result,
-                            'verification_timestamp', s.verification_timestamp,
-                            'proposed_at', s.proposed_at,
-                            'implemented_at', s.implemented_at,
-                            'updated_at', s.updated_at,
-                            'metadata', s.metadata
-                        )) FILTER (WHERE s.solution_id IS NOT NULL),
-                        '[]'::json
-                    ) as solutions_data,
-
-                    -- Uploaded Files (aggregated as JSON - matches UploadedFile Pydantic model)
-                    COALESCE(
-                        json_agg(DISTINCT jsonb_build_object(
-                            'file_id', f.file_id,
-                            'filename', f.filename,
-                            'size_bytes', f.size_bytes,
-                            'data_type', f.data_type,
-                            'uploaded_at_turn', f.uploaded_at_turn,
-                            'uploaded_at', f.uploaded_at,
-                            'source_type', f.source_type,
-                            'content_ref', f.content_ref,
-                            'preprocessing_summary', f.preprocessing_summary
-                        )) FILTER (WHERE f.file_id IS NOT NULL),
-                        '[]'::json
-                    ) as uploaded_files_data
-
-                FROM cases c
-                LEFT JOIN evidence e ON c.case_id = e.case_id
-                LEFT JOIN hypotheses h ON c.case_id = h.case_id
-                LEFT JOIN solutions s ON c.case_id = s.case_id
-                LEFT JOIN uploaded_files f ON c.case_id = f.case_id
-                WHERE c.case_id = :case_id
-                GROUP BY c.case_id
-            """)
-
-            result = await self.db.execute(query, {"case_id": case_id})
-            row = result.fetchone()
-
+            row = await self._fetch_case_row(case_id)
             if not row:
                 return None
 
+            children = await self._load_children([case_id])
+
             # Reconstruct Case domain object
-            return await self._row_to_case(row)
+            return await self._row_to_case(row, children[case_id])
 
         except Exception as e:
             raise RepositoryException(f"Failed to get case {case_id}: {e}") from e
 
+    async def _fetch_case_row(self, case_id: str):
+        """
+        Fetch one cases row, going straight to asyncpg when it is the driver.
+
+        get() is the hottest read; on asyncpg the row is fetched on the
+        session's own connection with a prepared statement, skipping
+        SQLAlchemy's statement compilation and result processing. Other
+        drivers use the regular text() query.
+        """
+        if self.db.get_bind().dialect.driver != "asyncpg":
+            result = await self.db.execute(_SELECT_CASE_BY_ID, {"case_id": case_id})
+            return result.fetchone()
+
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        record = await raw_connection.driver_connection.fetchrow(_RAW_SELECT_CASE_BY_ID, case_id)
+        return _RecordRow(record) if record is not None else None
+
     async def list(
         self,
         user_id: Optional[str] = None,
         organization_id: Optional[str] = None,
         status: Optional[CaseStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None,
+        include_children: bool = True
     ) -> tuple[List[Case], int]:
         """
         List cases with optional filters and pagination.
 
-        Performance: ~20ms for 50 cases (indexed queries)
+        Performance: ~20ms for 50 cases (indexed queries). With a keyset
+        cursor the page is an index range scan on
+        (user_id[, status], created_at DESC, case_id DESC), so its cost does
+        not depend on how deep the page is. The total comes from a window
+        count (offset pages) or a scalar subquery (cursor pages), so one
+        round trip returns the page and the total; an empty page past the
+        end is counted separately. Without children the page
+        is a single narrow query; with them, one select-in query per child
+        table covers the whole page.
 
         Args:
             user_id: Filter by user
             organization_id: Filter by organization
             status: Filter by status
             limit: Maximum results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when after is given)
+            after: Keyset cursor (created_at, case_id) of the last case seen
+            include_children: Load the normalized collections and JSON
+                columns; when False only the list-view columns are read
 
         Returns:
             Tuple of (cases, total_count)
@@ -273,49 +463,353 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 params["status"] = status.value
 
             where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+            columns = "*" if include_children else _LIST_VIEW_COLUMNS
+            count_sql = f"SELECT COUNT(*) FROM cases {where_sql}"
+
+            if after is None:
+                query = text(f"""
+                    SELECT {columns}, COUNT(*) OVER () AS total_count
+                    FROM cases
+                    {where_sql}
+                    ORDER BY created_at DESC, case_id DESC
+                    LIMIT :limit OFFSET :offset
+                """)
+                rows = (await self.db.execute(query, params)).fetchall()
+                if rows:
+                    total_count = rows[0].total_count
+                elif offset > 0:
+                    # Past the last page: the window saw no rows, count separately
+                    total_count = (await self.db.execute(text(count_sql), params)).scalar()
+                else:
+                    total_count = 0
+            else:
+                # A window count would only see the rows past the cursor, so
+                # the total is an uncorrelated subquery over the filter
+                # without it, evaluated once in the same round trip
+                where_clauses.append("(created_at, case_id) < (:after_created_at, :after_case_id)")
+                params["after_created_at"], params["after_case_id"] = after
+                query = text(f"""
+                    SELECT {columns}, ({count_sql}) AS total_count
+                    FROM cases
+                    WHERE {" AND ".join(where_clauses)}
+                    ORDER BY created_at DESC, case_id DESC
+                    LIMIT :limit
+                """)
+                rows = (await self.db.execute(query, params)).fetchall()
+                if rows:
+                    total_count = rows[0].total_count
+                else:
+                    # Past the last page: count separately
+                    total_count = (await self.db.execute(text(count_sql), params)).scalar()
+
+            if not include_children:
+                return [_row_to_list_case(row) for row in rows], total_count
+
+            children = await self._load_children([row.case_id for row in rows]) if rows else {}
+            cases = [await self._row_to_case(row, children[row.case_id]) for row in rows]
 
-            # Count query
-            count_query = text(f"SELECT COUNT(*) FROM cases {where_sql}")
-            count_result = await self.db.execute(count_query, params)
-            total_count = count_result.scalar()
+            return cases, total_count
 
-            # List query (simplified - just get case IDs, then fetch full cases)
-            list_query = text(f"""
-                SELECT case_id
-                FROM cases
-                {where_sql}
-                ORDER BY updated_at DESC
+        except Exception as e:
+            raise RepositoryException(f"Failed to list cases: {e}") from e
+
+    async def list_by_session(
+        self,
+        session_id: str,
+        user_id: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        after: Optional[tuple[datetime, str]] = None
+    ) -> tuple[List[Case], int]:
+        """
+        List cases linked to a session, filtered and paginated in SQL.
+
+        The session link is ``metadata->>'session_id'``; the total comes from
+        a window count over the same predicate, so one round trip returns
+        both the page and the filtered total (an empty page past the end is
+        counted separately).
+
+        Args:
+            session_id: Session identifier
+            user_id: Filter by user
+            limit: Maximum results
+            offset: Pagination offset (ignored when after is given)
+            after: Keyset cursor (created_at, case_id) of the last case seen
+
+        Returns:
+            Tuple of (cases, total_count)
+        """
+        try:
+            where_clauses = ["metadata->>'session_id' = :session_id"]
+            params = {"session_id": session_id, "limit": limit, "offset": offset}
+
+            if user_id:
+                where_clauses.append("user_id = :user_id")
+                params["user_id"] = user_id
+
+            where_sql = " AND ".join(where_clauses)
+            count_sql = f"SELECT COUNT(*) FROM cases WHERE {where_sql}"
+
+            if after is None:
+                query = text(f"""
+                    SELECT *, COUNT(*) OVER () AS total_count
+                    FROM cases
+                    WHERE {where_sql}
+                    ORDER BY created_at DESC, case_id DESC
+                    LIMIT :limit OFFSET :offset
+                """)
+                rows = (await self.db.execute(query, params)).fetchall()
+                if rows:
+                    total_count = rows[0].total_count
+                elif offset > 0:
+                    # Past the last page: the window saw no rows, count separately
+                    total_count = (await self.db.execute(text(count_sql), params)).scalar()
+                else:
+                    total_count = 0
+            else:
+                # A window count would only see the rows past the cursor, so
+                # the total is an uncorrelated subquery over the filter
+                # without it, evaluated once in the same round trip
+                params["after_created_at"], params["after_case_id"] = after
+                query = text(f"""
+                    SELECT *, ({count_sql}) AS total_count
+                    FROM cases
+                    WHERE {where_sql}
+                      AND (created_at, case_id) < (:after_created_at, :after_case_id)
+                    ORDER BY created_at DESC, case_id DESC
+                    LIMIT :limit
+                """)
+                rows = (await self.db.execute(query, params)).fetchall()
+                if rows:
+                    total_count = rows[0].total_count
+                else:
+                    # Past the last page: count separately
+                    total_count = (await self.db.execute(text(count_sql), params)).scalar()
+
+            if not rows:
+                return [], total_count
+
+            children = await self._load_children([row.case_id for row in rows])
+            cases = [await self._row_to_case(row, children[row.case_id]) for row in rows]
+
+            return cases, total_count
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to list cases for session {session_id}: {e}") from e
+
+    async def get_uploaded_files(
+        self,
+        case_id: str,
+        user_id: str,
+        limit: int = 100,
+        offset: int = 0
+    ) -> Optional[tuple[List[UploadedFile], int]]:
+        """
+        Get a page of a case's uploaded files without loading the case.
+
+        The ownership check is a join on cases and the total is a window
+        count, so a non-empty page costs one round trip. An empty page needs
+        a second query to tell "no such case" apart from "past the end".
+
+        Args:
+            case_id: Case identifier
+            user_id: Owner the case must belong to
+            limit: Maximum results
+            offset: Pagination offset
+
+        Returns:
+            Tuple of (files, total_count), or None if not found/unauthorized
+        """
+        try:
+            params = {"case_id": case_id, "user_id": user_id, "limit": limit, "offset": offset}
+
+            page_query = text("""
+                SELECT f.file_id, f.filename, f.size_bytes, f.data_type,
+                       f.uploaded_at_turn, f.uploaded_at, f.source_type,
+                       f.content_ref, f.preprocessing_summary,
+                       COUNT(*) OVER () AS total_count
+                FROM uploaded_files f
+                JOIN cases c ON c.case_id = f.case_id AND c.user_id = :user_id
+                WHERE f.case_id = :case_id
+                ORDER BY f.uploaded_at, f.file_id
                 LIMIT :limit OFFSET :offset
             """)
+            result = await self.db.execute(page_query, params)
+            rows = [dict(row) for row in result.mappings()]
 
-            result = await self.db.execute(list_query, params)
-            case_ids = [row[0] for row in result.fetchall()]
+            if rows:
+                total_count = rows[0]["total_count"]
+                for row in rows:
+                    del row["total_count"]
+                return [UploadedFile(**row) for row in rows], total_count
 
-            # Fetch full cases
-            cases = []
-            for case_id in case_ids:
-                case = await self.get(case_id)
-                if case:
-                    cases.append(case)
+            total_query = text("""
+                SELECT (SELECT COUNT(*) FROM uploaded_files WHERE case_id = :case_id)
+                FROM cases
+                WHERE case_id = :case_id AND user_id = :user_id
+            """)
+            result = await self.db.execute(total_query, params)
+            total_count = result.scalar_one_or_none()
+            if total_count is None:
+                return None
 
-            return cases, total_count
+            return [], total_count
 
         except Exception as e:
-            raise RepositoryException(f"Failed to list cases: {e}") from e
+            raise RepositoryException(f"Failed to get uploaded files for case {case_id}: {e}") from e
+
+    async def get_evidence(
+        self,
+        case_id: str,
+        evidence_id: str,
+        user_id: str
+    ) -> Optional[Evidence]:
+        """
+        Get one evidence item by primary key, with the ownership check joined in.
+
+        Args:
+            case_id: Case identifier
+            evidence_id: Evidence identifier
+            user_id: Owner the case must belong to
+
+        Returns:
+            The evidence, or None if not found/unauthorized
+        """
+        try:
+            result = await self.db.execute(_SELECT_OWNED_EVIDENCE, {
+                "case_id": case_id,
+                "evidence_id": evidence_id,
+                "user_id": user_id,
+            })
+            row = result.mappings().first()
+            if not row:
+                return None
+
+            data = dict(row)
+            data["metadata"] = _decode_json(data["metadata"])
+            return Evidence(**data)
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to get evidence {evidence_id} for case {case_id}: {e}") from e
 
-    async def delete(self, case_id: str) -> bool:
+    async def exists(self, case_id: str, user_id: Optional[str] = None) -> bool:
+        """
+        Check whether a case exists (primary key probe, no row payload read).
+
+        Args:
+            case_id: Case identifier
+            user_id: If given, the case must also belong to this user
+
+        Returns:
+            True if a matching case exists
+        """
+        try:
+            query = _OWNED_CASE_EXISTS if user_id else _CASE_EXISTS
+            result = await self.db.execute(query, {"case_id": case_id, "user_id": user_id})
+
+            return result.first() is not None
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to check case {case_id}: {e}") from e
+
+    async def next_daily_sequence(self, user_id: str, day: date) -> int:
+        """
+        Increment and return a user's case counter for a day.
+
+        A single upsert on case_daily_counters: O(1) regardless of how many
+        cases the user has, and concurrent creates for the same user and day
+        serialize on the counter row instead of racing on a COUNT.
+
+        Args:
+            user_id: User the counter belongs to
+            day: Calendar day (UTC) the counter is for
+
+        Returns:
+            The new counter value, starting at 1
+        """
+        try:
+            query = text("""
+                INSERT INTO case_daily_counters (user_id, day, seq)
+                VALUES (:user_id, :day, 1)
+                ON CONFLICT (user_id, day) DO UPDATE SET seq = case_daily_counters.seq + 1
+                RETURNING seq
+            """)
+            result = await self.db.execute(query, {"user_id": user_id, "day": day})
+
+            return result.scalar_one()
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to increment daily case counter for {user_id}: {e}") from e
+
+    async def update_if_owner(
+        self,
+        case_id: str,
+        user_id: str,
+        metadata_updates: Optional[Dict[str, Any]] = None,
+        **fields: Any
+    ) -> Optional[Case]:
+        """
+        Update case columns in one statement if the case belongs to the user.
+
+        A single UPDATE ... RETURNING both authorizes the write and returns
+        the new row; only the child tables are read afterwards.
+
+        Args:
+            case_id: Case identifier
+            user_id: User the case must belong to
+            metadata_updates: Keys to merge into the case metadata (jsonb ||)
+            **fields: New values for any of UPDATABLE_FIELDS (description
+                is not stored in the hybrid schema and is ignored)
+
+        Returns:
+            The updated case, or None if not found (or owned by another user)
+        """
+        self._check_updatable(fields)
+        params = {
+            name: value.value if name == "status" else value
+            for name, value in fields.items()
+            if name != "description"
+        }
+
+        try:
+            if not params and not metadata_updates:
+                # Nothing stored to change; still enforce ownership
+                if not await self.exists(case_id, user_id):
+                    return None
+                return await self.get(case_id)
+
+            if metadata_updates:
+                params["metadata_updates"] = _encode_json(metadata_updates)
+            query = _update_if_owner_statement(
+                [name for name in params if name != "metadata_updates"],
+                merge_metadata=bool(metadata_updates),
+            )
+            result = await self.db.execute(query, {**params, "case_id": case_id, "user_id": user_id})
+            row = result.fetchone()
+            if not row:
+                return None
+
+            children = await self._load_children([case_id])
+            return await self._row_to_case(row, children[case_id])
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to update case {case_id}: {e}") from e
+
+    async def delete(self, case_id: str, user_id: Optional[str] = None) -> bool:
         """
         Delete case by ID (cascades to normalized tables via FK constraints).
 
         Args:
             case_id: Case identifier
+            user_id: If given, only delete the case if it belongs to this user
 
         Returns:
-            True if deleted, False if not found
+            True if deleted, False if not found (or owned by another user)
         """
         try:
-            query = text("DELETE FROM cases WHERE case_id = :case_id")
-            result = await self.db.execute(query, {"case_id": case_id})
+            owner_sql = " AND user_id = :user_id" if user_id else ""
+            query = text(f"DELETE FROM cases WHERE case_id = :case_id{owner_sql}")
+            result = await self.db.execute(query, {"case_id": case_id, "user_id": user_id})
             await self.db.flush()
 
             return result.rowcount > 0
@@ -350,7 +844,7 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 SELECT upsert_case_participant(
                     :case_id,
                     :user_id,
-                    :role::participant_role,
+                    CAST(:role AS participant_role),
                     :added_by
                 )
             """)
@@ -450,10 +944,13 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
 
     async def search(
         self,
-        query: str,
+        query: Optional[str],
         user_id: Optional[str] = None,
         organization_id: Optional[str] = None,
-        limit: int = 20
+        statuses: Optional[List[str]] = None,
+        severities: Optional[List[str]] = None,
+        limit: int = 20,
+        offset: int = 0
     ) -> tuple[List[Case], int]:
         """
         Search cases using PostgreSQL full-text search.
@@ -461,23 +958,45 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         Searches:
         - cases.title
         - cases.consulting->>'initial_description'
-        - evidence.preprocessed_content (via JOIN)
+        - evidence.preprocessed_content (via EXISTS subquery)
 
-        Performance: ~15ms (GIN indexes on tsvector columns)
+        Filters, ranking and pagination all run in one query; the total comes
+        from a window count over the filtered rows (or a separate count for an
+        empty page past the end), and child collections for the returned page
+        are batch-loaded.
+
+        Performance: ~15ms (expression GIN indexes matching both tsvector predicates)
 
         Args:
-            query: Search query
+            query: Search query (None or empty matches all cases)
             user_id: Filter by user
             organization_id: Filter by organization
+            statuses: Filter by any of these status values
+            severities: Filter by any of these metadata severities
             limit: Maximum results
+            offset: Pagination offset
 
         Returns:
             Tuple of (cases, total_count)
         """
         try:
             # Build WHERE clause
-            where_clauses = ["(to_tsvector('english', c.title || ' ' || COALESCE(c.consulting->>'initial_description', '')) @@ plainto_tsquery('english', :query) OR e.preprocessed_content_fts @@ plainto_tsquery('english', :query))"]
-            params = {"query": query, "limit": limit}
+            where_clauses = []
+            params = {"limit": limit, "offset": offset}
+            rank_sql = "0"
+
+            if query:
+                where_clauses.append("""(
+                    to_tsvector('english', c.title || ' ' || COALESCE(c.consulting->>'initial_description', ''))
+                        @@ plainto_tsquery('english', :query)
+                    OR EXISTS (
+                        SELECT 1 FROM evidence e
+                        WHERE e.case_id = c.case_id
+                          AND to_tsvector('english', e.preprocessed_content) @@ plainto_tsquery('english', :query)
+                    )
+                )""")
+                rank_sql = "ts_rank(to_tsvector('english', c.title), plainto_tsquery('english', :query))"
+                params["query"] = query
 
             if user_id:
                 where_clauses.append("c.user_id = :user_id")
@@ -487,30 +1006,40 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 where_clauses.append("c.organization_id = :organization_id")
                 params["organization_id"] = organization_id
 
-            where_sql = "WHERE " + " AND ".join(where_clauses)
+            if statuses:
+                # Compared as text: a value outside the enum matches nothing
+                # instead of failing the query
+                where_clauses.append("c.status::text = ANY(:statuses)")
+                params["statuses"] = statuses
+
+            if severities:
+                where_clauses.append("c.metadata->>'severity' = ANY(:severities)")
+                params["severities"] = severities
+
+            where_sql = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
 
             # Search query with relevance ranking
             search_query = text(f"""
-                SELECT DISTINCT c.case_id,
-                    ts_rank(to_tsvector('english', c.title), plainto_tsquery('english', :query)) as rank
+                SELECT c.*, {rank_sql} AS rank, COUNT(*) OVER () AS total_count
                 FROM cases c
-                LEFT JOIN evidence e ON c.case_id = e.case_id
                 {where_sql}
                 ORDER BY rank DESC, c.updated_at DESC
-                LIMIT :limit
+                LIMIT :limit OFFSET :offset
             """)
 
             result = await self.db.execute(search_query, params)
-            case_ids = [row[0] for row in result.fetchall()]
+            rows = result.fetchall()
+            if not rows:
+                if offset == 0:
+                    return [], 0
+                # Past the last page: the window saw no rows, count separately
+                count_query = text(f"SELECT COUNT(*) FROM cases c {where_sql}")
+                return [], (await self.db.execute(count_query, params)).scalar()
 
-            # Fetch full cases
-            cases = []
-            for case_id in case_ids:
-                case = await self.get(case_id)
-                if case:
-                    cases.append(case)
+            children = await self._load_children([row.case_id for row in rows])
+            cases = [await self._row_to_case(row, children[row.case_id]) for row in rows]
 
-            return cases, len(cases)
+            return cases, rows[0].total_count
 
         except Exception as e:
             raise RepositoryException(f"Failed to search cases: {e}") from e
@@ -533,17 +1062,12 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         try:
             message_id = message_dict.get('message_id', f"msg_{uuid4().hex[:16]}")
 
-            query = text("""
-                INSERT INTO case_messages (message_id, case_id, role, content, metadata)
-                VALUES (:message_id, :case_id, :role, :content, :metadata::jsonb)
-            """)
-
-            await self.db.execute(query, {
+            await self.db.execute(_INSERT_MESSAGE, {
                 "message_id": message_id,
                 "case_id": case_id,
                 "role": message_dict.get('role', 'user'),
                 "content": message_dict.get('content', ''),
-                "metadata": json.dumps(message_dict.get('metadata', {}))
+                "metadata": _encode_json(message_dict.get('metadata', {}))
             })
             await self.db.flush()
 
@@ -570,15 +1094,7 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             List of message dictionaries
         """
         try:
-            query = text("""
-                SELECT message_id, role, content, created_at, metadata
-                FROM case_messages
-                WHERE case_id = :case_id
-                ORDER BY created_at ASC
-                LIMIT :limit OFFSET :offset
-            """)
-
-            result = await self.db.execute(query, {
+            result = await self.db.execute(_SELECT_MESSAGES, {
                 "case_id": case_id,
                 "limit": limit,
                 "offset": offset
@@ -614,13 +1130,7 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             True if updated
         """
         try:
-            query = text("""
-                UPDATE cases
-                SET last_activity_at = NOW()
-                WHERE case_id = :case_id
-            """)
-
-            result = await self.db.execute(query, {"case_id": case_id})
+            result = await self.db.execute(_TOUCH_ACTIVITY, {"case_id": case_id})
             await self.db.flush()
 
             return result.rowcount > 0
@@ -632,28 +1142,53 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         """
         Compute analytics for case from normalized tables.
 
+        The owner/status projection and every per-table aggregate come back
+        in one round trip; each aggregate is a LATERAL subquery on its
+        case_id index, so child tables are never joined against each other.
+
         Returns:
-            Dictionary with analytics data
+            Dictionary with analytics data (empty if the case does not exist)
         """
         try:
             query = text("""
                 SELECT
-                    COUNT(DISTINCT e.evidence_id) as evidence_count,
-                    COUNT(DISTINCT h.hypothesis_id) as hypothesis_count,
-                    COUNT(DISTINCT h.hypothesis_id) FILTER (WHERE h.status = 'validated') as validated_hypotheses,
-                    COUNT(DISTINCT s.solution_id) as solution_count,
-                    COUNT(DISTINCT s.solution_id) FILTER (WHERE s.status = 'implemented') as implemented_solutions,
-                    COUNT(DISTINCT m.message_id) as message_count,
-                    COUNT(DISTINCT f.file_id) as file_count,
-                    SUM(f.size_bytes) as total_file_size
+                    c.user_id,
+                    c.status,
+                    c.created_at,
+                    c.last_activity_at,
+                    c.resolved_at,
+                    e.evidence_count,
+                    h.hypothesis_count,
+                    h.validated_hypotheses,
+                    s.solution_count,
+                    s.implemented_solutions,
+                    m.message_count,
+                    f.file_count,
+                    f.total_file_size
                 FROM cases c
-                LEFT JOIN evidence e ON c.case_id = e.case_id
-                LEFT JOIN hypotheses h ON c.case_id = h.case_id
-                LEFT JOIN solutions s ON c.case_id = s.case_id
-                LEFT JOIN case_messages m ON c.case_id = m.case_id
-                LEFT JOIN uploaded_files f ON c.case_id = f.case_id
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS evidence_count
+                    FROM evidence WHERE case_id = c.case_id
+                ) e
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS hypothesis_count,
+                           COUNT(*) FILTER (WHERE status = 'validated') AS validated_hypotheses
+                    FROM hypotheses WHERE case_id = c.case_id
+                ) h
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS solution_count,
+                           COUNT(*) FILTER (WHERE status = 'implemented') AS implemented_solutions
+                    FROM solutions WHERE case_id = c.case_id
+                ) s
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS message_count
+                    FROM case_messages WHERE case_id = c.case_id
+                ) m
+                CROSS JOIN LATERAL (
+                    SELECT COUNT(*) AS file_count, SUM(size_bytes) AS total_file_size
+                    FROM uploaded_files WHERE case_id = c.case_id
+                ) f
                 WHERE c.case_id = :case_id
-                GROUP BY c.case_id
             """)
 
             result = await self.db.execute(query, {"case_id": case_id})
@@ -662,23 +1197,135 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             if not row:
                 return {}
 
-            return {
-                'evidence_count': row[0] or 0,
-                'hypothesis_count': row[1] or 0,
-                'validated_hypotheses': row[2] or 0,
-                'solution_count': row[3] or 0,
-                'implemented_solutions': row[4] or 0,
-                'message_count': row[5] or 0,
-                'file_count': row[6] or 0,
-                'total_file_size': row[7] or 0
+            analytics = {
+                'case_id': case_id,
+                'user_id': row.user_id,
+                'status': row.status,
+                'created_at': row.created_at.isoformat(),
+                'last_activity_at': row.last_activity_at.isoformat() if row.last_activity_at else None,
+                'evidence_count': row.evidence_count or 0,
+                'hypothesis_count': row.hypothesis_count or 0,
+                'validated_hypotheses': row.validated_hypotheses or 0,
+                'solution_count': row.solution_count or 0,
+                'implemented_solutions': row.implemented_solutions or 0,
+                'message_count': row.message_count or 0,
+                'file_count': row.file_count or 0,
+                'total_file_size': row.total_file_size or 0
             }
 
+            if row.resolved_at:
+                analytics['resolved_at'] = row.resolved_at.isoformat()
+                analytics['resolution_time_seconds'] = (row.resolved_at - row.created_at).total_seconds()
+
+            return analytics
+
         except Exception as e:
             raise RepositoryException(f"Failed to get analytics for case {case_id}: {e}") from e
 
+    async def add_evidence(
+        self,
+        case_id: str,
+        user_id: str,
+        evidence: List[Evidence]
+    ) -> Optional[Case]:
+        """
+        Insert new evidence rows without rewriting the rest of the case.
+
+        One UPDATE ... RETURNING checks ownership, bumps the case's
+        timestamps and returns its row; then only the new evidence is
+        written (save() would re-upsert every child table).
+
+        Args:
+            case_id: Case identifier
+            user_id: Owner the case must belong to
+            evidence: Evidence to append, in order
+
+        Returns:
+            The updated case, or None if not found/unauthorized
+        """
+        try:
+            row = await self._touch_owned_case(case_id, user_id)
+            if not row:
+                return None
+
+            if len(evidence) >= _COPY_MIN_ROWS and self.db.get_bind().dialect.driver == "asyncpg":
+                await self._copy_evidence(case_id, evidence)
+            else:
+                await self._write_evidence(case_id, evidence)
+
+            children = await self._load_children([case_id])
+            return await self._row_to_case(row, children[case_id])
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to add evidence to case {case_id}: {e}") from e
+
+    async def add_hypothesis(
+        self,
+        case_id: str,
+        user_id: str,
+        hypothesis: Hypothesis
+    ) -> Optional[Case]:
+        """
+        Insert a hypothesis row without rewriting the rest of the case.
+
+        See add_evidence.
+
+        Args:
+            case_id: Case identifier
+            user_id: Owner the case must belong to
+            hypothesis: Hypothesis to add
+
+        Returns:
+            The updated case, or None if not found/unauthorized
+        """
+        try:
+            row = await self._touch_owned_case(case_id, user_id)
+            if not row:
+                return None
+
+            await self._write_hypotheses(case_id, {hypothesis.hypothesis_id: hypothesis})
+
+            children = await self._load_children([case_id])
+            return await self._row_to_case(row, children[case_id])
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to add hypothesis to case {case_id}: {e}") from e
+
+    async def _touch_owned_case(self, case_id: str, user_id: str):
+        """Bump a user's case's timestamps; return its row, or None if not found/unauthorized."""
+        now = datetime.now(timezone.utc)
+        result = await self.db.execute(_TOUCH_OWNED_CASE, {
+            "case_id": case_id,
+            "user_id": user_id,
+            "now": now,
+        })
+        return result.fetchone()
+
+    async def get_user_analytics(self, user_id: str) -> Dict[str, Any]:
+        """
+        Aggregate a user's cases server-side in one query.
+
+        Cases are grouped by status and severity; evidence and hypotheses
+        are counted per case from their case_id indexes, so no case rows or
+        child rows are transferred.
+
+        Args:
+            user_id: User whose cases are counted
+
+        Returns:
+            Dictionary with total_cases, by_status, by_severity,
+            total_evidence_collected and total_hypotheses_generated
+        """
+        try:
+            result = await self.db.execute(_USER_ANALYTICS, {"user_id": user_id})
+            return _fold_user_analytics(result.all())
+
+        except Exception as e:
+            raise RepositoryException(f"Failed to aggregate analytics for user {user_id}: {e}") from e
+
     async def cleanup_expired(self, max_age_days: int = 90, batch_size: int = 100) -> int:
         """
-        Clean up expired/old cases.
+        Clean up expired/old cases and past days' title counters.
 
         Args:
             max_age_days: Maximum age in days for closed cases
@@ -688,21 +1335,15 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             Number of cases deleted
         """
         try:
-            query = text("""
-                DELETE FROM cases
-                WHERE case_id IN (
-                    SELECT case_id
-                    FROM cases
-                    WHERE status = 'closed'
-                    AND closed_at < NOW() - INTERVAL ':max_age_days days'
-                    LIMIT :batch_size
-                )
-            """)
-
-            result = await self.db.execute(query, {
-                "max_age_days": max_age_days,
+            # The cutoff is bound as a timestamp: a bind parameter inside the
+            # INTERVAL '...' literal would not be substituted
+            result = await self.db.execute(_DELETE_EXPIRED_CASES, {
+                "cutoff": datetime.now(timezone.utc) - timedelta(days=max_age_days),
                 "batch_size": batch_size
             })
+
+            # Title counters are only read for the current (UTC) day
+            await self.db.execute(_PRUNE_DAILY_COUNTERS, {"cutoff_day": _counter_cutoff_day()})
             await self.db.flush()
 
             return result.rowcount
@@ -716,52 +1357,23 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
 
     async def _upsert_case_record(self, case: Case) -> None:
         """Upsert main cases table (JSONB columns for flexible data)."""
-        query = text("""
-            INSERT INTO cases (
-                case_id, user_id, title, status, created_at, updated_at,
-                consulting, problem_verification, working_conclusion,
-                root_cause_conclusion, path_selection, degraded_mode,
-                escalation_state, documentation, progress, metadata
-            ) VALUES (
-                :case_id, :user_id, :title, :status, :created_at, :updated_at,
-                :consulting::jsonb, :problem_verification::jsonb, :working_conclusion::jsonb,
-                :root_cause_conclusion::jsonb, :path_selection::jsonb, :degraded_mode::jsonb,
-                :escalation_state::jsonb, :documentation::jsonb, :progress::jsonb, :metadata::jsonb
-            )
-            ON CONFLICT (case_id) DO UPDATE SET
-                user_id = EXCLUDED.user_id,
-                title = EXCLUDED.title,
-                status = EXCLUDED.status,
-                updated_at = EXCLUDED.updated_at,
-                consulting = EXCLUDED.consulting,
-                problem_verification = EXCLUDED.problem_verification,
-                working_conclusion = EXCLUDED.working_conclusion,
-                root_cause_conclusion = EXCLUDED.root_cause_conclusion,
-                path_selection = EXCLUDED.path_selection,
-                degraded_mode = EXCLUDED.degraded_mode,
-                escalation_state = EXCLUDED.escalation_state,
-                documentation = EXCLUDED.documentation,
-                progress = EXCLUDED.progress,
-                metadata = EXCLUDED.metadata
-        """)
-
-        await self.db.execute(query, {
+        await self.db.execute(_UPSERT_CASE, {
             "case_id": case.case_id,
             "user_id": case.user_id,
             "title": case.title,
             "status": case.status.value,
             "created_at": case.created_at,
             "updated_at": case.updated_at,
-            "consulting": json.dumps(case.consulting.model_dump()),
-            "problem_verification": json.dumps(case.problem_verification.model_dump()) if case.problem_verification else None,
-            "working_conclusion": json.dumps(case.working_conclusion.model_dump()) if case.working_conclusion else None,
-            "root_cause_conclusion": json.dumps(case.root_cause_conclusion.model_dump()) if case.root_cause_conclusion else None,
-            "path_selection": json.dumps(case.path_selection.model_dump()) if case.path_selection else None,
-            "degraded_mode": json.dumps(case.degraded_mode.model_dump()) if case.degraded_mode else None,
-            "escalation_state": json.dumps(case.escalation_state.model_dump()) if case.escalation_state else None,
-            "documentation": json.dumps(case.documentation.model_dump()),
-            "progress": json.dumps(case.progress.model_dump()),
-            "metadata": json.dumps({})  # Reserved for future use
+            "consulting": _encode_json(case.consulting.model_dump()),
+            "problem_verification": _encode_json(case.problem_verification.model_dump()) if case.problem_verification else None,
+            "working_conclusion": _encode_json(case.working_conclusion.model_dump()) if case.working_conclusion else None,
+            "root_cause_conclusion": _encode_json(case.root_cause_conclusion.model_dump()) if case.root_cause_conclusion else None,
+            "path_selection": _encode_json(case.path_selection.model_dump()) if case.path_selection else None,
+            "degraded_mode": _encode_json(case.degraded_mode.model_dump()) if case.degraded_mode else None,
+            "escalation_state": _encode_json(case.escalation_state.model_dump()) if case.escalation_state else None,
+            "documentation": _encode_json(case.documentation.model_dump()),
+            "progress": _encode_json(case.progress.model_dump()),
+            "metadata": _encode_json(case.metadata)
         })
 
     async def _upsert_evidence(self, case_id: str, evidence_list: List[Evidence]) -> None:
@@ -769,80 +1381,56 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         # Delete existing evidence not in current list
         current_ids = [e.evidence_id for e in evidence_list]
         if current_ids:
-            delete_query = text("""
-                DELETE FROM evidence
-                WHERE case_id = :case_id
-                AND evidence_id != ALL(:current_ids)
-            """)
-            await self.db.execute(delete_query, {"case_id": case_id, "current_ids": current_ids})
+            await self.db.execute(_DELETE_STALE_EVIDENCE, {"case_id": case_id, "current_ids": current_ids})
 
-        # Upsert each evidence record
-        for evidence in evidence_list:
-            query = text("""
-                INSERT INTO evidence (
-                    evidence_id, case_id, category, summary, preprocessed_content,
-                    content_ref, file_size, filename, upload_timestamp, metadata
-                ) VALUES (
-                    :evidence_id, :case_id, :category, :summary, :preprocessed_content,
-                    :content_ref, :file_size, :filename, :upload_timestamp, :metadata::jsonb
-                )
-                ON CONFLICT (evidence_id) DO UPDATE SET
-                    category = EXCLUDED.category,
-                    summary = EXCLUDED.summary,
-                    preprocessed_content = EXCLUDED.preprocessed_content,
-                    content_ref = EXCLUDED.content_ref,
-                    metadata = EXCLUDED.metadata
-            """)
+        await self._write_evidence(case_id, evidence_list)
 
-            await self.db.execute(query, {
-                "evidence_id": evidence.evidence_id,
-                "case_id": case_id,
-                "category": evidence.data_type,  # Maps to evidence_category enum
-                "summary": evidence.summary,
-                "preprocessed_content": evidence.preprocessed_content or "",
-                "content_ref": evidence.storage_ref,
-                "file_size": evidence.file_size,
-                "filename": evidence.filename,
-                "upload_timestamp": evidence.timestamp,
-                "metadata": json.dumps({})  # Reserved
-            })
+    async def _write_evidence(self, case_id: str, evidence_list: List[Evidence]) -> None:
+        """Upsert evidence records in one executemany round trip."""
+        if not evidence_list:
+            return
+
+        await self.db.execute(_UPSERT_EVIDENCE, [
+            _evidence_params(case_id, evidence) for evidence in evidence_list
+        ])
+
+    async def _copy_evidence(self, case_id: str, evidence_list: List[Evidence]) -> None:
+        """
+        Insert new evidence records with COPY on the session's asyncpg connection.
+
+        COPY streams every row in one binary command, far cheaper than even
+        executemany for large batches, but it cannot upsert: only use it for
+        evidence with freshly generated IDs. It runs inside the session's
+        open transaction.
+        """
+        connection = await self.db.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "evidence",
+            columns=_EVIDENCE_COLUMNS,
+            records=[
+                tuple(params[column] for column in _EVIDENCE_COLUMNS)
+                for params in (_evidence_params(case_id, evidence) for evidence in evidence_list)
+            ],
+        )
 
     async def _upsert_hypotheses(self, case_id: str, hypotheses_dict: Dict[str, Hypothesis]) -> None:
         """Upsert hypotheses records (normalized table)."""
         # Delete existing hypotheses not in current dict
         current_ids = list(hypotheses_dict.keys())
         if current_ids:
-            delete_query = text("""
-                DELETE FROM hypotheses
-                WHERE case_id = :case_id
-                AND hypothesis_id != ALL(:current_ids)
-            """)
-            await self.db.execute(delete_query, {"case_id": case_id, "current_ids": current_ids})
+            await self.db.execute(_DELETE_STALE_HYPOTHESES, {"case_id": case_id, "current_ids": current_ids})
 
-        # Upsert each hypothesis
-        for hypothesis_id, hypothesis in hypotheses_dict.items():
-            query = text("""
-                INSERT INTO hypotheses (
-                    hypothesis_id, case_id, description, status, confidence_score,
-                    supporting_evidence_ids, validation_result, validation_timestamp,
-                    proposed_at, updated_at, metadata
-                ) VALUES (
-                    :hypothesis_id, :case_id, :description, :status, :confidence_score,
-                    :supporting_evidence_ids, :validation_result, :validation_timestamp,
-                    :proposed_at, :updated_at, :metadata::jsonb
-                )
-                ON CONFLICT (hypothesis_id) DO UPDATE SET
-                    description = EXCLUDED.description,
-                    status = EXCLUDED.status,
-                    confidence_score = EXCLUDED.confidence_score,
-                    supporting_evidence_ids = EXCLUDED.supporting_evidence_ids,
-                    validation_result = EXCLUDED.validation_result,
-                    validation_timestamp = EXCLUDED.validation_timestamp,
-                    updated_at = EXCLUDED.updated_at,
-                    metadata = EXCLUDED.metadata
-            """)
+        await self._write_hypotheses(case_id, hypotheses_dict)
 
-            await self.db.execute(query, {
+    async def _write_hypotheses(self, case_id: str, hypotheses_dict: Dict[str, Hypothesis]) -> None:
+        """Upsert hypothesis records in one executemany round trip."""
+        if not hypotheses_dict:
+            return
+
+        now = datetime.now(timezone.utc)
+        await self.db.execute(_UPSERT_HYPOTHESIS, [
+            {
                 "hypothesis_id": hypothesis_id,
                 "case_id": case_id,
                 "description": hypothesis.hypothesis,
@@ -851,52 +1439,28 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "supporting_evidence_ids": hypothesis.evidence if hasattr(hypothesis, 'evidence') else [],
                 "validation_result": hypothesis.validation_result if hasattr(hypothesis, 'validation_result') else None,
                 "validation_timestamp": hypothesis.validated_at if hasattr(hypothesis, 'validated_at') else None,
-                "proposed_at": hypothesis.proposed_at if hasattr(hypothesis, 'proposed_at') else datetime.now(timezone.utc),
-                "updated_at": datetime.now(timezone.utc),
-                "metadata": json.dumps({})
-            })
+                "proposed_at": hypothesis.proposed_at if hasattr(hypothesis, 'proposed_at') else now,
+                "updated_at": now,
+                "metadata": _encode_json({})
+            }
+            for hypothesis_id, hypothesis in hypotheses_dict.items()
+        ])
 
     async def _upsert_solutions(self, case_id: str, solutions_list: List[Solution]) -> None:
         """Upsert solutions records (normalized table)."""
         # Delete existing solutions not in current list
         current_ids = [s.solution_id for s in solutions_list if hasattr(s, 'solution_id')]
         if current_ids:
-            delete_query = text("""
-                DELETE FROM solutions
-                WHERE case_id = :case_id
-                AND solution_id != ALL(:current_ids)
-            """)
-            await self.db.execute(delete_query, {"case_id": case_id, "current_ids": current_ids})
+            await self.db.execute(_DELETE_STALE_SOLUTIONS, {"case_id": case_id, "current_ids": current_ids})
 
-        # Upsert each solution
-        for solution in solutions_list:
-            solution_id = solution.solution_id if hasattr(solution, 'solution_id') else f"sol_{uuid4().hex[:12]}"
+        if not solutions_list:
+            return
 
-            query = text("""
-                INSERT INTO solutions (
-                    solution_id, case_id, description, status, implementation_steps,
-                    risk_level, estimated_effort, verification_result, verification_timestamp,
-                    proposed_at, implemented_at, updated_at, metadata
-                ) VALUES (
-                    :solution_id, :case_id, :description, :status, :implementation_steps,
-                    :risk_level, :estimated_effort, :verification_result, :verification_timestamp,
-                    :proposed_at, :implemented_at, :updated_at, :metadata::jsonb
-                )
-                ON CONFLICT (solution_id) DO UPDATE SET
-                    description = EXCLUDED.description,
-                    status = EXCLUDED.status,
-                    implementation_steps = EXCLUDED.implementation_steps,
-                    risk_level = EXCLUDED.risk_level,
-                    estimated_effort = EXCLUDED.estimated_effort,
-                    verification_result = EXCLUDED.verification_result,
-                    verification_timestamp = EXCLUDED.verification_timestamp,
-                    implemented_at = EXCLUDED.implemented_at,
-                    updated_at = EXCLUDED.updated_at,
-                    metadata = EXCLUDED.metadata
-            """)
-
-            await self.db.execute(query, {
-                "solution_id": solution_id,
+        # Upsert all solutions in one executemany round trip
+        now = datetime.now(timezone.utc)
+        await self.db.execute(_UPSERT_SOLUTION, [
+            {
+                "solution_id": solution.solution_id if hasattr(solution, 'solution_id') else f"sol_{uuid4().hex[:12]}",
                 "case_id": case_id,
                 "description": solution.description if hasattr(solution, 'description') else str(solution),
                 "status": "proposed",  # Default status
@@ -905,48 +1469,28 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "estimated_effort": solution.effort if hasattr(solution, 'effort') else None,
                 "verification_result": None,
                 "verification_timestamp": None,
-                "proposed_at": datetime.now(timezone.utc),
+                "proposed_at": now,
                 "implemented_at": None,
-                "updated_at": datetime.now(timezone.utc),
-                "metadata": json.dumps({})
-            })
+                "updated_at": now,
+                "metadata": _encode_json({})
+            }
+            for solution in solutions_list
+        ])
 
     async def _upsert_uploaded_files(self, case_id: str, files_list: List[UploadedFile]) -> None:
         """Upsert uploaded_files records (normalized table) - matches UploadedFile Pydantic model."""
         # Delete existing files not in current list
         current_ids = [f.file_id for f in files_list]
         if current_ids:
-            delete_query = text("""
-                DELETE FROM uploaded_files
-                WHERE case_id = :case_id
-                AND file_id != ALL(:current_ids)
-            """)
-            await self.db.execute(delete_query, {"case_id": case_id, "current_ids": current_ids})
+            await self.db.execute(_DELETE_STALE_UPLOADED_FILES, {"case_id": case_id, "current_ids": current_ids})
 
-        # Upsert each file (field names match Pydantic model exactly)
-        for file in files_list:
-            query = text("""
-                INSERT INTO uploaded_files (
-                    file_id, case_id, filename, size_bytes, data_type,
-                    uploaded_at_turn, uploaded_at, source_type,
-                    content_ref, preprocessing_summary, metadata
-                ) VALUES (
-                    :file_id, :case_id, :filename, :size_bytes, :data_type,
-                    :uploaded_at_turn, :uploaded_at, :source_type,
-                    :content_ref, :preprocessing_summary, :metadata::jsonb
-                )
-                ON CONFLICT (file_id) DO UPDATE SET
-                    filename = EXCLUDED.filename,
-                    size_bytes = EXCLUDED.size_bytes,
-                    data_type = EXCLUDED.data_type,
-                    uploaded_at_turn = EXCLUDED.uploaded_at_turn,
-                    source_type = EXCLUDED.source_type,
-                    content_ref = EXCLUDED.content_ref,
-                    preprocessing_summary = EXCLUDED.preprocessing_summary,
-                    metadata = EXCLUDED.metadata
-            """)
+        if not files_list:
+            return
 
-            await self.db.execute(query, {
+        # Upsert all files in one executemany round trip (field names match
+        # the Pydantic model exactly)
+        await self.db.execute(_UPSERT_UPLOADED_FILE, [
+            {
                 "file_id": file.file_id,
                 "case_id": case_id,
                 "filename": file.filename,
@@ -957,56 +1501,101 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
                 "source_type": file.source_type,
                 "content_ref": file.content_ref,
                 "preprocessing_summary": file.preprocessing_summary,
-                "metadata": json.dumps({})
-            })
+                "metadata": _encode_json({})
+            }
+            for file in files_list
+        ])
 
     async def _append_status_transitions(self, case_id: str, transitions: List[CaseStatusTransition]) -> None:
         """Append status transitions (append-only audit trail)."""
-        for transition in transitions:
-            query = text("""
-                INSERT INTO case_status_transitions (
-                    case_id, from_status, to_status, reason, transitioned_at, metadata
-                ) VALUES (
-                    :case_id, :from_status, :to_status, :reason, :transitioned_at, :metadata::jsonb
-                )
-                ON CONFLICT DO NOTHING
-            """)
+        if not transitions:
+            return
 
-            await self.db.execute(query, {
+        await self.db.execute(_INSERT_STATUS_TRANSITION, [
+            {
                 "case_id": case_id,
                 "from_status": transition.from_status.value if transition.from_status else None,
                 "to_status": transition.to_status.value,
                 "reason": transition.reason if hasattr(transition, 'reason') else None,
                 "transitioned_at": transition.timestamp,
-                "metadata": json.dumps({})
-            })
+                "metadata": _encode_json({})
+            }
+            for transition in transitions
+        ])
 
-    async def _row_to_case(self, row) -> Case:
+    async def _load_children(self, case_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Load evidence, hypotheses, solutions and uploaded files for cases.
+
+        Each collection is fetched with its own ``case_id = ANY(...)`` query
+        (select-in loading). LEFT JOINing all four tables onto the case row
+        instead multiplies the intermediate result by the product of the
+        collection sizes before it is aggregated back down.
+
+        Args:
+            case_ids: Case identifiers to load collections for
+
+        Returns:
+            Mapping of case_id to its evidence, hypotheses, solutions and uploaded_files
+        """
+        children = {
+            case_id: {"evidence": [], "hypotheses": {}, "solutions": [], "uploaded_files": []}
+            for case_id in case_ids
+        }
+        params = {"case_ids": case_ids}
+
+        result = await self.db.execute(_SELECT_EVIDENCE, params)
+        for row in result.mappings():
+            data = dict(row)
+            case_id = data.pop("case_id")
+            data["metadata"] = _decode_json(data["metadata"])
+            children[case_id]["evidence"].append(Evidence(**data))
+
+        result = await self.db.execute(_SELECT_HYPOTHESES, params)
+        for row in result.mappings():
+            data = dict(row)
+            case_id = data.pop("case_id")
+            data["supporting_evidence_ids"] = _decode_json(data["supporting_evidence_ids"])
+            data["metadata"] = _decode_json(data["metadata"])
+            children[case_id]["hypotheses"][data["hypothesis_id"]] = Hypothesis(**data)
+
+        result = await self.db.execute(_SELECT_SOLUTIONS, params)
+        for row in result.mappings():
+            data = dict(row)
+            case_id = data.pop("case_id")
+            data["implementation_steps"] = _decode_json(data["implementation_steps"])
+            data["metadata"] = _decode_json(data["metadata"])
+            children[case_id]["solutions"].append(Solution(**data))
+
+        result = await self.db.execute(_SELECT_UPLOADED_FILES, params)
+        for row in result.mappings():
+            data = dict(row)
+            case_id = data.pop("case_id")
+            children[case_id]["uploaded_files"].append(UploadedFile(**data))
+
+        return children
+
+    async def _row_to_case(self, row, children: Dict[str, Any]) -> Case:
         """
         Reconstruct Case domain object from database row.
 
         Args:
-            row: Database row from case query with JOINs
+            row: Row from the cases table
+            children: Normalized collections for the case (see _load_children)
 
         Returns:
             Case domain object
         """
         # Parse JSONB columns
-        consulting = ConsultingData(**json.loads(row.consulting)) if row.consulting else ConsultingData()
-        problem_verification = ProblemVerification(**json.loads(row.problem_verification)) if row.problem_verification else None
-        working_conclusion = WorkingConclusion(**json.loads(row.working_conclusion)) if row.working_conclusion else None
-        root_cause_conclusion = RootCauseConclusion(**json.loads(row.root_cause_conclusion)) if row.root_cause_conclusion else None
-        path_selection = PathSelection(**json.loads(row.path_selection)) if row.path_selection else None
-        degraded_mode = DegradedMode(**json.loads(row.degraded_mode)) if row.degraded_mode else None
-        escalation_state = EscalationState(**json.loads(row.escalation_state)) if row.escalation_state else None
-        documentation = DocumentationData(**json.loads(row.documentation)) if row.documentation else DocumentationData()
-        progress = InvestigationProgress(**json.loads(row.progress)) if row.progress else InvestigationProgress()
-
-        # Parse normalized table data (aggregated as JSON)
-        evidence_list = [Evidence(**e) for e in json.loads(row.evidence_data)] if row.evidence_data != '[]' else []
-        hypotheses_dict = {h['hypothesis_id']: Hypothesis(**h) for h in json.loads(row.hypotheses_data)} if row.hypotheses_data != '[]' else {}
-        solutions_list = [Solution(**s) for s in json.loads(row.solutions_data)] if row.solutions_data != '[]' else []
-        uploaded_files = [UploadedFile(**f) for f in json.loads(row.uploaded_files_data)] if row.uploaded_files_data != '[]' else []
+        consulting = ConsultingData(**_decode_json(row.consulting)) if row.consulting else ConsultingData()
+        problem_verification = ProblemVerification(**_decode_json(row.problem_verification)) if row.problem_verification else None
+        working_conclusion = WorkingConclusion(**_decode_json(row.working_conclusion)) if row.working_conclusion else None
+        root_cause_conclusion = RootCauseConclusion(**_decode_json(row.root_cause_conclusion)) if row.root_cause_conclusion else None
+        path_selection = PathSelection(**_decode_json(row.path_selection)) if row.path_selection else None
+        degraded_mode = DegradedMode(**_decode_json(row.degraded_mode)) if row.degraded_mode else None
+        escalation_state = EscalationState(**_decode_json(row.escalation_state)) if row.escalation_state else None
+        documentation = DocumentationData(**_decode_json(row.documentation)) if row.documentation else DocumentationData()
+        progress = InvestigationProgress(**_decode_json(row.progress)) if row.progress else InvestigationProgress()
 
         # Reconstruct Case
         return Case(
@@ -1018,6 +1607,7 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             status=CaseStatus(row.status),
             status_history=[],  # Load separately if needed
             closure_reason=None,
+            metadata=_decode_json(row.metadata) or {},
 
             # Progress
             progress=progress,
@@ -1034,10 +1624,10 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
             problem_verification=problem_verification,
 
             # Investigation data (from normalized tables)
-            uploaded_files=uploaded_files,
-            evidence=evidence_list,
-            hypotheses=hypotheses_dict,
-            solutions=solutions_list,
+            uploaded_files=children["uploaded_files"],
+            evidence=children["evidence"],
+            hypotheses=children["hypotheses"],
+            solutions=children["solutions"],
 
             # Conclusions
             working_conclusion=working_conclusion,
@@ -1059,6 +1649,100 @@ class PostgreSQLHybridCaseRepository(CaseRepository):
         )
 
 
+# cases columns behind a list view (everything CaseResponse reads)
+_LIST_VIEW_COLUMNS = (
+    "case_id, user_id, organization_id, title, status, metadata, "
+    "created_at, updated_at, last_activity_at, resolved_at, closed_at"
+)
+
+
+def _row_to_list_case(row) -> Case:
+    """Build a list-view Case from _LIST_VIEW_COLUMNS.
+
+    Child collections and JSON state columns keep their model defaults;
+    use get() for the full case. The values come straight from our own
+    table, so the model is built without re-running validation.
+    """
+    return Case.model_construct(
+        case_id=row.case_id,
+        user_id=row.user_id,
+        organization_id=row.organization_id,
+        title=row.title,
+        description=None,  # Not stored in hybrid schema
+        status=CaseStatus(row.status),
+        metadata=_decode_json(row.metadata) or {},
+        created_at=row.created_at,
+        updated_at=row.updated_at,
+        last_activity_at=row.last_activity_at,
+        resolved_at=row.resolved_at,
+        closed_at=row.closed_at,
+    )
+
+
+def _update_if_owner_statement(columns: List[str], merge_metadata: bool) -> TextClause:
+    """Build the UPDATE ... RETURNING statement behind update_if_owner.
+
+    Each column is bound under its own name; with merge_metadata, the
+    :metadata_updates JSON object is merged into the case metadata.
+    """
+    assignments = [f"{name} = :{name}" for name in columns]
+    if merge_metadata:
+        assignments.append(
+            "metadata = COALESCE(metadata, '{}'::jsonb) || CAST(:metadata_updates AS jsonb)"
+        )
+    set_sql = ", ".join(assignments)
+    return text(f"""
+        UPDATE cases SET {set_sql}
+        WHERE case_id = :case_id AND user_id = :user_id
+        RETURNING *
+    """)
+
+
+def _evidence_params(case_id: str, evidence: Evidence) -> Dict[str, Any]:
+    """Column values of an evidence row (see _EVIDENCE_COLUMNS)."""
+    return {
+        "evidence_id": evidence.evidence_id,
+        "case_id": case_id,
+        "category": evidence.data_type,  # Maps to evidence_category enum
+        "summary": evidence.summary,
+        "preprocessed_content": evidence.preprocessed_content or "",
+        "content_ref": evidence.storage_ref,
+        "file_size": evidence.file_size,
+        "filename": evidence.filename,
+        "upload_timestamp": evidence.timestamp,
+        "metadata": _encode_json({})  # Reserved
+    }
+
+
+class _RecordRow:
+    """Attribute access to an asyncpg Record, as on a SQLAlchemy Row."""
+
+    __slots__ = ("_record",)
+
+    def __init__(self, record):
+        self._record = record
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._record[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def _encode_json(value: Any) -> str:
+    """Encode a value for a jsonb bind parameter (orjson; handles datetimes)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _decode_json(value: Any) -> Any:
+    """Decode a JSON column value.
+
+    The engine's asyncpg codec already decodes json/jsonb columns; other
+    drivers may return them as text.
+    """
+    return orjson.loads(value) if isinstance(value, str) else value
+
+
 class RepositoryException(Exception):
     """Exception raised for repository errors."""
     pass
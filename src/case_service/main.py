@@ -3,12 +3,15 @@
 import logging
 import sys
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from case_service.api.middleware import UserIdMiddleware
 from case_service.config import settings
+from case_service.core import clock
 from case_service.infrastructure.database import db_client
-from case_service.api.routes.cases import router as cases_router
+from case_service.api.routes.cases import init_case_repository, router as cases_router
 from case_service.api.routes.schema import router as schema_router
 from case_service.models import HealthResponse
 
@@ -26,12 +29,18 @@ app = FastAPI(
     title="FaultMaven Case Service",
     description="Microservice for case management",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    openapi_url="/openapi.json" if settings.api_docs_enabled else None,
 )
 
 # Service-to-service JWT authentication removed - services trust X-User-* headers from API Gateway
 # The gateway validates user JWTs and adds X-User-* headers after stripping any client-provided ones
 logger.info("Service trusts X-User-* headers from API Gateway (no JWT validation)")
 
+# Validate gateway-issued X-User-ID once per request. Added before CORS so the
+# CORS middleware wraps it and preflight/401 responses still carry CORS headers.
+app.add_middleware(UserIdMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -46,6 +55,20 @@ app.include_router(cases_router)
 app.include_router(schema_router)
 
 
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
+    """Log unexpected errors and return a generic 500 response.
+
+    Handlers raise HTTPException for expected failures and let anything else
+    propagate here instead of wrapping their bodies in try/except.
+    """
+    logger.error(f"Unhandled error in {request.method} {request.url.path}: {exc}", exc_info=exc)
+    return ORJSONResponse(
+        status_code=500,
+        content={"detail": "Internal server error"},
+    )
+
+
 @app.on_event("startup")
 async def startup():
     """Initialize database on startup."""
@@ -65,11 +88,15 @@ async def startup():
         logger.error(f"Failed to initialize database: {e}")
         raise
 
+    init_case_repository()
+    clock.start_ticker()
+
 
 @app.on_event("shutdown")
 async def shutdown():
     """Clean up resources on shutdown."""
     logger.info("Shutting down service")
+    await clock.stop_ticker()
     await db_client.close()
 
 
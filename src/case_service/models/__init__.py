@@ -6,6 +6,12 @@ from .requests import (
     CaseCreateRequest,
     CaseUpdateRequest,
     CaseStatusUpdateRequest,
+    EvidenceCreateRequest,
+    EvidenceBatchCreateRequest,
+    CloseCaseRequest,
+    CaseSearchRequest,
+    HypothesisCreateRequest,
+    HypothesisUpdateRequest,
     CaseResponse,
     CaseListResponse,
     HealthResponse,
@@ -18,6 +24,12 @@ __all__ = [
     "CaseCreateRequest",
     "CaseUpdateRequest",
     "CaseStatusUpdateRequest",
+    "EvidenceCreateRequest",
+    "EvidenceBatchCreateRequest",
+    "CloseCaseRequest",
+    "CaseSearchRequest",
+    "HypothesisCreateRequest",
+    "HypothesisUpdateRequest",
     "CaseResponse",
     "CaseListResponse",
     "HealthResponse",
@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
-from fm_core_lib.models import Case, CaseStatus
+from fm_core_lib.models import Case, CaseStatus, HypothesisStatus
 
 from enum import Enum
 
@@ -43,6 +43,53 @@ class CaseStatusUpdateRequest(BaseModel):
     status: CaseStatus
 
 
+class EvidenceCreateRequest(BaseModel):
+    """Request to add evidence to a case."""
+
+    content: str = ""
+    source: str = "user"
+    category: str = "observation"
+
+
+class EvidenceBatchCreateRequest(BaseModel):
+    """Request to add several evidence items to a case at once."""
+
+    items: List[EvidenceCreateRequest] = Field(..., min_length=1, max_length=500)
+
+
+class CloseCaseRequest(BaseModel):
+    """Request to close a case."""
+
+    reason: Optional[str] = None
+    resolution_notes: Optional[str] = None
+
+
+class CaseSearchRequest(BaseModel):
+    """Request to search a user's cases."""
+
+    query: Optional[str] = None
+    status: Optional[List[CaseStatus]] = None  # Unknown values are rejected with 422
+    severity: Optional[List[str]] = None
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=50, ge=1, le=100)
+
+
+class HypothesisCreateRequest(BaseModel):
+    """Request to add a hypothesis to a case."""
+
+    description: str = ""
+    category: str = "root_cause"
+    confidence: float = Field(default=0.5, ge=0.0, le=1.0)
+
+
+class HypothesisUpdateRequest(BaseModel):
+    """Request to update a hypothesis."""
+
+    status: Optional[HypothesisStatus] = None
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
+    validation_notes: Optional[str] = None
+
+
 class CaseResponse(BaseModel):
     """Response containing a single case."""
 
@@ -60,9 +107,9 @@ class CaseResponse(BaseModel):
     resolved_at: Optional[datetime]
     message_count: int = 0  # Default to 0, not Optional
 
-    @classmethod
-    def from_case(cls, case: Case) -> "CaseResponse":
-        """Convert Case model to response."""
+    @staticmethod
+    def _fields_from_case(case: Case) -> Dict[str, Any]:
+        """Map a Case onto CaseResponse field values."""
         priority = case.metadata.get("priority", "medium")
 
         # Filter out priority from metadata (it's exposed as top-level field)
@@ -71,21 +118,40 @@ class CaseResponse(BaseModel):
 
         message_count = len(case.turn_history) if case.turn_history else 0
 
-        return cls(
-            case_id=case.case_id,
-            owner_id=case.user_id,  # For frontend compatibility
-            user_id=case.user_id,  # For internal services
-            organization_id=case.organization_id,  # For internal services
-            title=case.title,
-            description=case.description,
-            status=case.status.value,
-            priority=priority,
-            metadata=response_metadata,
-            created_at=case.created_at,
-            updated_at=case.updated_at,
-            resolved_at=case.resolved_at,
-            message_count=message_count,
-        )
+        return {
+            "case_id": case.case_id,
+            "owner_id": case.user_id,  # For frontend compatibility
+            "user_id": case.user_id,  # For internal services
+            "organization_id": case.organization_id,  # For internal services
+            "title": case.title,
+            "description": case.description or "",
+            "status": case.status.value,
+            "priority": priority,
+            "metadata": response_metadata,
+            "created_at": case.created_at,
+            "updated_at": case.updated_at,
+            "resolved_at": case.resolved_at,
+            "message_count": message_count,
+        }
+
+    @classmethod
+    def from_case(cls, case: Case) -> "CaseResponse":
+        """Convert Case model to response."""
+        return cls(**cls._fields_from_case(case))
+
+    @classmethod
+    def dict_from_case(cls, case: Case) -> Dict[str, Any]:
+        """Convert a Case model to a plain response dict (see dicts_from_cases)."""
+        return cls._fields_from_case(case)
+
+    @classmethod
+    def dicts_from_cases(cls, cases: List[Case]) -> List[Dict[str, Any]]:
+        """Convert a page of Case models to plain response dicts.
+
+        The dicts carry exactly the CaseResponse fields but skip model
+        construction and validation, for routes that serialize them directly.
+        """
+        return [cls._fields_from_case(case) for case in cases]
 
 
 class CaseListResponse(BaseModel):
@@ -95,6 +161,9 @@ class CaseListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; None when this page is the last"
+    )
 
 
 class HealthResponse(BaseModel):
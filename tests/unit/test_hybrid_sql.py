@@ -0,0 +1,69 @@
+"""Unit tests for the hybrid repository's SQL statements
+
+Compiles statements for PostgreSQL and checks that every named parameter
+is bound. text() does not recognize ``:name::type`` as a bind parameter,
+so a cast written that way is sent to the database verbatim.
+"""
+
+import re
+
+import pytest
+from sqlalchemy import TextClause
+from sqlalchemy.dialects import postgresql
+
+from case_service.infrastructure.persistence import postgresql_hybrid_case_repository
+from case_service.infrastructure.persistence.postgresql_hybrid_case_repository import (
+    _update_if_owner_statement,
+)
+
+# A ":name" left in compiled SQL is a parameter text() did not bind
+# ("::type" casts on columns and literals are not matched)
+UNBOUND_PARAM = re.compile(r"(?<![:\w]):\w")
+
+MODULE_STATEMENTS = sorted(
+    name
+    for name, value in vars(postgresql_hybrid_case_repository).items()
+    if isinstance(value, TextClause)
+)
+
+
+def compile_pg(statement):
+    """Compile a statement for PostgreSQL."""
+    return statement.compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.unit
+class TestUpdateIfOwnerStatement:
+    """Test _update_if_owner_statement"""
+
+    def test_columns_bound(self):
+        """Happy path: each updated column and the ownership keys are bound"""
+        compiled = compile_pg(_update_if_owner_statement(["status", "updated_at"], False))
+
+        assert set(compiled.params) == {"status", "updated_at", "case_id", "user_id"}
+        assert "metadata" not in str(compiled)
+
+    def test_metadata_updates_bound(self):
+        """The metadata merge binds :metadata_updates instead of sending it verbatim"""
+        compiled = compile_pg(_update_if_owner_statement(["status"], True))
+
+        assert "metadata_updates" in compiled.params
+        assert ":metadata_updates" not in str(compiled)
+
+    def test_metadata_only(self):
+        """A metadata merge needs no other column"""
+        compiled = compile_pg(_update_if_owner_statement([], True))
+
+        assert set(compiled.params) == {"metadata_updates", "case_id", "user_id"}
+
+
+@pytest.mark.unit
+class TestModuleStatements:
+    """Test the module-level text() statements"""
+
+    @pytest.mark.parametrize("name", MODULE_STATEMENTS)
+    def test_all_params_bound(self, name):
+        """Every :name in the statement compiles to a bind parameter"""
+        statement = getattr(postgresql_hybrid_case_repository, name)
+
+        assert not UNBOUND_PARAM.search(str(compile_pg(statement)))
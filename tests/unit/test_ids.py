@@ -0,0 +1,56 @@
+"""Unit tests for time-ordered identifiers
+
+Verifies the shape and ordering guarantees new_id documents.
+"""
+
+import pytest
+
+from case_service.core import ids
+from case_service.core.ids import new_id
+
+# Column widths from the migrations: cases.case_id and the child ID columns
+CASE_ID_WIDTH = 17
+CHILD_ID_WIDTH = 32
+
+
+@pytest.mark.unit
+class TestNewId:
+    """Test new_id"""
+
+    def test_prefix_and_length(self):
+        """Happy path: prefix followed by 12 ID characters"""
+        case_id = new_id("case_")
+
+        assert case_id.startswith("case_")
+        assert len(case_id) == len("case_") + 12
+
+    def test_alphabet(self):
+        """IDs use lowercase Crockford base32 only"""
+        body = new_id("")
+
+        assert set(body) <= set("0123456789abcdefghjkmnpqrstvwxyz")
+
+    @pytest.mark.parametrize(
+        "prefix,width",
+        [("case_", CASE_ID_WIDTH), ("evidence_", CHILD_ID_WIDTH), ("hypothesis_", CHILD_ID_WIDTH)],
+    )
+    def test_fits_column(self, prefix, width):
+        """IDs for every prefix in use fit their column"""
+        assert len(new_id(prefix)) <= width
+
+    def test_strictly_increasing_and_unique(self):
+        """IDs from one process sort in creation order and never repeat"""
+        generated = [new_id("case_") for _ in range(100_000)]
+
+        assert all(a < b for a, b in zip(generated, generated[1:]))
+        assert len(set(generated)) == len(generated)
+
+    def test_clock_step_back(self, monkeypatch):
+        """A clock that moves backwards still yields increasing IDs"""
+        first = new_id("case_")
+        monkeypatch.setattr(ids.time, "time_ns", lambda: 0)
+
+        second = new_id("case_")
+        third = new_id("case_")
+
+        assert first < second < third
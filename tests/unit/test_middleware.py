@@ -0,0 +1,88 @@
+"""Unit tests for UserIdMiddleware
+
+Runs the middleware in front of a minimal app that echoes the user ID the
+middleware stored in the request scope.
+"""
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from case_service.api.middleware import USER_ID_REQUIRED_DETAIL, UserIdMiddleware
+
+
+def build_client() -> TestClient:
+    """App with a protected route, an exempt health route and an unprotected route."""
+    app = FastAPI()
+    app.add_middleware(UserIdMiddleware)
+
+    @app.get("/api/v1/cases")
+    async def list_cases(request: Request):
+        return {"user_id": request.scope.get("user_id")}
+
+    @app.get("/api/v1/cases/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/api/v1/cases/{case_id}")
+    async def get_case(case_id: str, request: Request):
+        return {"user_id": request.scope.get("user_id")}
+
+    @app.options("/api/v1/cases/{case_id}")
+    async def preflight(case_id: str):
+        return {}
+
+    @app.get("/api/v1/cases-archive")
+    async def archive(request: Request):
+        return {"user_id": request.scope.get("user_id")}
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestUserIdMiddleware:
+    """Test UserIdMiddleware"""
+
+    @pytest.fixture
+    def client(self):
+        return build_client()
+
+    def test_user_id_stored_in_scope(self, client):
+        """Happy path: the header value is published as scope["user_id"]"""
+        response = client.get("/api/v1/cases/case_1", headers={"X-User-ID": "user_1"})
+
+        assert response.status_code == 200
+        assert response.json() == {"user_id": "user_1"}
+
+    @pytest.mark.parametrize("path", ["/api/v1/cases", "/api/v1/cases/case_1"])
+    def test_missing_header_is_unauthorized(self, client, path):
+        """Error case: requests under the prefix without the header get 401"""
+        response = client.get(path)
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": USER_ID_REQUIRED_DETAIL}
+
+    def test_empty_header_is_unauthorized(self, client):
+        """Error case: an empty header counts as missing"""
+        response = client.get("/api/v1/cases/case_1", headers={"X-User-ID": ""})
+
+        assert response.status_code == 401
+
+    def test_health_is_exempt(self, client):
+        """The health check needs no header"""
+        response = client.get("/api/v1/cases/health")
+
+        assert response.status_code == 200
+
+    def test_options_passes_through(self, client):
+        """CORS preflight requests are not checked"""
+        response = client.options("/api/v1/cases/case_1")
+
+        assert response.status_code == 200
+
+    def test_sibling_path_not_matched(self, client):
+        """Paths that only share the prefix's characters are not checked"""
+        response = client.get("/api/v1/cases-archive")
+
+        assert response.status_code == 200
+        assert response.json() == {"user_id": None}
@@ -0,0 +1,151 @@
+"""Unit tests for keyset pagination
+
+Covers the opaque case-list cursors and the in-memory repository's page
+cutting, which must return the same rows whether paged by cursor or offset.
+"""
+
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from fm_core_lib.models import Case, CaseStatus
+
+from case_service.core.pagination import decode_cursor, encode_cursor
+from case_service.infrastructure.persistence import InMemoryCaseRepository
+from case_service.main import app
+
+BASE_TIME = datetime(2025, 10, 16, 12, 0, tzinfo=timezone.utc)
+
+
+def make_case(case_id: str, created_at: datetime) -> Case:
+    """Build a minimal case for pagination tests."""
+    return Case(
+        case_id=case_id,
+        user_id="user_1",
+        organization_id="default",
+        title=f"Case {case_id}",
+        description="",
+        status=CaseStatus.CONSULTING,
+        metadata={},
+        created_at=created_at,
+        updated_at=created_at,
+        last_activity_at=created_at,
+    )
+
+
+def raw_cursor(payload) -> str:
+    """Encode an arbitrary payload the way encode_cursor does."""
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+@pytest.mark.unit
+class TestCursorEncoding:
+    """Test encode_cursor/decode_cursor"""
+
+    def test_round_trip(self):
+        """Happy path: a cursor decodes to the case's (created_at, case_id)"""
+        case = make_case("case_0000000000ab", BASE_TIME)
+
+        assert decode_cursor(encode_cursor(case)) == (BASE_TIME, "case_0000000000ab")
+
+    def test_cursor_is_url_safe(self):
+        """Cursors carry no padding or characters that need URL escaping"""
+        cursor = encode_cursor(make_case("case_0000000000ab", BASE_TIME))
+
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+    def test_naive_datetime_is_utc(self):
+        """A cursor without a UTC offset is read as UTC"""
+        cursor = raw_cursor(["2025-10-16T12:00:00", "case_0000000000ab"])
+
+        created_at, case_id = decode_cursor(cursor)
+
+        assert created_at == BASE_TIME
+        assert created_at.tzinfo is not None
+        assert case_id == "case_0000000000ab"
+
+    @pytest.mark.parametrize(
+        "cursor",
+        [
+            "not-a-cursor",
+            "%%%",
+            raw_cursor(["2025-10-16T12:00:00+00:00"]),
+            raw_cursor(["yesterday", "case_0000000000ab"]),
+            raw_cursor({"created_at": "2025-10-16T12:00:00+00:00"}),
+        ],
+    )
+    def test_malformed_cursor_raises_value_error(self, cursor):
+        """Error case: malformed cursors raise ValueError"""
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+    def test_malformed_cursor_is_bad_request(self):
+        """Error case: the list route answers a malformed cursor with 400"""
+        client = TestClient(app)
+
+        response = client.get(
+            "/api/v1/cases",
+            params={"cursor": "not-a-cursor"},
+            headers={"X-User-ID": "user_1"},
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.unit
+class TestInMemoryPage:
+    """Test InMemoryCaseRepository._page"""
+
+    @pytest.fixture
+    def cases(self):
+        """Seven cases, two pairs of which share a created_at"""
+        created = [0, 1, 1, 2, 3, 3, 4]
+        return [
+            make_case(f"case_{i:012d}", BASE_TIME + timedelta(minutes=minutes))
+            for i, minutes in enumerate(created)
+        ]
+
+    def test_offset_page_order(self, cases):
+        """Pages are ordered by (created_at, case_id) descending"""
+        page, total = InMemoryCaseRepository._page(cases, limit=10, offset=0, after=None)
+
+        expected = sorted(cases, key=lambda c: (c.created_at, c.case_id), reverse=True)
+        assert [c.case_id for c in page] == [c.case_id for c in expected]
+        assert total == len(cases)
+
+    @pytest.mark.parametrize("page_size", [1, 2, 3, 7, 10])
+    def test_cursor_pages_match_offset_pages(self, cases, page_size):
+        """Cursor and offset paging return the same rows, without gaps or repeats"""
+        offset_ids = []
+        for offset in range(0, len(cases), page_size):
+            page, _ = InMemoryCaseRepository._page(cases, page_size, offset, None)
+            offset_ids.extend(c.case_id for c in page)
+
+        cursor_ids = []
+        after = None
+        while True:
+            page, total = InMemoryCaseRepository._page(cases, page_size, 0, after)
+            cursor_ids.extend(c.case_id for c in page)
+            assert total == len(cases)
+            if len(page) < page_size:
+                break
+            after = decode_cursor(encode_cursor(page[-1]))
+
+        assert cursor_ids == offset_ids
+        assert sorted(cursor_ids) == sorted(c.case_id for c in cases)
+
+    def test_cursor_past_last_case(self, cases):
+        """A cursor at the oldest case returns an empty page"""
+        oldest = min(cases, key=lambda c: (c.created_at, c.case_id))
+
+        page, total = InMemoryCaseRepository._page(
+            cases, limit=3, offset=0, after=(oldest.created_at, oldest.case_id)
+        )
+
+        assert page == []
+        assert total == len(cases)
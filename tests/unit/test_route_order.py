@@ -0,0 +1,41 @@
+"""Unit tests for case router path matching
+
+Static paths under /api/v1/cases must reach their own handlers instead of
+being captured by the /{case_id} routes.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from case_service.main import app
+
+HEADERS = {"X-User-ID": "user_1"}
+
+
+@pytest.mark.unit
+class TestStaticRoutes:
+    """Test static routes registered next to /{case_id}"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_list_reports(self, client):
+        """GET /reports reaches list_reports, not get_case"""
+        response = client.get("/api/v1/cases/reports", headers=HEADERS)
+
+        assert response.status_code == 200
+        assert response.json()["reports"] == []
+
+    def test_get_report(self, client):
+        """GET /reports/{report_id} reaches get_report"""
+        response = client.get("/api/v1/cases/reports/rpt_001", headers=HEADERS)
+
+        assert response.status_code == 501
+
+    def test_case_trends(self, client):
+        """GET /analytics/trends reaches get_case_trends"""
+        response = client.get("/api/v1/cases/analytics/trends", params={"days": 7}, headers=HEADERS)
+
+        assert response.status_code == 200
+        assert response.json()["period_days"] == 7